@@ -16,6 +16,7 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import os
 import time
 import bittensor as bt
 
@@ -24,6 +25,18 @@ from oneoneone.base.validator import BaseValidatorNeuron
 
 # Import forward function
 from oneoneone.validator import forward
+from oneoneone.validator.client import ValidatorApiClient
+from oneoneone.validator.review_cache import VerifiedReviewCache
+from oneoneone.validator.trust import TrustTracker
+from oneoneone.validator.near_duplicates import NearDuplicateIndex
+from oneoneone.validator.forward import create_synthetic_task
+from oneoneone.validator.task_queue import SyntheticTaskQueue
+from oneoneone.utils.uids import CoverageScheduler
+from oneoneone.config import (
+    VERIFIED_REVIEW_CACHE_FILE,
+    TRUST_STATE_FILE,
+    NEAR_DUPLICATE_DETECTION,
+)
 
 
 class Validator(BaseValidatorNeuron):
@@ -36,6 +49,35 @@ class Validator(BaseValidatorNeuron):
         super(Validator, self).__init__(config=config)
         bt.logging.info(f"Validator initialized with netuid: {self.config.netuid}")
 
+        # Shared, pooled client for the validator Node.js API
+        self.api_client = ValidatorApiClient(timings=self.timings)
+        bt.logging.info(f"Validator API client: {self.api_client.base_url}")
+
+        # Reviews verified in earlier rounds are not spot checked again until they expire
+        self.review_cache = None
+        if VERIFIED_REVIEW_CACHE_FILE:
+            self.review_cache = VerifiedReviewCache(
+                os.path.join(self.config.neuron.full_path, VERIFIED_REVIEW_CACHE_FILE)
+            )
+            self.review_cache.prune()
+
+        # Per-hotkey verification history, decides how many reviews each miner is spot checked on
+        self.trust = TrustTracker(
+            os.path.join(self.config.neuron.full_path, TRUST_STATE_FILE)
+            if TRUST_STATE_FILE
+            else None
+        )
+        self.trust.load()
+
+        # Near-duplicate index of verified review texts, flags templated and recycled reviews
+        self.near_duplicates = NearDuplicateIndex() if NEAR_DUPLICATE_DETECTION else None
+
+        # Plans miner selections so every available UID is evaluated within a bounded number of rounds
+        self.uid_scheduler = CoverageScheduler()
+
+        # Synthetic tasks are prefetched in the background so rounds never wait on place discovery
+        self.task_queue = SyntheticTaskQueue(lambda: create_synthetic_task(self))
+
         bt.logging.info("Loading validator state...")
         self.load_state()
 
@@ -50,6 +92,19 @@ class Validator(BaseValidatorNeuron):
         """
         return await forward(self)
 
+    async def startup(self):
+        """Starts prefetching synthetic tasks so the first round does not wait for one."""
+        await super().startup()
+        self.task_queue.start()
+
+    async def shutdown(self):
+        """Stops the task producer and closes the API client and the review cache."""
+        await self.task_queue.stop()
+        await self.api_client.close()
+        if self.review_cache is not None:
+            self.review_cache.close()
+        await super().shutdown()
+
 
 # Main execution
 if __name__ == "__main__":
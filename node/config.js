@@ -3,8 +3,18 @@ export default {
     // Synapse timeout configuration
     SYNAPSE_TIMEOUT: 120,        // Timeout for synapse requests in seconds
 
+    // HTTP server keep-alive (seconds), must exceed the Python client's pool keep-alive
+    KEEP_ALIVE_TIMEOUT: 65,
+
     // Spot check configuration
     SPOT_CHECK_COUNT: 3,         // Number of reviews to spot check for validation
+    SPOT_CHECK_BATCH_SIZE: 10,   // Number of miners whose spot checks are batched together in a scoring session
+
+    // Incremental scoring sessions
+    SCORING_SESSION_TTL: 600,    // Seconds an unfinalized scoring session is kept before it is discarded
+
+    // Reference fetch of the newest reviews of the place, started with the scoring session
+    REFERENCE_REVIEW_COUNT: 100, // Newest reviews fetched to verify miner reviews against without URL spot checks
 
     // Synthetic task creation
     MIN_REVIEWS_REQUIRED: 20,    // Minimum number of reviews required for a place to be eligible
@@ -12,6 +22,7 @@ export default {
     // Apify actor names
     APIFY_ACTORS: {
       GOOGLE_MAPS_SEARCH: 'agents/google-maps-search',
+      GOOGLE_MAPS_REVIEWS: 'agents/google-maps-reviews',
       GOOGLE_MAPS_REVIEWS_SPOT_CHECK: 'compass/Google-Maps-Reviews-Scraper'
     },
 
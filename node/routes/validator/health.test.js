@@ -17,7 +17,7 @@ describe('routes/validator/health.js', () => {
       expect(result).toEqual({
         status: 'healthy',
         node: 'validator',
-        endpoints: ['/create-synthetic-task', '/score-responses', '/health'],
+        endpoints: ['/create-synthetic-task', '/score-responses', '/score-session', '/health'],
         config: {
           google_reviews_synapse_params: config.VALIDATOR.GOOGLE_REVIEWS_SYNAPSE_PARAMS
         }
@@ -0,0 +1,216 @@
+import responseService from '#modules/response/index.js';
+import time from '#modules/time/index.js';
+import logger from '#modules/logger/index.js';
+import scoreRoute from '#routes/validator/score.js';
+import {
+  createSession,
+  getSession,
+  submitResponse,
+  verifySession,
+  finalizeSession
+} from '#utils/validator/google-maps/score/scoring-session.js';
+
+/**
+ * Respond with a not found error for an unknown session
+ * @param {import('express').Response} response - The response object
+ * @param {string} sessionId - The requested session ID
+ * @returns {import('express').Response}
+ */
+const sessionNotFound = (response, sessionId) => {
+  return responseService.notFound(response, {
+    error: 'Session not found',
+    message: `Scoring session ${sessionId} does not exist or has expired`
+  });
+}
+
+/**
+ * Start Route
+ * Opens an incremental scoring session for a round.
+ * With `referenceFetch`, the newest reviews of the place are fetched while the miners are queried, so miner
+ * reviews found among them need no URL spot check.
+ *
+ * @example
+ * POST /score-session
+ * {
+ *   "fid": "ChIJN1t_t254w4AR4PVM_67p73Y",
+ *   "minerUIDs": [1, 2, 3],
+ *   "synapseTimeout": 120,
+ *   "referenceFetch": true
+ * }
+ *
+ * @param {import('express').Request} request - The request object
+ * @param {import('express').Response} response - The response object
+ * @returns {Promise<void>}
+ */
+const start = async (request, response) => {
+  const { fid, minerUIDs, synapseTimeout, referenceFetch } = request.body;
+
+  if (!fid || !Array.isArray(minerUIDs)) {
+    return responseService.badRequest(response, {
+      error: 'Invalid request',
+      message: 'fid and minerUIDs array are required'
+    });
+  }
+
+  const session = createSession({ fid, minerUIDs, synapseTimeout, referenceFetch });
+  logger.info(`Scoring session ${session.sessionId} started for fid: ${fid} with ${minerUIDs.length} miners`);
+
+  return responseService.success(response, {
+    status: 'success',
+    sessionId: session.sessionId
+  });
+}
+
+/**
+ * Submit Route
+ * Prepares a single miner response as soon as it arrives and starts spot checks early.
+ * Instead of the full `response`, a `summary` with the review count, the most recent review date
+ * and the reviews sampled for spot checking can be sent. Reviews of the response the validator verified in
+ * earlier rounds can be passed in `verifiedReviews`, they are trusted instead of being spot checked again.
+ * Reviews can also be content hashes referring to the distinct reviews sent in `reviews` by this or an
+ * earlier submission of the session, see resolveReviewRefs. The number of reviews of a full `response` to spot
+ * check can be set per miner with `spotCheckCount`.
+ *
+ * @example
+ * POST /score-session/:sessionId/responses
+ * {
+ *   "minerUID": 1,
+ *   "response": [{ "reviewId": "1234567890", ... }],
+ *   "responseTime": 2.5
+ * }
+ *
+ * @example
+ * POST /score-session/:sessionId/responses
+ * {
+ *   "minerUID": 1,
+ *   "summary": {
+ *     "count": 200,
+ *     "mostRecentDate": "2025-01-01T12:00:00.000Z",
+ *     "spotCheckReviews": [{ "reviewId": "1234567890", ... }]
+ *   },
+ *   "responseTime": 2.5
+ * }
+ *
+ * @param {import('express').Request} request - The request object
+ * @param {import('express').Response} response - The response object
+ * @returns {Promise<void>}
+ */
+const submit = async (request, response) => {
+  const { sessionId } = request.params;
+  const {
+    minerUID,
+    response: minerResponse,
+    summary,
+    responseTime,
+    verifiedReviews,
+    reviews,
+    spotCheckCount
+  } = request.body;
+
+  const session = getSession(sessionId);
+  if (!session) {
+    return sessionNotFound(response, sessionId);
+  }
+
+  if (minerUID === undefined) {
+    return responseService.badRequest(response, {
+      error: 'Invalid request',
+      message: 'minerUID is required'
+    });
+  }
+
+  try {
+    const { passedValidation, validationError, count } = submitResponse(session, {
+      minerUID,
+      response: minerResponse,
+      summary,
+      responseTime,
+      verifiedReviews,
+      reviews,
+      spotCheckCount
+    });
+
+    return responseService.success(response, {
+      status: 'success',
+      minerUID,
+      passedValidation,
+      validationError,
+      count
+    });
+  } catch (error) {
+    logger.error(`Error submitting response of miner ${minerUID} to scoring session ${sessionId}:`, error);
+    return responseService.internalServerError(response, {
+      status: 'error',
+      error: 'Failed to submit response',
+      message: error.message,
+      timestamp: time.getCurrentTimestamp()
+    });
+  }
+}
+
+/**
+ * Finalize Route
+ * Waits for the outstanding spot checks and computes the final scores of the round.
+ * Miners the validator already failed locally can be passed with their reasons in `settled`.
+ * The response has the same shape as POST /score-responses.
+ *
+ * With `verifyOnly`, the speed, volume and recency scores are left to the validator and only
+ * the per-miner verification results are returned.
+ *
+ * Both responses include the reviews newly verified by the session's spot checks in `verifiedReviews`,
+ * so the validator can cache them.
+ *
+ * @example
+ * POST /score-session/:sessionId/finalize
+ * {
+ *   "settled": { "2": "Structural validation failed on review objects" },
+ *   "verifyOnly": false
+ * }
+ *
+ * @param {import('express').Request} request - The request object
+ * @param {import('express').Response} response - The response object
+ * @returns {Promise<void>}
+ */
+const finalize = async (request, response) => {
+  const { sessionId } = request.params;
+  const { settled = {}, verifyOnly = false } = request.body || {};
+
+  const session = getSession(sessionId);
+  if (!session) {
+    return sessionNotFound(response, sessionId);
+  }
+
+  try {
+    if (verifyOnly) {
+      const validationData = await verifySession(session, settled);
+      return responseService.success(response, {
+        status: 'success',
+        fid: session.fid,
+        timestamp: time.getCurrentTimestamp(),
+        verification: validationData.map(({ minerUID, passedValidation, validationError }) => ({
+          minerUID,
+          passedValidation,
+          validationError
+        })),
+        verifiedReviews: session.verifiedReviews
+      });
+    }
+
+    const { scores, meanScore, minScore, maxScore, finalScores } = await finalizeSession(session, settled);
+    const result = scoreRoute.output({ fid: session.fid, scores, minScore, maxScore, meanScore, finalScores });
+    return responseService.success(response, { ...result, verifiedReviews: session.verifiedReviews });
+  } catch (error) {
+    logger.error(`Error finalizing scoring session ${sessionId}:`, error);
+    return responseService.internalServerError(response, {
+      error: 'Failed to finalize scoring session',
+      message: error.message,
+      timestamp: time.getCurrentTimestamp()
+    });
+  }
+}
+
+export default {
+  start,
+  submit,
+  finalize
+}
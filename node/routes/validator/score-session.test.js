@@ -0,0 +1,222 @@
+import scoreSessionRoute from './score-session.js';
+import responseService from '#modules/response/index.js';
+import time from '#modules/time/index.js';
+import {
+  createSession,
+  getSession,
+  submitResponse,
+  verifySession,
+  finalizeSession
+} from '#utils/validator/google-maps/score/scoring-session.js';
+
+jest.mock('#modules/time/index.js');
+jest.mock('#utils/validator/google-maps/score/scoring-session.js', () => ({
+  createSession: jest.fn(),
+  getSession: jest.fn(),
+  submitResponse: jest.fn(),
+  verifySession: jest.fn(),
+  finalizeSession: jest.fn(),
+}));
+jest.mock('#modules/response/index.js', () => ({
+  success: jest.fn(),
+  internalServerError: jest.fn(),
+  badRequest: jest.fn(),
+  notFound: jest.fn(),
+}));
+jest.mock('#modules/logger/index.js', () => ({
+  info: jest.fn(),
+  error: jest.fn(),
+}));
+
+describe('routes/validator/score-session.js', () => {
+  let timestamp;
+  let request;
+  let response;
+  let session;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+
+    timestamp = '2021-01-01T00:00:00.000Z';
+    time.getCurrentTimestamp.mockReturnValue(timestamp);
+
+    response = {
+      status: jest.fn(),
+      json: jest.fn(),
+    };
+    session = { sessionId: 'session', fid: 'fid', verifiedReviews: [{ reviewId: 'review-1' }] };
+    createSession.mockReturnValue(session);
+    getSession.mockReturnValue(session);
+  });
+
+  describe('.start()', () => {
+    test('should return a badRequest if the request is invalid', async () => {
+      request = { body: { fid: 'fid' } };
+      await scoreSessionRoute.start(request, response);
+      expect(responseService.badRequest).toHaveBeenCalledWith(response, {
+        error: 'Invalid request',
+        message: 'fid and minerUIDs array are required'
+      });
+      expect(createSession).not.toHaveBeenCalled();
+    });
+
+    test('should pass the reference fetch option to the session', async () => {
+      request = { body: { fid: 'fid', minerUIDs: [1], referenceFetch: true } };
+      await scoreSessionRoute.start(request, response);
+      expect(createSession).toHaveBeenCalledWith(expect.objectContaining({ referenceFetch: true }));
+    });
+
+    test('should create a session', async () => {
+      request = { body: { fid: 'fid', minerUIDs: [1, 2], synapseTimeout: 120 } };
+      await scoreSessionRoute.start(request, response);
+      expect(createSession).toHaveBeenCalledWith({ fid: 'fid', minerUIDs: [1, 2], synapseTimeout: 120 });
+      expect(responseService.success).toHaveBeenCalledWith(response, {
+        status: 'success',
+        sessionId: 'session'
+      });
+    });
+  });
+
+  describe('.submit()', () => {
+    beforeEach(() => {
+      request = {
+        params: { sessionId: 'session' },
+        body: { minerUID: 1, response: [{}], responseTime: 5 }
+      };
+      submitResponse.mockReturnValue({ passedValidation: true, validationError: undefined, count: 1 });
+    });
+
+    test('should return notFound for an unknown session', async () => {
+      getSession.mockReturnValue(undefined);
+      await scoreSessionRoute.submit(request, response);
+      expect(responseService.notFound).toHaveBeenCalledWith(response, {
+        error: 'Session not found',
+        message: 'Scoring session session does not exist or has expired'
+      });
+    });
+
+    test('should return a badRequest if the miner UID is missing', async () => {
+      request.body.minerUID = undefined;
+      await scoreSessionRoute.submit(request, response);
+      expect(responseService.badRequest).toHaveBeenCalledWith(response, {
+        error: 'Invalid request',
+        message: 'minerUID is required'
+      });
+    });
+
+    test('should pass the reviews verified in earlier rounds to the session', async () => {
+      request.body.verifiedReviews = [{ reviewId: 'review-1' }];
+      await scoreSessionRoute.submit(request, response);
+      expect(submitResponse).toHaveBeenCalledWith(session, expect.objectContaining({
+        verifiedReviews: [{ reviewId: 'review-1' }]
+      }));
+    });
+
+    test('should pass the spot check count chosen by the validator to the session', async () => {
+      request.body.spotCheckCount = 1;
+      await scoreSessionRoute.submit(request, response);
+      expect(submitResponse).toHaveBeenCalledWith(session, expect.objectContaining({ spotCheckCount: 1 }));
+    });
+
+    test('should submit the response to the session', async () => {
+      await scoreSessionRoute.submit(request, response);
+      expect(submitResponse).toHaveBeenCalledWith(session, { minerUID: 1, response: [{}], responseTime: 5 });
+      expect(responseService.success).toHaveBeenCalledWith(response, {
+        status: 'success',
+        minerUID: 1,
+        passedValidation: true,
+        validationError: undefined,
+        count: 1
+      });
+    });
+
+    test('should return a internalServerError if the submission fails', async () => {
+      submitResponse.mockImplementation(() => {
+        throw new Error('Submission failed');
+      });
+      await scoreSessionRoute.submit(request, response);
+      expect(responseService.internalServerError).toHaveBeenCalledWith(response, {
+        status: 'error',
+        error: 'Failed to submit response',
+        message: 'Submission failed',
+        timestamp
+      });
+    });
+  });
+
+  describe('.finalize()', () => {
+    beforeEach(() => {
+      request = { params: { sessionId: 'session' }, body: {} };
+    });
+
+    test('should return notFound for an unknown session', async () => {
+      getSession.mockReturnValue(undefined);
+      await scoreSessionRoute.finalize(request, response);
+      expect(responseService.notFound).toHaveBeenCalled();
+      expect(finalizeSession).not.toHaveBeenCalled();
+    });
+
+    test('should return the final scores', async () => {
+      finalizeSession.mockResolvedValue({
+        scores: [1],
+        meanScore: 1,
+        minScore: 1,
+        maxScore: 1,
+        finalScores: [{ minerUID: 1 }]
+      });
+      await scoreSessionRoute.finalize(request, response);
+      expect(responseService.success).toHaveBeenCalledWith(response, {
+        status: 'success',
+        fid: 'fid',
+        scores: [1],
+        statistics: {
+          count: 1,
+          mean: 1,
+          min: 1,
+          max: 1
+        },
+        timestamp,
+        detailedResults: [{ minerUID: 1 }],
+        verifiedReviews: [{ reviewId: 'review-1' }]
+      });
+    });
+
+    test('should pass the settled miners to the session', async () => {
+      request.body = { settled: { 2: 'Response is empty' } };
+      finalizeSession.mockResolvedValue({ scores: [], meanScore: 0, minScore: 0, maxScore: 0, finalScores: [] });
+      await scoreSessionRoute.finalize(request, response);
+      expect(finalizeSession).toHaveBeenCalledWith(expect.anything(), { 2: 'Response is empty' });
+    });
+
+    test('should only return the verification results with verifyOnly', async () => {
+      request.body = { verifyOnly: true };
+      verifySession.mockResolvedValue([
+        { minerUID: 1, passedValidation: true, count: 10, data: [{}] },
+        { minerUID: 2, passedValidation: false, validationError: 'Failed spot check verification', count: 0, data: [] }
+      ]);
+      await scoreSessionRoute.finalize(request, response);
+      expect(finalizeSession).not.toHaveBeenCalled();
+      expect(verifySession).toHaveBeenCalledWith(session, {});
+      expect(responseService.success).toHaveBeenCalledWith(response, {
+        status: 'success',
+        fid: 'fid',
+        timestamp,
+        verification: [
+          { minerUID: 1, passedValidation: true, validationError: undefined },
+          { minerUID: 2, passedValidation: false, validationError: 'Failed spot check verification' }
+        ],
+        verifiedReviews: [{ reviewId: 'review-1' }]
+      });
+    });
+
+    test('should return a internalServerError if the finalization fails', async () => {
+      finalizeSession.mockRejectedValue(new Error('Finalization failed'));
+      await scoreSessionRoute.finalize(request, response);
+      expect(responseService.internalServerError).toHaveBeenCalledWith(response, {
+        error: 'Failed to finalize scoring session',
+        message: 'Finalization failed',
+        timestamp
+      });
+    });
+  });
+});
@@ -4,7 +4,8 @@ import logger from '#modules/logger/index.js';
 import performBatchSpotCheck from '#utils/validator/google-maps/score/perform-batch-spot-check.js';
 import validateMinerAgainstBatch from '#utils/validator/google-maps/score/validate-miner-against-batch.js';
 import calculateFinalScores from '#utils/validator/google-maps/score/calculate-final-scores.js';
-import { prepareResponses } from '#utils/validator/google-maps/score/prepare-responses.js';
+import { prepareResponses, prepareSummaries } from '#utils/validator/google-maps/score/prepare-responses.js';
+import { resolveReviewRefs, resolveSummaryRefs } from '#utils/validator/google-maps/score/resolve-review-refs.js';
 
 /**
  * Output the result of the score route
@@ -30,16 +31,15 @@ const output = ({ fid, scores, minScore, maxScore, meanScore, finalScores }) =>
 /**
  * Validate the request
  * Validate if fid exist
- * Validate if responses is an array
- * Validate if responses is not empty
+ * Validate if responses (or summaries) is an array
  * @param {Object} param0 - The parameters
  * @returns {Object} - The output
  */
-const validate = ({ fid, responses }) => {
+const validate = ({ fid, responses, summaries }) => {
   let isValid = true
   let message = {};
    // Validate required parameters
-   if (!fid || !responses || !Array.isArray(responses)) {
+   if (!fid || !Array.isArray(summaries || responses)) {
     isValid = false;
     message = {
       error: 'Invalid request',
@@ -83,6 +83,40 @@ const validate = ({ fid, responses }) => {
  *   "minerUIDs": [1]
  * }
  *
+ * Instead of `responses`, per-miner `summaries` can be sent, see prepareSummaries:
+ *
+ * @example
+ * POST /score-responses
+ * {
+ *   "fid": "ChIJN1t_t254w4AR4PVM_67p73Y",
+ *   "summaries": [
+ *     {
+ *       "count": 200,
+ *       "mostRecentDate": "2025-01-01T12:00:00.000Z",
+ *       "spotCheckReviews": [{ "reviewId": "1234567890", ... }]
+ *     }
+ *   ],
+ *   "responseTimes": [2.5],
+ *   "synapseTimeout": 120,
+ *   "minerUIDs": [1]
+ * }
+ *
+ * The number of reviews of each response to spot check can be set per miner in `spotCheckCounts`.
+ *
+ * Reviews inside `responses` or `summaries[].spotCheckReviews` can be content hashes referring to
+ * the distinct reviews sent once in `reviews`, see resolveReviewRefs:
+ *
+ * @example
+ * POST /score-responses
+ * {
+ *   "fid": "ChIJN1t_t254w4AR4PVM_67p73Y",
+ *   "responses": [["3f2a9c..."], ["3f2a9c..."]],
+ *   "reviews": { "3f2a9c...": { "reviewId": "1234567890", ... } },
+ *   "responseTimes": [2.5, 3.1],
+ *   "synapseTimeout": 120,
+ *   "minerUIDs": [1, 2]
+ * }
+ *
  * @param {import('express').Request} request - The request object
  * @param {import('express').Response} response - The response object
  * @returns {Promise<void>}
@@ -92,25 +126,31 @@ const execute = async(request, response) => {
     const {
       fid,
       responses,
+      summaries,
+      reviews = {},
+      spotCheckCounts = [],
       responseTimes = [],
       synapseTimeout = 120,
       minerUIDs = []
     } = request.body;
 
     // Validate the request
-    const { isValid, message } = validate({ fid, responses });
+    const { isValid, message } = validate({ fid, responses, summaries });
     if (!isValid) {
       return responseService.badRequest(response, message);
     }
 
     // Log the request and important information
-    logger.info(`Scoring ${responses.length} responses for fid: ${fid}`);
+    logger.info(`Scoring ${(summaries || responses).length} ${summaries ? 'summaries' : 'responses'} for fid: ${fid}`);
     logger.info(`Response times provided: ${responseTimes.length > 0 ? 'Yes' : 'No'}`);
     logger.info(`Synapse timeout: ${synapseTimeout} seconds`);
     logger.info(`Miner UIDs: [${minerUIDs.join(', ')}]`);
 
     // Phase 1: Process all responses and collect spot check reviews
-    const { validationData, allSpotCheckReviews } = prepareResponses(responses, minerUIDs, fid);
+    const reviewsMap = new Map(Object.entries(reviews));
+    const { validationData, allSpotCheckReviews } = summaries
+      ? prepareSummaries(summaries.map(summary => resolveSummaryRefs(summary, reviewsMap)), minerUIDs, fid)
+      : prepareResponses(responses.map(entries => resolveReviewRefs(entries, reviewsMap)), minerUIDs, fid, spotCheckCounts);
 
     // Phase 2: Batch spot check if we have any reviews to check
     let verifiedReviewsMap = new Map();
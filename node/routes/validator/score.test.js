@@ -1,7 +1,7 @@
 import scoreRoute from './score.js';
 import responseService from '#modules/response/index.js';
 import time from '#modules/time/index.js';
-import { prepareResponses } from '#utils/validator/google-maps/score/prepare-responses.js';
+import { prepareResponses, prepareSummaries } from '#utils/validator/google-maps/score/prepare-responses.js';
 import calculateFinalScores from '#utils/validator/google-maps/score/calculate-final-scores.js';
 import performBatchSpotCheck from '#utils/validator/google-maps/score/perform-batch-spot-check.js';
 import validateMinerAgainstBatch from '#utils/validator/google-maps/score/validate-miner-against-batch.js';
@@ -9,6 +9,7 @@ import validateMinerAgainstBatch from '#utils/validator/google-maps/score/valida
 jest.mock('#modules/time/index.js');
 jest.mock('#utils/validator/google-maps/score/prepare-responses.js', () => ({
   prepareResponses: jest.fn(),
+  prepareSummaries: jest.fn(),
   getReviewsForSpotCheck: jest.fn(),
 }));
 jest.mock('#utils/validator/google-maps/score/calculate-final-scores.js');
@@ -112,6 +113,13 @@ describe('routes/validator/score.js', () => {
       expect(isValid).toBe(true);
       expect(message).toEqual({})
     });
+
+    test('should pass if summaries is an array and if fid exists', () => {
+      const { isValid, message } = scoreRoute.validate({ fid: "fid", summaries: [] });
+
+      expect(isValid).toBe(true);
+      expect(message).toEqual({})
+    });
   });
 
   describe('.execute()', () => {
@@ -188,6 +196,38 @@ describe('routes/validator/score.js', () => {
       });
     });
 
+    test('should prepare summaries instead of responses when provided', async () => {
+      const summaries = [{ count: 10, mostRecentDate: timestamp, spotCheckReviews: [] }];
+      request.body = { ...request.body, responses: undefined, summaries, minerUIDs: [1] };
+      prepareSummaries.mockReturnValue({
+        validationData: [],
+        allSpotCheckReviews: []
+      });
+
+      await scoreRoute.execute(request, response);
+
+      expect(prepareSummaries).toHaveBeenCalledWith(summaries, [1], "fid");
+      expect(prepareResponses).not.toHaveBeenCalled();
+      expect(responseService.success).toHaveBeenCalled();
+    });
+
+    test('should resolve review references against the distinct reviews', async () => {
+      const review = { reviewId: '1' };
+      request.body = { ...request.body, responses: [['hash-1'], ['hash-1', { reviewId: '2' }]], reviews: { 'hash-1': review }, minerUIDs: [1, 2] };
+
+      await scoreRoute.execute(request, response);
+
+      expect(prepareResponses).toHaveBeenCalledWith([[review], [review, { reviewId: '2' }]], [1, 2], "fid", []);
+    });
+
+    test('should pass the per-miner spot check counts', async () => {
+      request.body = { ...request.body, responses: [[]], spotCheckCounts: [1], minerUIDs: [1] };
+
+      await scoreRoute.execute(request, response);
+
+      expect(prepareResponses).toHaveBeenCalledWith([[]], [1], "fid", [1]);
+    });
+
     test('should return a success if the execution succeeds', async () => {
       request.body.responseTimes = [100, 200, 300];
       prepareResponses.mockReturnValue({
@@ -0,0 +1,44 @@
+import logger from '#modules/logger/index.js';
+import time from '#modules/time/index.js';
+import apify from '#modules/apify/index.js';
+import config from '#config';
+
+/**
+ * Fetch a reference snapshot of the newest reviews of a place, to verify miner reviews against locally.
+ * It is started when a scoring session opens, so it runs while the miners are still scraping the same place.
+ * Reviews are returned in the shape of spot check results: the spot check actor reports the last edit date as
+ * publishedAtDate, and validateMinerAgainstBatch compares it with the miner's lastEditedAtDate.
+ * Reviews without a last edit date cannot be compared and are left out, so they are spot checked by URL.
+ * A failed fetch is logged and yields an empty snapshot, every review is then spot checked by URL as before.
+ *
+ * @param {string} fid - The FID (Facility ID) of the place in Google Maps
+ * @param {number} [count=config.VALIDATOR.REFERENCE_REVIEW_COUNT] - Number of newest reviews to fetch
+ * @returns {Promise<Map<string, Object>>} - The reference reviews keyed by review ID
+ */
+const fetchReferenceReviews = async (fid, count = config.VALIDATOR.REFERENCE_REVIEW_COUNT) => {
+  const startTime = Date.now();
+
+  try {
+    const items = await apify.runActorAndGetResults(config.VALIDATOR.APIFY_ACTORS.GOOGLE_MAPS_REVIEWS, {
+      placeFIDs: [fid],
+      maxItems: count,
+      language: config.VALIDATOR.GOOGLE_REVIEWS_SYNAPSE_PARAMS.language,
+      sort: config.VALIDATOR.GOOGLE_REVIEWS_SYNAPSE_PARAMS.sort
+    });
+
+    const referenceReviews = new Map();
+    for (const review of items) {
+      if (review.reviewId && review.lastEditedAtDate) {
+        referenceReviews.set(review.reviewId, { ...review, publishedAtDate: review.lastEditedAtDate });
+      }
+    }
+
+    logger.info(`Reference fetch: ${referenceReviews.size} reviews for fid: ${fid} in ${time.getDuration(startTime).toFixed(2)}s`);
+    return referenceReviews;
+  } catch (error) {
+    logger.error(`Reference fetch failed for fid: ${fid} (took ${time.getDuration(startTime).toFixed(2)}s):`, error);
+    return new Map();
+  }
+}
+
+export default fetchReferenceReviews
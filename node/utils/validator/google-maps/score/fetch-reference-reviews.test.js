@@ -0,0 +1,57 @@
+import fetchReferenceReviews from './fetch-reference-reviews.js';
+import apify from '#modules/apify/index.js';
+import logger from '#modules/logger/index.js';
+import config from '#config';
+
+jest.mock('#modules/logger/index.js', () => ({
+  info: jest.fn(),
+  error: jest.fn(),
+}));
+
+jest.mock('#modules/time/index.js', () => ({
+  getDuration: jest.fn().mockReturnValue(0)
+}));
+
+jest.mock('#modules/apify/index.js');
+
+describe('#utils/validator/google-maps/score/fetch-reference-reviews.js', () => {
+  const fid = 'fid';
+
+  beforeEach(() => {
+    apify.runActorAndGetResults.mockResolvedValue([
+      { reviewId: 'review-1', publishedAtDate: '2024-03-01T10:00:00.000Z', lastEditedAtDate: '2024-03-02T10:00:00.000Z' },
+      { reviewId: 'review-2', publishedAtDate: '2024-03-01T10:00:00.000Z' },
+      { lastEditedAtDate: '2024-03-02T10:00:00.000Z' }
+    ]);
+  });
+
+  test('should fetch the newest reviews of the place', async () => {
+    await fetchReferenceReviews(fid, 50);
+    expect(apify.runActorAndGetResults).toHaveBeenCalledWith(
+      config.VALIDATOR.APIFY_ACTORS.GOOGLE_MAPS_REVIEWS, {
+        placeFIDs: [fid],
+        maxItems: 50,
+        language: config.VALIDATOR.GOOGLE_REVIEWS_SYNAPSE_PARAMS.language,
+        sort: config.VALIDATOR.GOOGLE_REVIEWS_SYNAPSE_PARAMS.sort
+      }
+    );
+  });
+
+  test('should return the comparable reviews in the shape of spot check results', async () => {
+    const referenceReviews = await fetchReferenceReviews(fid);
+    expect(apify.runActorAndGetResults).toHaveBeenCalledWith(
+      config.VALIDATOR.APIFY_ACTORS.GOOGLE_MAPS_REVIEWS,
+      expect.objectContaining({ maxItems: config.VALIDATOR.REFERENCE_REVIEW_COUNT })
+    );
+    expect(referenceReviews).toEqual(new Map([
+      ['review-1', { reviewId: 'review-1', publishedAtDate: '2024-03-02T10:00:00.000Z', lastEditedAtDate: '2024-03-02T10:00:00.000Z' }]
+    ]));
+  });
+
+  test('should return an empty snapshot if the fetch fails', async () => {
+    apify.runActorAndGetResults.mockRejectedValue(new Error('Error'));
+    const referenceReviews = await fetchReferenceReviews(fid);
+    expect(referenceReviews).toEqual(new Map());
+    expect(logger.error).toHaveBeenCalled();
+  });
+});
@@ -10,21 +10,26 @@ import config from '#config';
  *
  * @param {Array} allSelectedReviews - Array of objects containing miner information and their reviews. Each object has format {minerUID: string, reviews: Array<{reviewUrl: string, ...}>}
  * @param {string} fid - The FID (Facility ID) of the place in Google Maps to verify reviews against
+ * @param {Map<string, Object>} knownReviews - Reviews the validator already verified in earlier rounds, keyed by review ID; these are not verified again
  * @returns {Promise<Object>} - Returns a Map where keys are review IDs and values are verification results containing details about whether the review exists and matches the submitted data
  */
-const performBatchSpotCheck = async (allSelectedReviews, fid) => {
+const performBatchSpotCheck = async (allSelectedReviews, fid, knownReviews = new Map()) => {
   const startTime = Date.now();
 
   try {
-    // Collect all unique URLs from all miners
-    const startUrls = allSelectedReviews
-      .flatMap(selectedReview => selectedReview.reviews.map(review => ({
-        url: review.reviewUrl,
-        method: "GET"
-      }))
-    );
-
-    logger.info(`Batch spot check: Verifying ${startUrls.length} reviews from ${allSelectedReviews.length} miners for fid: ${fid}`);
+    // Collect all unique URLs from all miners, a review selected by several miners is verified once
+    const startUrls = [...new Map(allSelectedReviews
+      .flatMap(selectedReview => selectedReview.reviews)
+      .filter(review => !knownReviews.has(review.reviewId))
+      .map(review => [review.reviewUrl, { url: review.reviewUrl, method: "GET" }])
+    ).values()];
+
+    logger.info(`Batch spot check: Verifying ${startUrls.length} reviews from ${allSelectedReviews.length} miners for fid: ${fid} (${knownReviews.size} already verified)`);
+
+    // Nothing left to verify, every selected review was verified before
+    if (startUrls.length === 0) {
+      return new Map();
+    }
 
     // Make one batch call to Apify with all URLs
     const results = await apify.runActorAndGetResults(
@@ -48,4 +48,31 @@ describe('#utils/validator/google-maps/score/perform-batch-spot-check.js', () =>
     const reviews = result.get("reviewId");
     expect(reviews).toEqual({ reviewId: "reviewId" });
   });
+
+  test('should verify a review selected by several miners once', async () => {
+    responses.push({ minerUID: 2, reviews: [{ reviewUrl: "reviewUrl" }] });
+    await performBatchSpotCheck(responses, fid);
+    expect(apify.runActorAndGetResults).toHaveBeenCalledWith(
+      config.VALIDATOR.APIFY_ACTORS.GOOGLE_MAPS_REVIEWS_SPOT_CHECK, {
+        startUrls: [{ url: "reviewUrl", method: "GET" }]
+      }
+    );
+  });
+
+  test('should skip reviews that were already verified', async () => {
+    responses[0].reviews.push({ reviewId: "known", reviewUrl: "knownUrl" });
+    await performBatchSpotCheck(responses, fid, new Map([["known", { reviewId: "known" }]]));
+    expect(apify.runActorAndGetResults).toHaveBeenCalledWith(
+      config.VALIDATOR.APIFY_ACTORS.GOOGLE_MAPS_REVIEWS_SPOT_CHECK, {
+        startUrls: [{ url: "reviewUrl", method: "GET" }]
+      }
+    );
+  });
+
+  test('should not call the actor when every review was already verified', async () => {
+    responses[0].reviews[0].reviewId = "known";
+    const result = await performBatchSpotCheck(responses, fid, new Map([["known", { reviewId: "known" }]]));
+    expect(apify.runActorAndGetResults).not.toHaveBeenCalled();
+    expect(result.size).toBe(0);
+  });
 });
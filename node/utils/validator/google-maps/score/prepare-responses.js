@@ -4,6 +4,25 @@ import checkResponseValidity from '#utils/validator/check-response-validity.js';
 import generateValidationData from '#utils/validator/validation-data.js';
 import array from '#modules/array/index.js';
 
+/**
+ * Required review fields and their types, including the match against the queried fid
+ * @param {string} fid - Facility ID that should match across all reviews
+ * @returns {Array<{name: string, type: string, validate?: Function}>} - The field definitions for array.validateArray
+ */
+const getRequiredFields = (fid) => [
+  { name: 'reviewerId', type: 'string' },
+  { name: 'reviewerUrl', type: 'string' },
+  { name: 'reviewerName', type: 'string' },
+  { name: 'reviewId', type: 'string' },
+  { name: 'reviewUrl', type: 'string' },
+  { name: 'publishedAtDate', type: 'string' },
+  { name: 'placeId', type: 'string' },
+  { name: 'cid', type: 'string' },
+  { name: 'fid', type: 'string' },
+  { name: 'totalScore', type: 'number' },
+  { name: 'fid', type: 'string', validate: (value) => value === fid }
+];
+
 /**
  * Selects a subset of reviews for spot checking, including the most recent review and random samples.
  * The function ensures that the most recent review is always included in the selection, and the remaining
@@ -14,11 +33,13 @@ import array from '#modules/array/index.js';
  * @param {string} reviews[].publishedAtDate - ISO date string of when the review was published
  * @param {string} fid - Facility ID associated with the reviews
  * @param {string|number} minerUID - Unique identifier for the miner, used for logging purposes
+ * @param {number} [spotCheckCount=config.VALIDATOR.SPOT_CHECK_COUNT] - Number of reviews to select, the validator
+ *                                                                     can lower or raise it per miner
  *
  * @returns {Object} An object containing the selected reviews and most recent date
  * @returns {Date|undefined} .mostRecentDate - Date object of the most recent review, or undefined if no reviews
  * @returns {Array<Object>} .selectedReviews - Array of selected review objects for spot checking
- *                                             Contains at most config.VALIDATOR.SPOT_CHECK_COUNT reviews,
+ *                                             Contains at most spotCheckCount reviews,
  *                                             always including the most recent review if available
  *
  * @example
@@ -28,7 +49,7 @@ import array from '#modules/array/index.js';
  * ], 'facility123', 'miner456');
  * // Returns { mostRecentDate: Date('2024-03-20'), selectedReviews: [...] }
  */
-const getReviewsForSpotCheck = (reviews, fid, minerUID) => {
+const getReviewsForSpotCheck = (reviews, fid, minerUID, spotCheckCount = config.VALIDATOR.SPOT_CHECK_COUNT) => {
   // Early return if no reviews
   if (!reviews?.length) {
     return {
@@ -38,8 +59,8 @@ const getReviewsForSpotCheck = (reviews, fid, minerUID) => {
   };
 
   // Early return if no spot check count
-  const spotCheckCount = Math.min(config.VALIDATOR.SPOT_CHECK_COUNT, reviews.length);
-  if (spotCheckCount === 0) {
+  const selectedCount = Math.min(spotCheckCount, reviews.length);
+  if (selectedCount === 0) {
     return {
       mostRecentDate: undefined,
       selectedReviews: []
@@ -63,7 +84,7 @@ const getReviewsForSpotCheck = (reviews, fid, minerUID) => {
   );
 
   // If we only need one review, return just the most recent
-  if (spotCheckCount === 1) {
+  if (selectedCount === 1) {
     return {
       mostRecentDate,
       selectedReviews: [mostRecentReview]
@@ -76,7 +97,7 @@ const getReviewsForSpotCheck = (reviews, fid, minerUID) => {
   // Select random reviews with the number of spot check count - 1
   const randomReviews = remainingReviews
     .sort(() => Math.random() - 0.5)  // Fisher-Yates shuffle in place
-    .slice(0, spotCheckCount - 1);
+    .slice(0, selectedCount - 1);
 
   // Log random selections for spot check
   for (const review of randomReviews) {
@@ -99,6 +120,8 @@ const getReviewsForSpotCheck = (reviews, fid, minerUID) => {
  *                                          contains review objects
  * @param {Array<string|number>} minerUIDs - Array of miner unique identifiers corresponding to each response
  * @param {string} fid - Facility ID that should match across all reviews
+ * @param {Array<number>} [spotCheckCounts=[]] - Number of reviews to spot check per miner, defaults to
+ *                                               config.VALIDATOR.SPOT_CHECK_COUNT for missing entries
  *
  * @returns {Object} An object containing validation results and selected reviews for spot checking
  * @returns {Array<Object>} .validationData - Array of validation results for each miner
@@ -147,7 +170,7 @@ const getReviewsForSpotCheck = (reviews, fid, minerUID) => {
  * //   }]
  * // }
  */
-const prepareResponses = (responses, minerUIDs, fid) => {
+const prepareResponses = (responses, minerUIDs, fid, spotCheckCounts = []) => {
   const validationData = [];
   const allSpotCheckReviews = [];
 
@@ -169,22 +192,7 @@ const prepareResponses = (responses, minerUIDs, fid) => {
     logger.info(`UID ${minerUID}: Data cleaning - ${response.length} reviews -> ${uniqueReviews.length} unique reviews`);
 
     // Structural Validation - Check required fields and types
-    const requiredFields = [
-      { name: 'reviewerId', type: 'string' },
-      { name: 'reviewerUrl', type: 'string' },
-      { name: 'reviewerName', type: 'string' },
-      { name: 'reviewId', type: 'string' },
-      { name: 'reviewUrl', type: 'string' },
-      { name: 'publishedAtDate', type: 'string' },
-      { name: 'placeId', type: 'string' },
-      { name: 'cid', type: 'string' },
-      { name: 'fid', type: 'string' },
-      { name: 'totalScore', type: 'number' },
-      { name: 'fid', type: 'string', validate: (value) => value === fid }
-    ];
-
-    // Validate the reviews
-    const { valid: validReviews, invalid } = array.validateArray(uniqueReviews, requiredFields);
+    const { valid: validReviews, invalid } = array.validateArray(uniqueReviews, getRequiredFields(fid));
 
     // If there are invalid reviews, add them to the miner validation data
     if (invalid.length > 0) {
@@ -200,7 +208,7 @@ const prepareResponses = (responses, minerUIDs, fid) => {
     // Calculate metrics for this miner
     const count = validReviews.length;
 
-    const { mostRecentDate, selectedReviews } = getReviewsForSpotCheck(validReviews, fid, minerUID);
+    const { mostRecentDate, selectedReviews } = getReviewsForSpotCheck(validReviews, fid, minerUID, spotCheckCounts[index]);
 
     // Store validation data and selected reviews for batch processing
     validationData.push(
@@ -228,7 +236,81 @@ const prepareResponses = (responses, minerUIDs, fid) => {
   }
 }
 
+/**
+ * Processes per-miner response summaries sent instead of full responses. The validator already
+ * deduplicated and validated each response and sampled its spot check reviews, so only the sampled
+ * reviews are checked structurally here.
+ *
+ * @param {Array<Object>} summaries - Array of response summaries from different miners
+ * @param {number} summaries[].count - Number of unique reviews in the miner response
+ * @param {string} summaries[].mostRecentDate - ISO date string of the most recent review
+ * @param {Array<Object>} summaries[].spotCheckReviews - The reviews sampled for spot checking,
+ *                                                       most recent first
+ * @param {Array<string|number>} minerUIDs - Array of miner unique identifiers corresponding to each summary
+ * @param {string} fid - Facility ID that should match across all reviews
+ *
+ * @returns {Object} The same shape as prepareResponses: validationData and allSpotCheckReviews
+ */
+const prepareSummaries = (summaries, minerUIDs, fid) => {
+  const validationData = [];
+  const allSpotCheckReviews = [];
+
+  for (const [index, summary] of summaries.entries()) {
+    const minerUID = minerUIDs[index] || index;
+    const { count, mostRecentDate, spotCheckReviews } = summary || {};
+
+    // Check if the sampled reviews are valid
+    const { isValid, validationError } = checkResponseValidity(spotCheckReviews, minerUID);
+    if (!isValid) {
+      validationData.push({
+        ...generateValidationData({ minerUID }),
+        validationError
+      });
+      continue;
+    }
+
+    if (!Number.isInteger(count) || count < spotCheckReviews.length) {
+      validationData.push({
+        ...generateValidationData({ minerUID }),
+        validationError: 'Invalid response summary'
+      });
+      continue;
+    }
+
+    const { invalid } = array.validateArray(spotCheckReviews, getRequiredFields(fid));
+    if (invalid.length > 0) {
+      validationData.push({
+        ...generateValidationData({ minerUID }),
+        validationError: 'Structural validation failed on review objects',
+      });
+      continue;
+    }
+
+    logger.info(`UID ${minerUID}: Summary received - ${count} reviews, ${spotCheckReviews.length} sampled for spot check`);
+
+    validationData.push(
+      generateValidationData({
+        minerUID,
+        count,
+        mostRecentDate: mostRecentDate ? new Date(mostRecentDate) : undefined,
+        data: spotCheckReviews,
+        passedValidation: true
+      })
+    );
+    allSpotCheckReviews.push({
+      minerUID,
+      reviews: spotCheckReviews
+    });
+  }
+
+  return {
+    validationData,
+    allSpotCheckReviews
+  }
+}
+
 export {
   prepareResponses,
+  prepareSummaries,
   getReviewsForSpotCheck
 }
@@ -3,7 +3,7 @@ import config from '#config';
 import checkResponseValidity from '#utils/validator/check-response-validity.js';
 import generateValidationData from '#utils/validator/validation-data.js';
 import array from '#modules/array/index.js';
-import { prepareResponses, getReviewsForSpotCheck } from './prepare-responses.js';
+import { prepareResponses, prepareSummaries, getReviewsForSpotCheck } from './prepare-responses.js';
 
 jest.mock('#modules/logger/index.js', () => ({
   info: jest.fn(),
@@ -44,6 +44,17 @@ describe('#utils/validator/google-maps/score/prepare-responses.js', () => {
       });
     });
 
+    test('should select the given number of reviews', () => {
+      const reviews = [
+        { reviewId: '1', publishedAtDate: '2024-03-20' },
+        { reviewId: '2', publishedAtDate: '2024-03-19' },
+        { reviewId: '3', publishedAtDate: '2024-03-18' }
+      ];
+
+      expect(getReviewsForSpotCheck(reviews, 'fid123', 'miner1', 1).selectedReviews).toEqual([reviews[0]]);
+      expect(getReviewsForSpotCheck(reviews, 'fid123', 'miner1', 5).selectedReviews).toHaveLength(3);
+    });
+
     test('should handle zero spot check count', () => {
       config.VALIDATOR.SPOT_CHECK_COUNT = 0;
       const reviews = [
@@ -392,4 +403,98 @@ describe('#utils/validator/google-maps/score/prepare-responses.js', () => {
       expect(result.allSpotCheckReviews).toHaveLength(0);
     });
   });
+
+  describe('prepareSummaries()', () => {
+    let review;
+    let fid;
+
+    beforeEach(() => {
+      fid = 'facility123';
+      review = {
+        reviewerId: '123',
+        reviewerUrl: 'https://example.com/reviewer/123',
+        reviewerName: 'John Doe',
+        reviewId: 'rev123',
+        reviewUrl: 'https://example.com/review/123',
+        publishedAtDate: '2024-03-20T10:00:00.000Z',
+        placeId: 'place123',
+        cid: 'cid123',
+        fid,
+        totalScore: 5
+      };
+
+      checkResponseValidity.mockReturnValue({ isValid: true });
+      array.validateArray.mockReturnValue({ valid: [review], invalid: [] });
+      generateValidationData.mockImplementation(({ minerUID, ...rest }) => ({
+        minerUID,
+        passedValidation: false,
+        ...rest
+      }));
+    });
+
+    test('should use the summary count and date and spot check the sampled reviews', () => {
+      const summary = { count: 200, mostRecentDate: review.publishedAtDate, spotCheckReviews: [review] };
+
+      const result = prepareSummaries([summary], ['miner1'], fid);
+
+      expect(result.validationData[0]).toMatchObject({
+        minerUID: 'miner1',
+        passedValidation: true,
+        count: 200,
+        mostRecentDate: new Date(review.publishedAtDate),
+        data: [review]
+      });
+      expect(result.allSpotCheckReviews).toEqual([{ minerUID: 'miner1', reviews: [review] }]);
+      expect(array.uniqueBy).not.toHaveBeenCalled();
+    });
+
+    test('should reject summaries with a count below the number of sampled reviews', () => {
+      const summary = { count: 0, mostRecentDate: review.publishedAtDate, spotCheckReviews: [review] };
+
+      const result = prepareSummaries([summary], ['miner1'], fid);
+
+      expect(result.validationData[0]).toMatchObject({
+        minerUID: 'miner1',
+        passedValidation: false,
+        validationError: 'Invalid response summary'
+      });
+      expect(result.allSpotCheckReviews).toHaveLength(0);
+    });
+
+    test('should reject summaries with structurally invalid sampled reviews', () => {
+      array.validateArray.mockReturnValue({
+        valid: [],
+        invalid: [{ isValid: false, item: review, validationError: 'FID mismatch' }]
+      });
+
+      const result = prepareSummaries([{ count: 1, spotCheckReviews: [review] }], ['miner1'], fid);
+
+      expect(result.validationData[0]).toMatchObject({
+        passedValidation: false,
+        validationError: 'Structural validation failed on review objects'
+      });
+      expect(result.allSpotCheckReviews).toHaveLength(0);
+    });
+
+    test('should leave the date undefined and fall back to the index without a miner UID', () => {
+      const result = prepareSummaries([{ count: 1, spotCheckReviews: [review] }], [], fid);
+
+      expect(result.validationData[0]).toMatchObject({
+        minerUID: 0,
+        passedValidation: true,
+        mostRecentDate: undefined
+      });
+    });
+
+    test('should reject missing summaries', () => {
+      checkResponseValidity.mockReturnValue({ isValid: false, validationError: 'Response is not an array' });
+
+      const result = prepareSummaries([undefined], ['miner1'], fid);
+
+      expect(result.validationData[0]).toMatchObject({
+        minerUID: 'miner1',
+        validationError: 'Response is not an array'
+      });
+    });
+  });
 });
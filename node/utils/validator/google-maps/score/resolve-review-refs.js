@@ -0,0 +1,49 @@
+import logger from '#modules/logger/index.js';
+
+/**
+ * Replaces review references with the reviews they point to.
+ * Validators send each distinct review once per request or scoring session, keyed by its content hash,
+ * and every miner that returned the review refers to it by that hash.
+ *
+ * @param {Array<Object|string>} entries - Reviews, or content hashes of reviews in `reviews`
+ * @param {Map<string, Object>} reviews - The distinct reviews by content hash
+ * @returns {Array<Object>|*} The reviews; unknown references become empty objects, which fail structural validation.
+ *                            Anything that is not an array is returned unchanged.
+ *
+ * @example
+ * const reviews = new Map([['3f2a...', { reviewId: '1', ... }]]);
+ * resolveReviewRefs(['3f2a...', { reviewId: '2', ... }], reviews);
+ * // Returns [{ reviewId: '1', ... }, { reviewId: '2', ... }]
+ */
+const resolveReviewRefs = (entries, reviews) => {
+  if (!Array.isArray(entries)) {
+    return entries;
+  }
+
+  return entries.map(entry => {
+    if (typeof entry !== 'string') {
+      return entry;
+    }
+    if (!reviews.has(entry)) {
+      logger.warning(`Unknown review reference ${entry}`);
+      return {};
+    }
+    return reviews.get(entry);
+  });
+}
+
+/**
+ * Replaces the review references of a response summary, see resolveReviewRefs
+ * @param {Object|undefined} summary - The response summary, see prepareSummaries
+ * @param {Map<string, Object>} reviews - The distinct reviews by content hash
+ * @returns {Object|undefined} The summary with its spot check reviews resolved
+ */
+const resolveSummaryRefs = (summary, reviews) => summary && {
+  ...summary,
+  spotCheckReviews: resolveReviewRefs(summary.spotCheckReviews, reviews)
+};
+
+export {
+  resolveReviewRefs,
+  resolveSummaryRefs
+}
@@ -0,0 +1,47 @@
+import logger from '#modules/logger/index.js';
+import { resolveReviewRefs, resolveSummaryRefs } from './resolve-review-refs.js';
+
+jest.mock('#modules/logger/index.js', () => ({
+  info: jest.fn(),
+  warning: jest.fn(),
+  error: jest.fn()
+}));
+
+describe('#utils/validator/google-maps/score/resolve-review-refs.js', () => {
+  const review = { reviewId: '1', text: 'Great place' };
+  const reviews = new Map([['hash-1', review]]);
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('resolveReviewRefs()', () => {
+    test('should replace references and keep inline reviews', () => {
+      const inline = { reviewId: '2' };
+
+      expect(resolveReviewRefs(['hash-1', inline, 'hash-1'], reviews)).toEqual([review, inline, review]);
+    });
+
+    test('should turn unknown references into empty reviews', () => {
+      expect(resolveReviewRefs(['missing'], reviews)).toEqual([{}]);
+      expect(logger.warning).toHaveBeenCalledWith('Unknown review reference missing');
+    });
+
+    test('should return non-arrays unchanged', () => {
+      expect(resolveReviewRefs(undefined, reviews)).toBeUndefined();
+      expect(resolveReviewRefs('not an array', reviews)).toBe('not an array');
+    });
+  });
+
+  describe('resolveSummaryRefs()', () => {
+    test('should resolve the spot check reviews of a summary', () => {
+      const summary = { count: 10, mostRecentDate: '2024-03-20', spotCheckReviews: ['hash-1'] };
+
+      expect(resolveSummaryRefs(summary, reviews)).toEqual({ ...summary, spotCheckReviews: [review] });
+    });
+
+    test('should return missing summaries unchanged', () => {
+      expect(resolveSummaryRefs(undefined, reviews)).toBeUndefined();
+    });
+  });
+});
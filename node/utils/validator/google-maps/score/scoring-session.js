@@ -0,0 +1,244 @@
+import crypto from 'node:crypto';
+import config from '#config';
+import logger from '#modules/logger/index.js';
+import generateValidationData from '#utils/validator/validation-data.js';
+import performBatchSpotCheck from '#utils/validator/google-maps/score/perform-batch-spot-check.js';
+import fetchReferenceReviews from '#utils/validator/google-maps/score/fetch-reference-reviews.js';
+import validateMinerAgainstBatch from '#utils/validator/google-maps/score/validate-miner-against-batch.js';
+import calculateFinalScores from '#utils/validator/google-maps/score/calculate-final-scores.js';
+import { prepareResponses, prepareSummaries } from '#utils/validator/google-maps/score/prepare-responses.js';
+import { resolveReviewRefs, resolveSummaryRefs } from '#utils/validator/google-maps/score/resolve-review-refs.js';
+
+/**
+ * Open scoring sessions keyed by session ID
+ * @type {Map<string, Object>}
+ */
+const sessions = new Map();
+
+/**
+ * Fields of a verified review that validateMinerAgainstBatch compares, and that the validator caches
+ * @type {Array<string>}
+ */
+const VERIFIED_REVIEW_FIELDS = ['reviewId', 'fid', 'reviewerId', 'placeId', 'text', 'publishedAtDate'];
+
+/**
+ * Keep only the compared fields of a verified review
+ * @param {Object} review - The verified review as returned by the spot check actor
+ * @returns {Object} - The verified review with only VERIFIED_REVIEW_FIELDS
+ */
+const pickVerifiedFields = (review) => Object.fromEntries(
+  VERIFIED_REVIEW_FIELDS.map(field => [field, review[field]])
+);
+
+/**
+ * Remove sessions that were never finalized within the session TTL
+ * @param {number} now - The current time in milliseconds
+ */
+const removeExpiredSessions = (now = Date.now()) => {
+  for (const [sessionId, session] of sessions) {
+    if (now - session.createdAt > config.VALIDATOR.SCORING_SESSION_TTL * 1000) {
+      logger.warning(`Scoring session ${sessionId} expired before finalization`);
+      sessions.delete(sessionId);
+    }
+  }
+}
+
+/**
+ * Create a new incremental scoring session for a round
+ * With referenceFetch, a snapshot of the newest reviews of the place is fetched while the miners are queried,
+ * miner reviews found in it are verified against it and only the others are spot checked by URL
+ * @param {Object} param0 - The parameters
+ * @param {string} param0.fid - The fid the miners were queried for
+ * @param {Array<number>} param0.minerUIDs - The UIDs of all queried miners, in scoring order
+ * @param {number} param0.synapseTimeout - The synapse timeout in seconds
+ * @param {boolean} [param0.referenceFetch=false] - Whether to start a reference fetch of the newest reviews
+ * @returns {Object} - The created session
+ */
+const createSession = ({ fid, minerUIDs = [], synapseTimeout = config.VALIDATOR.SYNAPSE_TIMEOUT, referenceFetch = false }) => {
+  removeExpiredSessions();
+
+  const session = {
+    sessionId: crypto.randomUUID(),
+    fid,
+    minerUIDs,
+    synapseTimeout,
+    createdAt: Date.now(),
+    minerData: new Map(),
+    responseTimes: new Map(),
+    reviews: new Map(),
+    knownReviews: new Map(),
+    referenceReviews: referenceFetch ? fetchReferenceReviews(fid) : undefined,
+    verifiedReviews: [],
+    pendingSpotChecks: [],
+    spotCheckBatches: []
+  };
+  sessions.set(session.sessionId, session);
+
+  return session;
+}
+
+/**
+ * Get an open scoring session
+ * @param {string} sessionId - The session ID
+ * @returns {Object|undefined} - The session, or undefined if it does not exist
+ */
+const getSession = (sessionId) => sessions.get(sessionId);
+
+/**
+ * Start a batch spot check for all pending spot check reviews of the session
+ * The spot check runs in the background, its result is collected on finalization
+ * @param {Object} session - The session
+ */
+const flushSpotChecks = (session) => {
+  if (session.pendingSpotChecks.length === 0) {
+    return;
+  }
+
+  const batch = session.pendingSpotChecks;
+  session.pendingSpotChecks = [];
+
+  logger.info(`Session ${session.sessionId}: Starting early spot check for ${batch.length} miners`);
+
+  // Reviews found in the reference snapshot are not spot checked by URL, so wait for it when it was started
+  const spotCheck = session.referenceReviews
+    ? session.referenceReviews.then(referenceReviews => performBatchSpotCheck(
+      batch,
+      session.fid,
+      new Map([...referenceReviews, ...session.knownReviews])
+    ))
+    : performBatchSpotCheck(batch, session.fid, session.knownReviews);
+  session.spotCheckBatches.push(
+    spotCheck
+      .then(verifiedReviews => ({ batch, verifiedReviews }))
+      .catch(error => ({ batch, error }))
+  );
+}
+
+/**
+ * Prepare a single miner response as soon as it arrives and queue its spot check reviews
+ * A spot check batch is started once enough miners are pending
+ * @param {Object} session - The session
+ * @param {Object} param1 - The submitted response
+ * @param {number} param1.minerUID - The miner UID
+ * @param {Array} [param1.response] - The miner response (list of reviews)
+ * @param {Object} [param1.summary] - The response summary sent instead of the response, see prepareSummaries
+ * @param {number} param1.responseTime - The miner response time in seconds
+ * @param {Array<Object>} [param1.verifiedReviews] - Reviews of the response the validator verified in earlier rounds, they are not spot checked again
+ * @param {Object<string, Object>} [param1.reviews] - Distinct reviews by content hash, kept for the whole session;
+ *                                                    reviews in the response or summary can refer to them by hash
+ * @param {number} [param1.spotCheckCount] - Number of reviews of the response to spot check, chosen by the validator
+ *                                           from the miner's history; summaries carry their own sample instead
+ * @returns {Object} - The validation data of the miner
+ */
+const submitResponse = (session, { minerUID, response, summary, responseTime, verifiedReviews = [], reviews = {}, spotCheckCount }) => {
+  for (const review of verifiedReviews) {
+    session.knownReviews.set(review.reviewId, review);
+  }
+  for (const [key, review] of Object.entries(reviews)) {
+    session.reviews.set(key, review);
+  }
+
+  const { validationData, allSpotCheckReviews } = summary
+    ? prepareSummaries([resolveSummaryRefs(summary, session.reviews)], [minerUID], session.fid)
+    : prepareResponses([resolveReviewRefs(response, session.reviews)], [minerUID], session.fid, [spotCheckCount]);
+  const [minerData] = validationData;
+
+  session.minerData.set(minerUID, minerData);
+  session.responseTimes.set(minerUID, responseTime);
+  session.pendingSpotChecks.push(...allSpotCheckReviews);
+
+  if (session.pendingSpotChecks.length >= config.VALIDATOR.SPOT_CHECK_BATCH_SIZE) {
+    flushSpotChecks(session);
+  }
+
+  return minerData;
+}
+
+/**
+ * Verify a session: wait for the outstanding spot checks and validate each miner against them
+ * Miners that never submitted a response are marked as failed
+ * The reviews verified by this session's spot checks are kept in session.verifiedReviews for the validator cache
+ * @param {Object} session - The session
+ * @param {Object<string, string>} settled - Failure reasons of miners the validator settled without submitting, by miner UID
+ * @returns {Promise<Array<Object>>} - The validation data of every miner, ordered like the session miner UIDs
+ */
+const verifySession = async (session, settled = {}) => {
+  sessions.delete(session.sessionId);
+  flushSpotChecks(session);
+
+  // Collect the reference snapshot, the verified reviews of every batch, and the miners whose batch failed
+  const verifiedReviewsMap = new Map([...(await session.referenceReviews ?? []), ...session.knownReviews]);
+  const failedMinerUIDs = new Set();
+  for (const { batch, verifiedReviews, error } of await Promise.all(session.spotCheckBatches)) {
+    if (error) {
+      logger.error(`Session ${session.sessionId}: Batch spot check failed:`, error);
+      for (const { minerUID } of batch) {
+        failedMinerUIDs.add(minerUID);
+      }
+      continue;
+    }
+    for (const [reviewId, verified] of verifiedReviews) {
+      verifiedReviewsMap.set(reviewId, verified);
+      session.verifiedReviews.push(pickVerifiedFields(verified));
+    }
+  }
+
+  const validationData = session.minerUIDs.map(minerUID => session.minerData.get(minerUID) || generateValidationData({
+    minerUID,
+    validationError: settled[minerUID] || 'No response submitted'
+  }));
+
+  // Validate each miner against the spot check results
+  for (const minerData of validationData) {
+    if (minerData.data.length === 0 || !minerData.passedValidation) {
+      continue;
+    }
+
+    if (failedMinerUIDs.has(minerData.minerUID)) {
+      minerData.passedValidation = false;
+      minerData.validationError = 'Batch spot check failed';
+      continue;
+    }
+
+    const spotCheckPassed = validateMinerAgainstBatch(
+      minerData.data,
+      session.fid,
+      minerData.minerUID,
+      verifiedReviewsMap
+    );
+
+    if (!spotCheckPassed) {
+      logger.error(`UID ${minerData.minerUID}: Failed spot check validation`);
+      minerData.passedValidation = false;
+      minerData.validationError = 'Failed spot check verification';
+      minerData.count = 0;
+      minerData.mostRecentDate = undefined;
+    }
+  }
+
+  return validationData;
+}
+
+/**
+ * Finalize a session: verify every miner and calculate the relative speed, volume and recency scores
+ * Miners that never submitted a response are scored as failed
+ * @param {Object} session - The session
+ * @param {Object<string, string>} settled - Failure reasons of miners the validator settled without submitting, by miner UID
+ * @returns {Promise<Object>} - The final scores, as returned by calculateFinalScores
+ */
+const finalizeSession = async (session, settled = {}) => {
+  const validationData = await verifySession(session, settled);
+  const responseTimes = session.minerUIDs.map(minerUID => session.responseTimes.get(minerUID));
+
+  return calculateFinalScores(validationData, responseTimes, session.synapseTimeout);
+}
+
+export {
+  createSession,
+  getSession,
+  submitResponse,
+  flushSpotChecks,
+  verifySession,
+  finalizeSession,
+  removeExpiredSessions
+}
@@ -0,0 +1,301 @@
+import config from '#config';
+import logger from '#modules/logger/index.js';
+import performBatchSpotCheck from '#utils/validator/google-maps/score/perform-batch-spot-check.js';
+import fetchReferenceReviews from '#utils/validator/google-maps/score/fetch-reference-reviews.js';
+import validateMinerAgainstBatch from '#utils/validator/google-maps/score/validate-miner-against-batch.js';
+import calculateFinalScores from '#utils/validator/google-maps/score/calculate-final-scores.js';
+import { prepareResponses, prepareSummaries } from '#utils/validator/google-maps/score/prepare-responses.js';
+import {
+  createSession,
+  getSession,
+  submitResponse,
+  flushSpotChecks,
+  verifySession,
+  finalizeSession,
+  removeExpiredSessions
+} from './scoring-session.js';
+
+jest.mock('#modules/logger/index.js', () => ({
+  info: jest.fn(),
+  warning: jest.fn(),
+  error: jest.fn(),
+}));
+jest.mock('#utils/validator/google-maps/score/prepare-responses.js', () => ({
+  prepareResponses: jest.fn(),
+  prepareSummaries: jest.fn(),
+}));
+jest.mock('#utils/validator/google-maps/score/perform-batch-spot-check.js');
+jest.mock('#utils/validator/google-maps/score/fetch-reference-reviews.js');
+jest.mock('#utils/validator/google-maps/score/validate-miner-against-batch.js');
+jest.mock('#utils/validator/google-maps/score/calculate-final-scores.js');
+
+describe('#utils/validator/google-maps/score/scoring-session.js', () => {
+  const fid = 'fid';
+  const finalResult = {
+    scores: [],
+    meanScore: 0,
+    minScore: 0,
+    maxScore: 0,
+    finalScores: []
+  };
+
+  const passedMinerData = (minerUID) => ({
+    minerUID,
+    passedValidation: true,
+    count: 1,
+    data: [{ reviewId: `review-${minerUID}` }]
+  });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+
+    const prepare = (entries, minerUIDs) => ({
+      validationData: [passedMinerData(minerUIDs[0])],
+      allSpotCheckReviews: [{ minerUID: minerUIDs[0], reviews: [{ reviewId: `review-${minerUIDs[0]}` }] }]
+    });
+    prepareResponses.mockImplementation(prepare);
+    prepareSummaries.mockImplementation(prepare);
+    performBatchSpotCheck.mockResolvedValue(new Map([['review-1', { reviewId: 'review-1' }]]));
+    validateMinerAgainstBatch.mockReturnValue(true);
+    calculateFinalScores.mockReturnValue(finalResult);
+  });
+
+  describe('createSession() and getSession()', () => {
+    test('should create a retrievable session', () => {
+      const session = createSession({ fid, minerUIDs: [1, 2], synapseTimeout: 60 });
+      expect(getSession(session.sessionId)).toBe(session);
+      expect(session.fid).toBe(fid);
+      expect(session.minerUIDs).toEqual([1, 2]);
+      expect(session.synapseTimeout).toBe(60);
+    });
+
+    test('should use default values', () => {
+      const session = createSession({ fid });
+      expect(session.minerUIDs).toEqual([]);
+      expect(session.synapseTimeout).toBe(config.VALIDATOR.SYNAPSE_TIMEOUT);
+    });
+
+    test('should return undefined for unknown sessions', () => {
+      expect(getSession('unknown')).toBeUndefined();
+    });
+  });
+
+  describe('removeExpiredSessions()', () => {
+    test('should remove sessions older than the TTL only', () => {
+      const session = createSession({ fid });
+      removeExpiredSessions();
+      expect(getSession(session.sessionId)).toBe(session);
+
+      removeExpiredSessions(session.createdAt + (config.VALIDATOR.SCORING_SESSION_TTL * 1000) + 1);
+      expect(getSession(session.sessionId)).toBeUndefined();
+      expect(logger.warning).toHaveBeenCalled();
+    });
+  });
+
+  describe('submitResponse()', () => {
+    test('should prepare the response and queue its spot check reviews', () => {
+      const session = createSession({ fid, minerUIDs: [1] });
+      const minerData = submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+
+      expect(prepareResponses).toHaveBeenCalledWith([[{}]], [1], fid, [undefined]);
+      expect(minerData).toEqual(passedMinerData(1));
+      expect(session.responseTimes.get(1)).toBe(5);
+      expect(session.pendingSpotChecks).toHaveLength(1);
+      expect(performBatchSpotCheck).not.toHaveBeenCalled();
+    });
+
+    test('should prepare a response summary instead of the full response', () => {
+      const session = createSession({ fid, minerUIDs: [1] });
+      const summary = { count: 10, mostRecentDate: '2024-03-20T10:00:00.000Z', spotCheckReviews: [{}] };
+      const minerData = submitResponse(session, { minerUID: 1, summary, responseTime: 5 });
+
+      expect(prepareSummaries).toHaveBeenCalledWith([summary], [1], fid);
+      expect(prepareResponses).not.toHaveBeenCalled();
+      expect(minerData).toEqual(passedMinerData(1));
+      expect(session.pendingSpotChecks).toHaveLength(1);
+    });
+
+    test('should pass the spot check count chosen by the validator', () => {
+      const session = createSession({ fid, minerUIDs: [1] });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5, spotCheckCount: 1 });
+
+      expect(prepareResponses).toHaveBeenCalledWith([[{}]], [1], fid, [1]);
+    });
+
+    test('should resolve review references against the reviews sent earlier in the session', () => {
+      const session = createSession({ fid, minerUIDs: [1, 2] });
+      const review = { reviewId: 'review-1' };
+      submitResponse(session, { minerUID: 1, response: ['hash-1'], responseTime: 5, reviews: { 'hash-1': review } });
+      submitResponse(session, { minerUID: 2, summary: { count: 1, spotCheckReviews: ['hash-1'] }, responseTime: 5 });
+
+      expect(prepareResponses).toHaveBeenCalledWith([[review]], [1], fid, [undefined]);
+      expect(prepareSummaries).toHaveBeenCalledWith([{ count: 1, spotCheckReviews: [review] }], [2], fid);
+    });
+
+    test('should start a spot check batch once enough miners are pending', () => {
+      const session = createSession({ fid });
+      for (let minerUID = 0; minerUID < config.VALIDATOR.SPOT_CHECK_BATCH_SIZE; minerUID++) {
+        submitResponse(session, { minerUID, response: [{}], responseTime: 1 });
+      }
+
+      expect(performBatchSpotCheck).toHaveBeenCalledTimes(1);
+      expect(session.pendingSpotChecks).toHaveLength(0);
+      expect(session.spotCheckBatches).toHaveLength(1);
+    });
+  });
+
+  describe('flushSpotChecks()', () => {
+    test('should do nothing without pending spot checks', () => {
+      const session = createSession({ fid });
+      flushSpotChecks(session);
+      expect(performBatchSpotCheck).not.toHaveBeenCalled();
+      expect(session.spotCheckBatches).toHaveLength(0);
+    });
+  });
+
+  describe('verifySession()', () => {
+    test('should return the verified validation data without scoring', async () => {
+      const session = createSession({ fid, minerUIDs: [1, 2] });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+
+      const validationData = await verifySession(session, { 2: 'Response is empty' });
+
+      expect(calculateFinalScores).not.toHaveBeenCalled();
+      expect(getSession(session.sessionId)).toBeUndefined();
+      expect(validationData[0]).toEqual(passedMinerData(1));
+      expect(validationData[1].validationError).toBe('Response is empty');
+    });
+  });
+
+  describe('verified review cache', () => {
+    test('should trust reviews verified in earlier rounds and report the newly verified ones', async () => {
+      const known = { reviewId: 'review-2', fid, reviewerId: 'r2', placeId: 'p', text: 't', publishedAtDate: 'd' };
+      performBatchSpotCheck.mockResolvedValue(new Map([['review-1', { reviewId: 'review-1', fid, extra: true }]]));
+      const session = createSession({ fid, minerUIDs: [1, 2] });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+      submitResponse(session, { minerUID: 2, response: [{}], responseTime: 5, verifiedReviews: [known] });
+
+      await verifySession(session);
+
+      expect(performBatchSpotCheck).toHaveBeenCalledWith(expect.any(Array), fid, new Map([['review-2', known]]));
+      expect(validateMinerAgainstBatch).toHaveBeenCalledWith(
+        [{ reviewId: 'review-2' }], fid, 2, new Map([['review-2', known], ['review-1', { reviewId: 'review-1', fid, extra: true }]])
+      );
+      expect(session.verifiedReviews).toEqual([{
+        reviewId: 'review-1',
+        fid,
+        reviewerId: undefined,
+        placeId: undefined,
+        text: undefined,
+        publishedAtDate: undefined
+      }]);
+    });
+  });
+
+  describe('reference fetch', () => {
+    test('should only spot check reviews missing from the reference snapshot by URL', async () => {
+      const reference = { reviewId: 'review-1', fid, publishedAtDate: 'd' };
+      fetchReferenceReviews.mockResolvedValue(new Map([['review-1', reference]]));
+      performBatchSpotCheck.mockResolvedValue(new Map([['review-2', { reviewId: 'review-2' }]]));
+      const session = createSession({ fid, minerUIDs: [1, 2], referenceFetch: true });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+      submitResponse(session, { minerUID: 2, response: [{}], responseTime: 5 });
+
+      await verifySession(session);
+
+      expect(fetchReferenceReviews).toHaveBeenCalledWith(fid);
+      expect(performBatchSpotCheck).toHaveBeenCalledWith(expect.any(Array), fid, new Map([['review-1', reference]]));
+      expect(validateMinerAgainstBatch).toHaveBeenCalledWith(
+        [{ reviewId: 'review-1' }], fid, 1, new Map([['review-1', reference], ['review-2', { reviewId: 'review-2' }]])
+      );
+    });
+
+    test('should not fetch a reference snapshot by default', async () => {
+      const session = createSession({ fid, minerUIDs: [1] });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+
+      await verifySession(session);
+
+      expect(fetchReferenceReviews).not.toHaveBeenCalled();
+      expect(session.referenceReviews).toBeUndefined();
+    });
+  });
+
+  describe('finalizeSession()', () => {
+    test('should validate miners against the spot checks and calculate the final scores', async () => {
+      const session = createSession({ fid, minerUIDs: [1, 2], synapseTimeout: 120 });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+
+      const result = await finalizeSession(session);
+
+      expect(result).toBe(finalResult);
+      expect(getSession(session.sessionId)).toBeUndefined();
+      expect(validateMinerAgainstBatch).toHaveBeenCalledWith(
+        [{ reviewId: 'review-1' }], fid, 1, new Map([['review-1', { reviewId: 'review-1' }]])
+      );
+
+      const [validationData, responseTimes, synapseTimeout] = calculateFinalScores.mock.calls[0];
+      expect(validationData[0]).toEqual(passedMinerData(1));
+      expect(validationData[1].minerUID).toBe(2);
+      expect(validationData[1].passedValidation).toBe(false);
+      expect(validationData[1].validationError).toBe('No response submitted');
+      expect(responseTimes).toEqual([5, undefined]);
+      expect(synapseTimeout).toBe(120);
+    });
+
+    test('should keep the reasons of miners settled by the validator', async () => {
+      const session = createSession({ fid, minerUIDs: [1, 2, 3] });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+
+      await finalizeSession(session, { 2: 'Structural validation failed on review objects' });
+
+      const [validationData] = calculateFinalScores.mock.calls[0];
+      expect(validationData[1].passedValidation).toBe(false);
+      expect(validationData[1].validationError).toBe('Structural validation failed on review objects');
+      expect(validationData[2].validationError).toBe('No response submitted');
+    });
+
+    test('should skip spot check validation for miners without data or that failed', async () => {
+      prepareResponses.mockImplementation((responses, minerUIDs) => ({
+        validationData: [{ minerUID: minerUIDs[0], passedValidation: false, data: minerUIDs[0] === 1 ? [] : [{}] }],
+        allSpotCheckReviews: []
+      }));
+      const session = createSession({ fid, minerUIDs: [1, 2] });
+      submitResponse(session, { minerUID: 1, response: [], responseTime: 5 });
+      submitResponse(session, { minerUID: 2, response: [{}], responseTime: 5 });
+
+      await finalizeSession(session);
+
+      expect(performBatchSpotCheck).not.toHaveBeenCalled();
+      expect(validateMinerAgainstBatch).not.toHaveBeenCalled();
+    });
+
+    test('should fail miners whose spot check batch failed', async () => {
+      performBatchSpotCheck.mockRejectedValue(new Error('Spot check failed'));
+      const session = createSession({ fid, minerUIDs: [1] });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+
+      await finalizeSession(session);
+
+      const [validationData] = calculateFinalScores.mock.calls[0];
+      expect(validationData[0].passedValidation).toBe(false);
+      expect(validationData[0].validationError).toBe('Batch spot check failed');
+      expect(validateMinerAgainstBatch).not.toHaveBeenCalled();
+      expect(logger.error).toHaveBeenCalled();
+    });
+
+    test('should fail miners that do not pass the spot check', async () => {
+      validateMinerAgainstBatch.mockReturnValue(false);
+      const session = createSession({ fid, minerUIDs: [1] });
+      submitResponse(session, { minerUID: 1, response: [{}], responseTime: 5 });
+
+      await finalizeSession(session);
+
+      const [validationData] = calculateFinalScores.mock.calls[0];
+      expect(validationData[0].passedValidation).toBe(false);
+      expect(validationData[0].validationError).toBe('Failed spot check verification');
+      expect(validationData[0].count).toBe(0);
+      expect(validationData[0].mostRecentDate).toBeUndefined();
+    });
+  });
+});
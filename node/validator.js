@@ -3,6 +3,7 @@ import express from 'express';
 import config from '#config';
 import healthRoute from '#routes/validator/health.js';
 import scoreRoute from '#routes/validator/score.js';
+import scoreSessionRoute from '#routes/validator/score-session.js';
 import localhostOnly from '#modules/middlewares/localhost-only.js';
 import logger from '#modules/logger/index.js';
 import createSyntheticRoute from '#routes/validator/create-synthetic.js';
@@ -22,15 +23,21 @@ app.post('/create-synthetic-task', createSyntheticRoute.execute);
 // Score miner responses using spot check validation
 app.post('/score-responses', scoreRoute.execute);
 
+// Score miner responses incrementally as they arrive
+app.post('/score-session', scoreSessionRoute.start);
+app.post('/score-session/:sessionId/responses', scoreSessionRoute.submit);
+app.post('/score-session/:sessionId/finalize', scoreSessionRoute.finalize);
+
 // Health check endpoint
 app.get('/health', healthRoute.execute);
 
 // Start server and log configuration
-app.listen(PORT, () => {
+const server = app.listen(PORT, () => {
   logger.info('='.repeat(50));
   logger.info(`Node running on port ${PORT}`);
   logger.info(`Synthetic task endpoint: POST /create-synthetic-task`);
   logger.info(`Scoring endpoint: POST /score-responses`);
+  logger.info(`Incremental scoring endpoints: POST /score-session, /score-session/:sessionId/responses, /score-session/:sessionId/finalize`);
   logger.info(`Configuration:`);
   logger.info(`  - Spot check validation: ${config.VALIDATOR.SPOT_CHECK_COUNT} reviews per validation`);
   logger.info(`  - Synapse timeout: ${config.VALIDATOR.SYNAPSE_TIMEOUT} seconds`);
@@ -41,3 +48,8 @@ app.listen(PORT, () => {
   logger.info(`  - Apify token configured: ${Boolean(process.env.APIFY_TOKEN)}`);
   logger.info('='.repeat(50));
 });
+
+// Keep idle connections open longer than the Python validator's pool keep-alive,
+// so pooled connections are closed by the client rather than dropped mid-reuse
+server.keepAliveTimeout = config.VALIDATOR.KEEP_ALIVE_TIMEOUT * 1000;
+server.headersTimeout = (config.VALIDATOR.KEEP_ALIVE_TIMEOUT + 5) * 1000;
@@ -0,0 +1,241 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import copy
+import asyncio
+import aiohttp
+import threading
+import bittensor as bt
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional, Tuple
+
+from oneoneone.protocol import ResponseLimitError
+
+
+class BoundedClientResponse(aiohttp.ClientResponse):
+    """
+    aiohttp response that stops reading a body once it exceeds `max_bytes`.
+
+    A declared Content-Length above the limit is rejected before any of the body is read,
+    otherwise the body is read chunk by chunk and the connection dropped as soon as the
+    limit is crossed. The dendrite reports the raised `ResponseLimitError` on the synapse
+    like any other failed query. The size of every body read is stored on `owner`, the
+    pooled dendrite the session belongs to, as `last_response_bytes`.
+    """
+
+    max_bytes: Optional[int] = None
+    owner: Any = None
+
+    def _check_limit(self, nbytes: int):
+        if nbytes > self.max_bytes:
+            raise ResponseLimitError(
+                f"Response limit exceeded: more than {self.max_bytes} bytes from {self.url.host}:{self.url.port}"
+            )
+
+    async def read(self) -> bytes:
+        if self._body is None and self.max_bytes is not None:
+            try:
+                if self.content_length is not None:
+                    self._check_limit(self.content_length)
+                body = bytearray()
+                async for chunk in self.content.iter_any():
+                    body.extend(chunk)
+                    self._check_limit(len(body))
+            except BaseException:
+                self.close()
+                raise
+            self._body = bytes(body)
+            for trace in self._traces:
+                await trace.send_response_chunk_received(
+                    self.method, self.url, self._body
+                )
+        body = await super().read()
+        if self.owner is not None:
+            self.owner.last_response_bytes = len(body)
+        return body
+
+
+class DendritePool:
+    """
+    Per-axon dendrites with persistent keep-alive connection pools.
+
+    Every axon gets its own shallow copy of the validator's dendrite (same keypair, uuid and
+    external ip) bound to a dedicated aiohttp session, so warm connections survive across
+    queries and rounds and can be dropped per axon. Axons are keyed by (hotkey, ip, port):
+    an axon that changes any of them gets a fresh entry, and `evict()` closes the old one.
+
+    Most miner servers close idle connections after a few seconds, so `warmup()` pre-opens
+    connections to the axons of a round right before they are queried; that way measured
+    response times reflect miner work rather than TCP handshakes.
+
+    Attributes:
+    - max_axons: Maximum number of axons kept warm, least recently used are closed first
+    - connections_per_axon: Maximum concurrent connections to a single axon
+    - keepalive_timeout: Seconds an idle connection is kept open on our side
+    - warmup_timeout: Deadline in seconds for a single warmup request
+    - max_response_bytes: Largest response body read from an axon, unbounded if None
+    - trace_configs: aiohttp trace configs attached to every pooled session
+    """
+
+    def __init__(
+        self,
+        dendrite: "bt.dendrite",
+        max_axons: int,
+        connections_per_axon: int,
+        keepalive_timeout: float,
+        warmup_timeout: float,
+        max_response_bytes: Optional[int] = None,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+    ):
+        self.dendrite = dendrite
+        self.max_axons = max_axons
+        self.connections_per_axon = connections_per_axon
+        self.keepalive_timeout = keepalive_timeout
+        self.warmup_timeout = warmup_timeout
+        self.max_response_bytes = max_response_bytes
+        self.trace_configs = trace_configs
+        self._dendrites: "OrderedDict[Tuple[str, str, int], bt.dendrite]" = (
+            OrderedDict()
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._dendrites)
+
+    @staticmethod
+    def key(axon: "bt.AxonInfo") -> Tuple[str, str, int]:
+        return (axon.hotkey, axon.ip, axon.port)
+
+    def get(self, axon: "bt.AxonInfo") -> "bt.dendrite":
+        """
+        Returns the pooled dendrite for an axon, creating it on first use.
+        Must be called from the event loop the dendrites are used on.
+
+        Args:
+            axon: The axon to query
+
+        Returns:
+            bt.dendrite: A dendrite whose session only talks to this axon, with the body
+            size of its last response in `last_response_bytes`
+        """
+        self._loop = asyncio.get_event_loop()
+        key = self.key(axon)
+
+        with self._lock:
+            dendrite = self._dendrites.get(key)
+            if dendrite is not None:
+                self._dendrites.move_to_end(key)
+                return dendrite
+
+            dendrite = copy.copy(self.dendrite)
+            dendrite.synapse_history = []
+            dendrite.last_response_bytes = 0
+            dendrite._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.connections_per_axon,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+                trace_configs=self.trace_configs,
+                response_class=type(
+                    "BoundedClientResponse",
+                    (BoundedClientResponse,),
+                    {"max_bytes": self.max_response_bytes, "owner": dendrite},
+                ),
+            )
+            self._dendrites[key] = dendrite
+
+            stale = []
+            while len(self._dendrites) > self.max_axons:
+                stale.append(self._dendrites.popitem(last=False)[1])
+
+        self._close(stale)
+        return dendrite
+
+    async def _warmup_one(self, axon: "bt.AxonInfo"):
+        """Opens a connection to an axon with a cheap request, ignoring the outcome."""
+        session = await self.get(axon).session
+        try:
+            async with session.head(
+                f"http://{axon.ip}:{axon.port}/",
+                timeout=aiohttp.ClientTimeout(total=self.warmup_timeout),
+            ):
+                pass
+        except Exception as e:
+            bt.logging.trace(f"Warmup of {axon.ip}:{axon.port} failed: {e}")
+
+    async def warmup(
+        self, axons: Iterable["bt.AxonInfo"], max_concurrency: Optional[int] = None
+    ):
+        """
+        Pre-opens one connection to each axon so the following query reuses it.
+
+        Args:
+            axons: The axons about to be queried
+            max_concurrency: Maximum connections opened at the same time, unbounded if omitted
+        """
+        if max_concurrency is None:
+            await asyncio.gather(*(self._warmup_one(axon) for axon in axons))
+            return
+
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def warmup_one(axon):
+            async with slots:
+                await self._warmup_one(axon)
+
+        await asyncio.gather(*(warmup_one(axon) for axon in axons))
+
+    def evict(self, axons: Iterable["bt.AxonInfo"]):
+        """
+        Drops the pooled dendrites of the given axons and closes their connections.
+        Safe to call from any thread, e.g. from a metagraph resync.
+
+        Args:
+            axons: Axons that were deregistered or whose endpoint changed
+        """
+        with self._lock:
+            stale = [
+                dendrite
+                for dendrite in (
+                    self._dendrites.pop(self.key(axon), None) for axon in axons
+                )
+                if dendrite is not None
+            ]
+
+        if stale:
+            bt.logging.debug(f"Evicting {len(stale)} stale axon connections")
+        self._close(stale)
+
+    def _close(self, dendrites: List["bt.dendrite"]):
+        """Closes the sessions of dropped dendrites on the event loop they belong to."""
+        if not dendrites or self._loop is None or self._loop.is_closed():
+            return
+
+        def close_all():
+            for dendrite in dendrites:
+                asyncio.ensure_future(dendrite.aclose_session())
+
+        self._loop.call_soon_threadsafe(close_all)
+
+    async def close(self):
+        """Closes every pooled connection."""
+        with self._lock:
+            dendrites = list(self._dendrites.values())
+            self._dendrites.clear()
+        await asyncio.gather(*(dendrite.aclose_session() for dendrite in dendrites))
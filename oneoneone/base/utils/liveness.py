@@ -0,0 +1,124 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import threading
+import bittensor as bt
+from typing import Dict, Iterable, List, Optional
+
+
+class LivenessRecord:
+    """
+    Liveness history of a single miner UID.
+
+    Attributes:
+    - consecutive_failures: Failed queries since the last successful one
+    - last_success: `time.monotonic()` of the last successful query, None if never
+    - last_error: Class of the last failure, e.g. "timeout" or "unreachable"
+    - next_probe: `time.monotonic()` before which the UID is not queried again
+    """
+
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.last_success: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.next_probe = 0.0
+
+
+class LivenessTracker:
+    """
+    Tracks which miner axons actually answer and backs off from chronically dead ones.
+
+    A UID that failed `failure_threshold` queries in a row (timeouts, refused connections,
+    HTTP errors) is no longer queried every round but probed on an exponential backoff
+    schedule: `base_backoff` seconds after the threshold is reached, doubling with every
+    further failure up to `max_backoff`. A single success clears the backoff. Records are
+    reset when a UID's axon endpoint or hotkey changes, since a new miner or server deserves
+    a fresh start.
+
+    Attributes:
+    - failure_threshold: Consecutive failures before backoff starts
+    - base_backoff: Backoff in seconds after reaching the threshold
+    - max_backoff: Upper bound of the backoff in seconds
+    """
+
+    def __init__(self, failure_threshold: int, base_backoff: float, max_backoff: float):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._records: Dict[int, LivenessRecord] = {}
+        self._lock = threading.Lock()
+
+    def get(self, uid: int) -> LivenessRecord:
+        """Returns the record of a UID, a fresh one if it was never queried."""
+        with self._lock:
+            return self._records.get(int(uid)) or LivenessRecord()
+
+    def record_success(self, uid: int):
+        """Records a query the miner answered."""
+        with self._lock:
+            record = self._records.setdefault(int(uid), LivenessRecord())
+            record.consecutive_failures = 0
+            record.last_success = time.monotonic()
+            record.next_probe = 0.0
+
+    def record_failure(self, uid: int, error: str):
+        """
+        Records a query the miner did not answer and schedules its next probe.
+
+        Args:
+            uid: The miner UID
+            error: The failure class, e.g. "timeout", "unreachable" or "http_500"
+        """
+        with self._lock:
+            record = self._records.setdefault(int(uid), LivenessRecord())
+            record.consecutive_failures += 1
+            record.last_error = error
+
+            excess = record.consecutive_failures - self.failure_threshold
+            if excess >= 0:
+                backoff = min(self.base_backoff * (2**excess), self.max_backoff)
+                record.next_probe = time.monotonic() + backoff
+                bt.logging.debug(
+                    f"Miner UID {uid}: {record.consecutive_failures} consecutive failures "
+                    f"({error}), next probe in {backoff:.0f}s"
+                )
+
+    def is_due(self, uid: int, now: Optional[float] = None) -> bool:
+        """Returns whether the UID may be queried now."""
+        now = time.monotonic() if now is None else now
+        return self.get(uid).next_probe <= now
+
+    def due(self, uids: Iterable[int]) -> List[int]:
+        """
+        Filters UIDs down to those not currently backed off.
+
+        Args:
+            uids: Candidate UIDs
+
+        Returns:
+            List[int]: The candidates that may be queried now, in the same order
+        """
+        now = time.monotonic()
+        return [uid for uid in uids if self.is_due(uid, now)]
+
+    def reset(self, uids: Iterable[int]):
+        """Forgets the history of UIDs whose axon or hotkey changed."""
+        with self._lock:
+            for uid in uids:
+                self._records.pop(int(uid), None)
@@ -0,0 +1,130 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import bittensor as bt
+from typing import Awaitable, Callable, Optional
+from traceback import print_exception
+
+
+class RoundScheduler:
+    """
+    Fires validation rounds on the event loop at a fixed cadence measured from round start.
+
+    Rounds are started as tasks so the loop stays free while they wait on the network and
+    between rounds. A round that is still running when its next slot comes up causes that
+    slot to be skipped rather than stacking rounds. The blocking `sync_fn` (metagraph sync
+    and weight setting) runs in a worker thread every `sync_interval` seconds, but only while
+    no round is in flight, so it never races a round's score update.
+
+    Attributes:
+    - interval: Seconds between consecutive round starts
+    - sync_interval: Seconds between consecutive sync attempts
+    - poll_interval: Maximum seconds between checks of `should_exit`
+    """
+
+    def __init__(
+        self,
+        round_fn: Callable[[], Awaitable[None]],
+        sync_fn: Callable[[], None],
+        interval: float,
+        sync_interval: float,
+        should_exit: Callable[[], bool],
+        poll_interval: float = 1.0,
+    ):
+        self.round_fn = round_fn
+        self.sync_fn = sync_fn
+        self.interval = interval
+        self.sync_interval = sync_interval
+        self.should_exit = should_exit
+        self.poll_interval = poll_interval
+        self._round: Optional[asyncio.Future] = None
+        self._sync: Optional[asyncio.Future] = None
+
+    @property
+    def round_in_flight(self) -> bool:
+        return self._round is not None and not self._round.done()
+
+    @property
+    def sync_in_flight(self) -> bool:
+        return self._sync is not None and not self._sync.done()
+
+    async def _run_round(self):
+        """Runs a single round, logging instead of propagating failures."""
+        loop = asyncio.get_event_loop()
+        started_at = loop.time()
+        try:
+            await self.round_fn()
+            bt.logging.info(f"Round finished in {loop.time() - started_at:.2f}s")
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            bt.logging.error(f"Error during validation round: {str(err)}")
+            bt.logging.debug(str(print_exception(type(err), err, err.__traceback__)))
+
+    async def _run_sync(self):
+        """Runs the blocking sync function in a worker thread."""
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self.sync_fn)
+        except Exception as err:
+            bt.logging.error(f"Error during sync: {str(err)}")
+            bt.logging.debug(str(print_exception(type(err), err, err.__traceback__)))
+
+    async def run(self):
+        """
+        Runs rounds and syncs until `should_exit` returns True, then cancels any round in flight.
+        """
+        loop = asyncio.get_event_loop()
+        next_round_at = loop.time()
+        next_sync_at = loop.time() + self.sync_interval
+
+        try:
+            while not self.should_exit():
+                now = loop.time()
+
+                # Sync only between rounds so it never races a score update.
+                if (
+                    now >= next_sync_at
+                    and not self.round_in_flight
+                    and not self.sync_in_flight
+                ):
+                    self._sync = asyncio.ensure_future(self._run_sync())
+                    next_sync_at = now + self.sync_interval
+
+                if now >= next_round_at and not self.sync_in_flight:
+                    if self.round_in_flight:
+                        bt.logging.warning(
+                            "Previous round still running, skipping this round slot"
+                        )
+                    else:
+                        self._round = asyncio.ensure_future(self._run_round())
+
+                    # Keep the cadence anchored to round start, skipping missed slots.
+                    while next_round_at <= now:
+                        next_round_at += self.interval
+
+                wake_at = min(next_round_at, next_sync_at)
+                await asyncio.sleep(
+                    max(0.0, min(wake_at - loop.time(), self.poll_interval))
+                )
+        finally:
+            if self.round_in_flight:
+                self._round.cancel()
+            if self.sync_in_flight:
+                await asyncio.wait([self._sync])
@@ -0,0 +1,254 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import asyncio
+import aiohttp
+import functools
+import threading
+from contextlib import contextmanager
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+
+
+class PhaseTimings:
+    """
+    In-memory rolling window of phase durations measured with the monotonic clock.
+
+    Every phase keeps its last `window` samples. A sample is the duration of one occurrence
+    of the phase plus optional numeric fields (e.g. `bytes_sent`, `bytes_received`) and
+    labels (e.g. `uid`). Samples can be recorded from the event loop and from worker
+    threads (sync, set_weights) alike.
+
+    Query with `phases()`, `samples()` and `summary()`, e.g. comparing
+    `summary(since=...)["dendrite.ttfb"]["p95"]` between a slow and a normal round shows
+    which phase grew.
+
+    Attributes:
+    - window: Maximum number of samples kept per phase
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, duration: float, **fields: Any):
+        """
+        Records one occurrence of a phase.
+
+        Args:
+            phase: The phase name, e.g. "round.select" or "dendrite.connect"
+            duration: The phase duration in seconds
+            **fields: Extra numeric fields and labels stored with the sample
+        """
+        sample = {"at": time.monotonic(), "duration": duration, **fields}
+        with self._lock:
+            samples = self._samples.get(phase)
+            if samples is None:
+                samples = self._samples[phase] = deque(maxlen=self.window)
+            samples.append(sample)
+
+    @contextmanager
+    def measure(self, phase: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Measures the enclosed block as one occurrence of a phase.
+
+        The yielded dict can be filled with fields only known at the end of the block,
+        e.g. byte counts. The sample is recorded even if the block raises.
+
+        Args:
+            phase: The phase name
+            **fields: Extra numeric fields and labels stored with the sample
+        """
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            self.record(phase, time.perf_counter() - start, **fields)
+
+    def last(self, phase: str, **labels: Any) -> Optional[Dict[str, Any]]:
+        """
+        Returns the most recent sample of a phase matching all given labels.
+
+        Args:
+            phase: The phase name
+            **labels: Label values the sample must have, e.g. host="1.2.3.4:8091"
+        """
+        with self._lock:
+            for sample in reversed(self._samples.get(phase, ())):
+                if all(sample.get(key) == value for key, value in labels.items()):
+                    return sample
+        return None
+
+    def phases(self) -> List[str]:
+        """Returns the names of all recorded phases."""
+        with self._lock:
+            return sorted(self._samples)
+
+    def samples(
+        self, phase: str, since: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the samples of a phase, oldest first.
+
+        Args:
+            phase: The phase name
+            since: Only return samples recorded at or after this `time.monotonic()` value
+        """
+        with self._lock:
+            samples = list(self._samples.get(phase, ()))
+        if since is not None:
+            samples = [sample for sample in samples if sample["at"] >= since]
+        return samples
+
+    def summary(
+        self, phase: Optional[str] = None, since: Optional[float] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregates durations and byte counts per phase.
+
+        Args:
+            phase: Only summarize this phase, all phases if omitted
+            since: Only include samples recorded at or after this `time.monotonic()` value
+
+        Returns:
+            dict: Per phase the sample count, total/mean/p50/p95/max duration in seconds,
+            and the total of every numeric `bytes_*` field
+        """
+        result = {}
+        for name in [phase] if phase is not None else self.phases():
+            samples = self.samples(name, since=since)
+            if not samples:
+                continue
+
+            durations = np.array([sample["duration"] for sample in samples])
+            stats = {
+                "count": len(samples),
+                "total": float(durations.sum()),
+                "mean": float(durations.mean()),
+                "p50": float(np.percentile(durations, 50)),
+                "p95": float(np.percentile(durations, 95)),
+                "max": float(durations.max()),
+            }
+            for key in {key for sample in samples for key in sample}:
+                if key.startswith("bytes_"):
+                    stats[key] = sum(sample.get(key) or 0 for sample in samples)
+            result[name] = stats
+        return result
+
+    def format_summary(self, since: Optional[float] = None) -> str:
+        """Renders `summary()` as one compact line per phase for logging."""
+        return "\n".join(
+            f"  {name}: n={stats['count']} mean={stats['mean']:.3f}s "
+            f"p95={stats['p95']:.3f}s max={stats['max']:.3f}s"
+            + "".join(
+                f" {key}={stats[key]}" for key in sorted(stats) if key.startswith("bytes_")
+            )
+            for name, stats in self.summary(since=since).items()
+        )
+
+    def trace_config(self, prefix: str) -> aiohttp.TraceConfig:
+        """
+        Builds an aiohttp trace config that records the HTTP phases of every request.
+
+        Recorded phases (all labelled with the request `host`):
+        - `{prefix}.connect`: Opening a new connection, absent when a pooled one is reused
+        - `{prefix}.ttfb`: Request start until the response headers arrived, with `bytes_sent`
+        - `{prefix}.transfer`: Response headers until the body was read, with `bytes_received`
+
+        Args:
+            prefix: The phase name prefix, e.g. "dendrite" or "api"
+        """
+
+        async def on_request_start(session, ctx, params):
+            ctx.start = time.perf_counter()
+            ctx.headers_at = None
+            ctx.bytes_sent = 0
+            ctx.host = f"{params.url.host}:{params.url.port}"
+
+        async def on_connection_create_start(session, ctx, params):
+            ctx.connect_start = time.perf_counter()
+
+        async def on_connection_create_end(session, ctx, params):
+            self.record(
+                f"{prefix}.connect",
+                time.perf_counter() - ctx.connect_start,
+                host=ctx.host,
+            )
+
+        async def on_request_chunk_sent(session, ctx, params):
+            ctx.bytes_sent += len(params.chunk)
+
+        async def on_request_end(session, ctx, params):
+            ctx.headers_at = time.perf_counter()
+            self.record(
+                f"{prefix}.ttfb",
+                ctx.headers_at - ctx.start,
+                host=ctx.host,
+                bytes_sent=ctx.bytes_sent,
+            )
+
+        async def on_response_chunk_received(session, ctx, params):
+            if ctx.headers_at is not None:
+                self.record(
+                    f"{prefix}.transfer",
+                    time.perf_counter() - ctx.headers_at,
+                    host=ctx.host,
+                    bytes_received=len(params.chunk),
+                )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_response_chunk_received.append(on_response_chunk_received)
+        return trace_config
+
+
+def timed(phase: str):
+    """
+    Decorator recording every call of a neuron method as a phase in `self.timings`.
+    Works for both plain and async methods.
+
+    Args:
+        phase: The phase name
+    """
+
+    def decorator(fn):
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.timings.measure(phase):
+                    return await fn(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            with self.timings.measure(phase):
+                return fn(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
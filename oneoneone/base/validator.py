@@ -18,13 +18,14 @@
 
 
 import copy
+import time
 import numpy as np
 import asyncio
 import argparse
 import threading
 import bittensor as bt
 
-from typing import List, Union
+from typing import List, Optional, Union
 from traceback import print_exception
 
 from oneoneone.base.neuron import BaseNeuron
@@ -32,7 +33,24 @@ from oneoneone.base.utils.weight_utils import (
     process_weights_for_netuid,
     convert_weights_and_uids_for_emit,
 )  # TODO: Replace when bittensor switches to numpy
+from oneoneone.base.utils.scheduler import RoundScheduler
+from oneoneone.base.utils.dendrite_pool import DendritePool
+from oneoneone.base.utils.timing import PhaseTimings, timed
+from oneoneone.base.utils.liveness import LivenessTracker
 from oneoneone.utils.config import add_validator_args
+from oneoneone.config import (
+    SYNAPSE_WAIT_TIME,
+    SYNC_INTERVAL,
+    DENDRITE_POOL_SIZE,
+    DENDRITE_CONNECTIONS_PER_AXON,
+    DENDRITE_KEEPALIVE,
+    DENDRITE_WARMUP_TIMEOUT,
+    MAX_RESPONSE_BYTES,
+    TIMING_WINDOW,
+    LIVENESS_FAILURE_THRESHOLD,
+    LIVENESS_BASE_BACKOFF,
+    LIVENESS_MAX_BACKOFF,
+)
 
 
 class BaseValidatorNeuron(BaseNeuron):
@@ -50,6 +68,9 @@ class BaseValidatorNeuron(BaseNeuron):
     def __init__(self, config=None):
         super().__init__(config=config)
 
+        # Rolling window of monotonic phase timings, see `self.timings.summary()`.
+        self.timings = PhaseTimings(window=TIMING_WINDOW)
+
         # Save a copy of the hotkeys to local memory.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
 
@@ -57,6 +78,24 @@ class BaseValidatorNeuron(BaseNeuron):
         self.dendrite = bt.dendrite(wallet=self.wallet)
         bt.logging.info(f"Dendrite: {self.dendrite}")
 
+        # Per-axon dendrites that keep connections warm across rounds.
+        self.dendrite_pool = DendritePool(
+            self.dendrite,
+            max_axons=DENDRITE_POOL_SIZE,
+            connections_per_axon=DENDRITE_CONNECTIONS_PER_AXON,
+            keepalive_timeout=DENDRITE_KEEPALIVE,
+            warmup_timeout=DENDRITE_WARMUP_TIMEOUT,
+            max_response_bytes=MAX_RESPONSE_BYTES,
+            trace_configs=[self.timings.trace_config("dendrite")],
+        )
+
+        # Per-UID query outcomes, so chronically dead axons are only probed on a backoff schedule.
+        self.liveness = LivenessTracker(
+            failure_threshold=LIVENESS_FAILURE_THRESHOLD,
+            base_backoff=LIVENESS_BASE_BACKOFF,
+            max_backoff=LIVENESS_MAX_BACKOFF,
+        )
+
         # Set up initial scoring weights for validation
         bt.logging.info("Building validation weights.")
         self.scores = np.zeros(self.metagraph.n, dtype=np.float32)
@@ -77,7 +116,18 @@ class BaseValidatorNeuron(BaseNeuron):
         self.should_exit: bool = False
         self.is_running: bool = False
         self.thread: Union[threading.Thread, None] = None
-        self.lock = asyncio.Lock()
+        # Guards scores and hotkeys: overlapping forwards update them on the event loop
+        # while sync() resizes and reads them from an executor thread.
+        self.lock = threading.RLock()
+
+        # Rounds fire on a fixed cadence; sync runs between them without blocking the loop.
+        self.scheduler = RoundScheduler(
+            round_fn=self.run_round,
+            sync_fn=self.sync,
+            interval=SYNAPSE_WAIT_TIME,
+            sync_interval=SYNC_INTERVAL,
+            should_exit=lambda: self.should_exit,
+        )
 
     def serve_axon(self):
         """Serve axon to enable external connections."""
@@ -108,14 +158,32 @@ class BaseValidatorNeuron(BaseNeuron):
         ]
         await asyncio.gather(*coroutines)
 
+    async def run_round(self):
+        """Runs one validation round of concurrent forwards and advances the step counter."""
+        bt.logging.info(f"step({self.step}) block({self.block})")
+        round_start = time.monotonic()
+
+        # Run multiple forwards concurrently.
+        with self.timings.measure("round.total", step=int(self.step)):
+            await self.concurrent_forward()
+
+        bt.logging.info(
+            f"Phase timings of step {self.step}:\n{self.timings.format_summary(since=round_start)}"
+        )
+        self.step += 1
+
+    @timed("sync")
+    def sync(self):
+        super().sync()
+
     def run(self):
         """
         Initiates and manages the main loop for the miner on the Bittensor network. The main loop handles graceful shutdown on keyboard interrupts and logs unforeseen errors.
 
         This function performs the following primary tasks:
         1. Check for registration on the Bittensor network.
-        2. Continuously forwards queries to the miners on the network, rewarding their responses and updating the scores accordingly.
-        3. Periodically resynchronizes with the chain; updating the metagraph with the latest network state and setting weights.
+        2. Starts a round of forwards every SYNAPSE_WAIT_TIME seconds (measured from round start), rewarding the responses and updating the scores accordingly.
+        3. Periodically resynchronizes with the chain between rounds; updating the metagraph with the latest network state and setting weights.
 
         The essence of the validator's operations is in the forward function, which is called every step. The forward function is responsible for querying the network and scoring the responses.
 
@@ -132,39 +200,49 @@ class BaseValidatorNeuron(BaseNeuron):
         self.sync()
 
         bt.logging.info(f"Validator starting at block: {self.block}")
+        self.loop.run_until_complete(self.startup())
 
-        # This loop maintains the validator's operations until intentionally stopped.
-        while True:
+        try:
+            # This loop maintains the validator's operations until intentionally stopped.
+            while not self.should_exit:
+                try:
+                    # Fire rounds and sync the metagraph on the event loop until asked to exit.
+                    self.loop.run_until_complete(self.scheduler.run())
+
+                # If someone intentionally stops the validator, it'll safely terminate operations.
+                except KeyboardInterrupt:
+                    self.axon.stop()
+                    bt.logging.success("Validator killed by keyboard interrupt.")
+                    exit()
+
+                # In case of unforeseen errors, the validator will log the error and continue operations.
+                except Exception as err:
+                    bt.logging.error(f"Error during validation: {str(err)}")
+                    bt.logging.debug(
+                        str(print_exception(type(err), err, err.__traceback__))
+                    )
+                    # Continue to next iteration of the loop
+                    bt.logging.info("Continuing to next validation step after error...")
+                    continue
+        finally:
+            # Release background tasks and connections on the loop they belong to
             try:
-                bt.logging.info(f"step({self.step}) block({self.block})")
-
-                # Run multiple forwards concurrently.
-                self.loop.run_until_complete(self.concurrent_forward())
-
-                # Check if we should exit.
-                if self.should_exit:
-                    break
-
-                # Sync metagraph and potentially set weights.
-                self.sync()
-
-                self.step += 1
+                self.loop.run_until_complete(self.shutdown())
+            except Exception as err:
+                bt.logging.error(f"Error during validator shutdown: {str(err)}")
 
-            # If someone intentionally stops the validator, it'll safely terminate operations.
-            except KeyboardInterrupt:
-                self.axon.stop()
-                bt.logging.success("Validator killed by keyboard interrupt.")
-                exit()
+    async def startup(self):
+        """
+        Starts background work on the event loop before the first round.
+        Subclasses extend this with their own resources.
+        """
 
-            # In case of unforeseen errors, the validator will log the error and continue operations.
-            except Exception as err:
-                bt.logging.error(f"Error during validation: {str(err)}")
-                bt.logging.debug(
-                    str(print_exception(type(err), err, err.__traceback__))
-                )
-                # Continue to next iteration of the loop
-                bt.logging.info("Continuing to next validation step after error...")
-                continue
+    async def shutdown(self):
+        """
+        Stops background work and closes the validator's connections once the run loop exits.
+        Subclasses extend this with their own resources.
+        """
+        await self.dendrite_pool.close()
 
     def run_in_background_thread(self):
         """
@@ -214,13 +292,18 @@ class BaseValidatorNeuron(BaseNeuron):
             self.is_running = False
             bt.logging.debug("Stopped")
 
+    @timed("set_weights")
     def set_weights(self):
         """
         Sets the validator weights to the metagraph hotkeys based on the scores it has received from the miners. The weights determine the trust and incentive level the validator assigns to miner nodes on the network.
         """
 
-        # Check if self.scores contains any NaN values and log a warning if it does.
-        if np.isnan(self.scores).any():
+        # Snapshot the scores so concurrent rounds can keep updating them.
+        with self.lock:
+            scores = np.copy(self.scores)
+
+        # Check if scores contains any NaN values and log a warning if it does.
+        if np.isnan(scores).any():
             bt.logging.warning(
                 f"Scores contain NaN values. This may be due to a lack of responses from miners, or a bug in your reward functions."
             )
@@ -228,14 +311,14 @@ class BaseValidatorNeuron(BaseNeuron):
         # Calculate the average reward for each uid across non-zero values.
         # Replace any NaN values with 0.
         # Compute the norm of the scores
-        norm = np.linalg.norm(self.scores, ord=1, axis=0, keepdims=True)
+        norm = np.linalg.norm(scores, ord=1, axis=0, keepdims=True)
 
         # Check if the norm is zero or contains NaN values
         if np.any(norm == 0) or np.isnan(norm).any():
             norm = np.ones_like(norm)  # Avoid division by zero or NaN
 
         # Compute raw_weights safely
-        raw_weights = self.scores / norm
+        raw_weights = scores / norm
 
         bt.logging.debug("raw_weights", raw_weights)
         bt.logging.debug("raw_weight_uids", str(self.metagraph.uids.tolist()))
@@ -294,25 +377,58 @@ class BaseValidatorNeuron(BaseNeuron):
         bt.logging.info(
             "Metagraph updated, re-syncing hotkeys, dendrite pool and moving averages"
         )
-        # Zero out all hotkeys that have been replaced.
-        for uid, hotkey in enumerate(self.hotkeys):
-            if hotkey != self.metagraph.hotkeys[uid]:
-                self.scores[uid] = 0  # hotkey has been replaced
-
-        # Check to see if the metagraph has changed size.
-        # If so, we need to add new hotkeys and moving averages.
-        if len(self.hotkeys) < len(self.metagraph.hotkeys):
-            # Update the size of the moving average scores.
-            new_moving_average = np.zeros((self.metagraph.n))
-            min_len = min(len(self.hotkeys), len(self.scores))
-            new_moving_average[:min_len] = self.scores[:min_len]
-            self.scores = new_moving_average
-
-        # Update the hotkeys.
-        self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
+        # Close connections to axons that were deregistered or changed endpoint.
+        current_axons = set(map(DendritePool.key, self.metagraph.axons))
+        self.dendrite_pool.evict(
+            axon
+            for axon in previous_metagraph.axons
+            if DendritePool.key(axon) not in current_axons
+        )
+
+        # Give UIDs with a new axon endpoint or hotkey a clean liveness record.
+        previous_axons = previous_metagraph.axons
+        self.liveness.reset(
+            uid
+            for uid, axon in enumerate(self.metagraph.axons)
+            if uid >= len(previous_axons)
+            or DendritePool.key(axon) != DendritePool.key(previous_axons[uid])
+        )
+
+        with self.lock:
+            # Zero out all hotkeys that have been replaced.
+            for uid, hotkey in enumerate(self.hotkeys):
+                if hotkey != self.metagraph.hotkeys[uid]:
+                    self.scores[uid] = 0  # hotkey has been replaced
+
+            # Check to see if the metagraph has changed size.
+            # If so, we need to add new hotkeys and moving averages.
+            if len(self.hotkeys) < len(self.metagraph.hotkeys):
+                # Update the size of the moving average scores.
+                new_moving_average = np.zeros((self.metagraph.n))
+                min_len = min(len(self.hotkeys), len(self.scores))
+                new_moving_average[:min_len] = self.scores[:min_len]
+                self.scores = new_moving_average
+
+            # Update the hotkeys.
+            self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
+
+    @timed("round.update_scores")
+    def update_scores(
+        self,
+        rewards: np.ndarray,
+        uids: List[int],
+        hotkeys: Optional[List[str]] = None,
+    ):
+        """
+        Performs exponential moving average on the scores based on the rewards received from the miners.
+        Safe to call from overlapping rounds: the update is applied under `self.lock`.
 
-    def update_scores(self, rewards: np.ndarray, uids: List[int]):
-        """Performs exponential moving average on the scores based on the rewards received from the miners."""
+        Args:
+            rewards: The rewards of the round, ordered like `uids`
+            uids: The UIDs of the rewarded miners
+            hotkeys: The hotkeys of `uids` when the round started. UIDs whose hotkey has
+                been replaced since then are skipped instead of rewarding the new owner.
+        """
 
         # Check if rewards contains NaN values.
         if np.isnan(rewards).any():
@@ -344,29 +460,47 @@ class BaseValidatorNeuron(BaseNeuron):
                 f"cannot be broadcast to uids array of shape {uids_array.shape}"
             )
 
-        # Compute forward pass rewards, assumes uids are mutually exclusive.
-        # shape: [ metagraph.n ]
-        scattered_rewards: np.ndarray = np.zeros_like(self.scores)
-        scattered_rewards[uids_array] = rewards
-        bt.logging.debug(f"Scattered rewards: {rewards}")
-
-        # Update scores with rewards produced by this step.
-        # shape: [ metagraph.n ]
-        alpha: float = self.config.neuron.moving_average_alpha
-        self.scores: np.ndarray = alpha * scattered_rewards + (1 - alpha) * self.scores
-        bt.logging.debug(f"Updated moving avg scores: {self.scores}")
+        with self.lock:
+            # Drop rewards for UIDs that changed owner while the round was running.
+            if hotkeys is not None:
+                unchanged = np.array(
+                    [
+                        uid < len(self.hotkeys) and self.hotkeys[uid] == hotkey
+                        for uid, hotkey in zip(uids_array, hotkeys)
+                    ],
+                    dtype=bool,
+                )
+                if not unchanged.all():
+                    bt.logging.warning(
+                        f"Skipping rewards for replaced hotkeys at UIDs: {uids_array[~unchanged].tolist()}"
+                    )
+                    rewards = rewards[unchanged]
+                    uids_array = uids_array[unchanged]
+
+            # Compute forward pass rewards, assumes uids are mutually exclusive.
+            # shape: [ metagraph.n ]
+            scattered_rewards: np.ndarray = np.zeros_like(self.scores)
+            scattered_rewards[uids_array] = rewards
+            bt.logging.debug(f"Scattered rewards: {rewards}")
+
+            # Update scores with rewards produced by this step.
+            # shape: [ metagraph.n ]
+            alpha: float = self.config.neuron.moving_average_alpha
+            self.scores: np.ndarray = alpha * scattered_rewards + (1 - alpha) * self.scores
+            bt.logging.debug(f"Updated moving avg scores: {self.scores}")
 
     def save_state(self):
         """Saves the state of the validator to a file."""
         bt.logging.info("Saving validator state.")
 
         # Save the state of the validator to file.
-        np.savez(
-            self.config.neuron.full_path + "/state.npz",
-            step=self.step,
-            scores=self.scores,
-            hotkeys=self.hotkeys,
-        )
+        with self.lock:
+            np.savez(
+                self.config.neuron.full_path + "/state.npz",
+                step=self.step,
+                scores=self.scores,
+                hotkeys=self.hotkeys,
+            )
 
     def load_state(self):
         """Loads the state of the validator from a file."""
@@ -24,11 +24,90 @@ Shared configuration settings for oneoneone subnet components
 VALIDATOR_API_TIMEOUT = 180  # Timeout for calls to validator Node.js API (allows for retries and processing)
 SYNAPSE_TIMEOUT = 120  # Timeout for synapse queries between validators and miners
 
+# Validator Node.js API connection pool
+VALIDATOR_API_MAX_CONNECTIONS = 8  # Maximum pooled connections to the validator Node.js API
+VALIDATOR_API_KEEPALIVE = 30  # Seconds an idle pooled connection is kept open for reuse
+VALIDATOR_API_COMPRESSION = "gzip"  # Content-Encoding of request bodies to the Node.js API, None to send them as plain JSON
+VALIDATOR_API_COMPRESS_MIN_BYTES = 32 * 1024  # Request bodies smaller than this are sent uncompressed
+VALIDATOR_API_COMPRESS_LEVEL = 1  # gzip level, the fastest one since the Node.js API runs on the same host
+
+# Round deadline
+ROUND_TIMEOUT = 60 * 5  # End-to-end budget of a validation round, from miner selection to score update
+ROUND_SCORING_RESERVE = 60  # Part of the round budget kept for finalizing scores after the query window
+
+# Dendrite connection pool
+DENDRITE_POOL_SIZE = 256  # Maximum number of axons with warm connections kept across rounds
+DENDRITE_CONNECTIONS_PER_AXON = 4  # Maximum concurrent connections to a single axon
+DENDRITE_KEEPALIVE = 75  # Seconds an idle connection to an axon is kept open for reuse
+DENDRITE_WARMUP_TIMEOUT = 5  # Deadline for pre-opening a connection to an axon before a round
+
+# Phase timing instrumentation
+TIMING_WINDOW = 1000  # Number of most recent samples kept per instrumented phase
+
+# Miner liveness backoff
+LIVENESS_FAILURE_THRESHOLD = 3  # Consecutive failed queries before a miner is probed on a backoff schedule
+LIVENESS_BASE_BACKOFF = 60 * 30  # Seconds a miner is skipped after reaching the failure threshold, doubled per further failure
+LIVENESS_MAX_BACKOFF = 60 * 60 * 6  # Upper bound of the liveness backoff (seconds)
+
 # Miner selection configuration
 MAX_MINER_COUNT = 50  # Maximum number of miners to query in each validation round
+QUERY_ALL_MINERS = False  # Query every available UID each round instead of sampling MAX_MINER_COUNT
+
+# Query fan-out limits
+MAX_CONCURRENT_QUERIES = 64  # Maximum dendrite queries in flight at the same time
+QUERY_LAUNCH_BATCH = 16  # Number of queries started per launch stage
+QUERY_LAUNCH_INTERVAL = 0.5  # Seconds between launch stages, spreads connection setup
+ROUND_MEMORY_BUDGET = 256 * 1024 * 1024  # Bytes of reserved and received responses a round may hold before pausing launches
+
+# Miner response processing
+MAX_RESPONSE_BYTES = 8 * 1024 * 1024  # Largest miner response body the validator reads
+MAX_RESPONSE_REVIEWS = 500  # Most reviews accepted in one miner response (miners fetch 200)
+MAX_REVIEW_FIELD_LENGTH = 20000  # Longest string accepted in any review field
+
+# Scoring
+LOCAL_SCORING = True  # Compute speed/volume/recency scores in the validator, the Node.js API only verifies spot checks
+SUMMARY_PAYLOADS = True  # Send per-miner counts, dates and sampled spot check reviews instead of full responses
+SPOT_CHECK_COUNT = 3  # Reviews sampled per miner for spot checks, keep in line with SPOT_CHECK_COUNT in node/config.js
+CONTENT_ADDRESSED_PAYLOADS = True  # Send each distinct review once per scoring request or session, referenced by content hash
+
+# Trust-adaptive spot checks
+SPOT_CHECK_MIN_COUNT = 1  # Reviews spot checked per round for miners with a long record of passed verifications
+SPOT_CHECK_MAX_COUNT = 6  # Reviews spot checked per round for new or recently failing miners
+TRUST_NEW_ROUNDS = 3  # Verified rounds before a hotkey is no longer treated as new
+TRUST_STREAK = 10  # Consecutive passed verifications before a hotkey is trusted
+TRUST_MIN_AGE = 60 * 60 * 24  # Seconds since a hotkey was first verified before it can be trusted
+TRUST_RECOVERY_ROUNDS = 5  # Consecutive passed verifications after a failure before the extra checks stop
+TRUST_AUDIT_RATE = 0.1  # Probability that a trusted miner still gets the base SPOT_CHECK_COUNT in a round
+TRUST_STATE_FILE = "trust.json"  # JSON file under the neuron directory, None to keep trust records in memory only
+
+# Reference fetch
+REFERENCE_FETCH = True  # Fetch the place's newest reviews while miners are queried and verify miner reviews against them
+
+# Consensus verification
+CONSENSUS_VERIFICATION = False  # Skip external spot checks of review records enough unrelated miners returned identically
+CONSENSUS_QUORUM = 3  # Distinct miner coldkeys that must return a record identically for it to count as agreed
+
+# Near-duplicate review text detection
+NEAR_DUPLICATE_DETECTION = True  # Flag verified reviews whose text nearly matches another review, across miners and rounds
+NEAR_DUPLICATE_PERMUTATIONS = 64  # MinHash values per review text signature
+NEAR_DUPLICATE_BANDS = 8  # LSH bands of a signature, must divide NEAR_DUPLICATE_PERMUTATIONS
+NEAR_DUPLICATE_SHINGLE_SIZE = 5  # Characters per text shingle
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard similarity from which two texts are near duplicates
+NEAR_DUPLICATE_MIN_TEXT_LENGTH = 50  # Shorter texts are not indexed, short reviews legitimately repeat
+NEAR_DUPLICATE_MAX_ENTRIES = 50_000  # Most review texts indexed, the oldest are evicted first
+
+# Verified review cache
+VERIFIED_REVIEW_CACHE_FILE = "verified_reviews.db"  # SQLite file under the neuron directory, None to disable the cache
+VERIFIED_REVIEW_TTL = 60 * 60 * 24 * 7  # Seconds a verified review is trusted before it is spot checked again
+
+# Synthetic task prefetching
+TASK_QUEUE_SIZE = 2  # Number of synthetic tasks kept ready ahead of validation rounds
+TASK_MAX_AGE = 60 * 60  # Seconds after which a prefetched synthetic task is discarded as stale
+TASK_QUEUE_RETRY_DELAY = 30  # Seconds to wait before retrying a failed synthetic task creation
 
 # Timing configurations
-SYNAPSE_WAIT_TIME = 60 * 20  # Time to wait between validator forward passes (seconds)
+SYNAPSE_WAIT_TIME = 60 * 20  # Time between the starts of consecutive validator rounds (seconds)
+SYNC_INTERVAL = 60 * 2  # Time between metagraph sync / weight setting checks while idle (seconds)
 
 # Validator minimum stake
 VALIDATOR_MIN_STAKE = 1.024e3
@@ -20,6 +20,32 @@ import typing
 import bittensor as bt
 from typing import List, Dict, Optional
 
+try:
+    from pydantic import field_validator
+except ImportError:  # pydantic v1, used by bittensor < 7
+    from pydantic import validator as field_validator
+
+from oneoneone.config import MAX_RESPONSE_REVIEWS, MAX_REVIEW_FIELD_LENGTH
+
+
+class ResponseLimitError(ValueError):
+    """Raised when a miner response exceeds the configured size limits."""
+
+
+def longest_string(value: typing.Any) -> int:
+    """Returns the length of the longest string nested anywhere in a JSON value."""
+    longest = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            longest = max(longest, len(item))
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return longest
+
 
 class GoogleMapsReviewsSynapse(bt.Synapse):
     """
@@ -38,6 +64,10 @@ class GoogleMapsReviewsSynapse(bt.Synapse):
     - sort: Sort order for reviews ("newest", "relevant", "highest", "lowest")
     - timeout: Timeout for the request in seconds
     - reviews: List of review data returned by the miner (filled by miner)
+
+    Responses with more than MAX_RESPONSE_REVIEWS reviews or strings longer than
+    MAX_REVIEW_FIELD_LENGTH fail validation, so the dendrite marks the query as failed
+    with the reason in `dendrite.status_message`.
     """
 
     # Required request inputs (set by validator)
@@ -49,6 +79,26 @@ class GoogleMapsReviewsSynapse(bt.Synapse):
     # Response output (filled by miner)
     reviews: Optional[List[Dict[str, typing.Any]]] = None
 
+    @field_validator("reviews")
+    @classmethod
+    def check_limits(
+        cls, reviews: Optional[List[Dict[str, typing.Any]]]
+    ) -> Optional[List[Dict[str, typing.Any]]]:
+        """Rejects responses exceeding the review count or field length limits."""
+        if reviews is None:
+            return reviews
+        if len(reviews) > MAX_RESPONSE_REVIEWS:
+            raise ResponseLimitError(
+                f"Response limit exceeded: {len(reviews)} reviews, limit is {MAX_RESPONSE_REVIEWS}"
+            )
+        longest = longest_string(reviews)
+        if longest > MAX_REVIEW_FIELD_LENGTH:
+            raise ResponseLimitError(
+                f"Response limit exceeded: {longest} characters in a review field, "
+                f"limit is {MAX_REVIEW_FIELD_LENGTH}"
+            )
+        return reviews
+
     def deserialize(self) -> List[Dict[str, typing.Any]]:
         """
         Deserialize the reviews output for processing.
@@ -1,7 +1,8 @@
-import random
 import bittensor as bt
 import numpy as np
-from typing import List
+from typing import List, Set
+
+_rng = np.random.default_rng()
 
 
 def check_uid_availability(
@@ -26,6 +27,120 @@ def check_uid_availability(
     return True
 
 
+def get_available_uid_mask(self) -> np.ndarray:
+    """Returns the availability of every uid as a boolean mask, see `check_uid_availability`.
+    The mask is computed from the metagraph arrays and cached until the metagraph block changes.
+    Returns:
+        mask (np.ndarray): Boolean array of length metagraph.n, True for available uids.
+    """
+    metagraph = self.metagraph
+    vpermit_tao_limit = self.config.neuron.vpermit_tao_limit
+    key = (int(metagraph.block), int(metagraph.n), vpermit_tao_limit)
+
+    cached = getattr(self, "_available_uid_mask", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Filter non serving axons.
+    serving = np.fromiter(
+        (axon.is_serving for axon in metagraph.axons), dtype=bool, count=key[1]
+    )
+    # Filter validator permit > 1024 stake.
+    validator_permit = np.asarray(metagraph.validator_permit, dtype=bool)
+    stake = np.asarray(metagraph.S, dtype=np.float64)
+    mask = serving & ~(validator_permit & (stake > vpermit_tao_limit))
+    mask.setflags(write=False)
+
+    self._available_uid_mask = (key, mask)
+    return mask
+
+
+def get_available_uids(self) -> List[int]:
+    """Returns all available uids of the metagraph.
+    Returns:
+        uids (List[int]): Available uids, in ascending order.
+    """
+    return np.flatnonzero(get_available_uid_mask(self)).tolist()
+
+
+class CoverageScheduler:
+    """Plans miner selections so every available uid is evaluated within a bounded number of rounds.
+
+    Available uids are visited in a shuffled round-robin: each cycle is a fresh random permutation,
+    and selections take the next uids of the current cycle. With `k` uids per round, every uid that
+    is available when a cycle starts is selected within ceil(available / k) rounds, instead of
+    possibly going unsampled for many rounds under independent uniform sampling. Uids registered
+    mid-cycle join at the start of the next one.
+
+    Uids stay reserved from selection until `release()`, so concurrent forwards always receive
+    disjoint partitions of the metagraph.
+    """
+
+    def __init__(self, seed: int = None):
+        self.rng = np.random.default_rng(seed)
+        self.cycle = 0
+        self._order: List[int] = []
+        self._cursor = 0
+        self._in_flight: Set[int] = set()
+
+    def _start_cycle(self, available_uids: List[int]):
+        # Uids still in flight go last so they are not due while another round holds them.
+        order = self.rng.permutation(np.asarray(available_uids, dtype=int)).tolist()
+        self._order = [uid for uid in order if uid not in self._in_flight] + [
+            uid for uid in order if uid in self._in_flight
+        ]
+        self._cursor = 0
+        self.cycle += 1
+
+    def select(self, available_uids: List[int], k: int) -> np.ndarray:
+        """Selects the next k uids of the round-robin and reserves them.
+        Args:
+            available_uids (List[int]): Uids currently available for querying.
+            k (int): Number of uids to select.
+        Returns:
+            uids (np.ndarray): Selected uids, disjoint from every unreleased selection.
+        Notes:
+            Fewer than `k` uids are returned when not enough available uids are free.
+        """
+        available = set(available_uids) - self._in_flight
+        k = min(k, len(available))
+        selected: List[int] = []
+        cycles_started = 0
+
+        while len(selected) < k and cycles_started <= 1:
+            if self._cursor >= len(self._order):
+                self._start_cycle(available_uids)
+                cycles_started += 1
+            while self._cursor < len(self._order) and len(selected) < k:
+                uid = self._order[self._cursor]
+                self._cursor += 1
+                if uid in available and uid not in selected:
+                    selected.append(uid)
+
+        self._in_flight.update(selected)
+        return np.array(selected, dtype=int)
+
+    def release(self, uids: List[int]):
+        """Makes uids of a finished round selectable again.
+        Args:
+            uids (List[int]): The uids returned by `select()`.
+        """
+        self._in_flight.difference_update(int(uid) for uid in uids)
+
+    def requeue(self, uids: List[int]):
+        """Releases uids that were selected but never queried and puts them next in line.
+        Args:
+            uids (List[int]): Uids returned by `select()` whose round could not query them.
+        Notes:
+            The requeued uids are taken first by the next selection, so a round that runs out
+            of time does not cost them their turn in the cycle.
+        """
+        requeued = [int(uid) for uid in uids]
+        self.release(requeued)
+        remaining = [uid for uid in self._order[self._cursor :] if uid not in requeued]
+        self._order = self._order[: self._cursor] + requeued + remaining
+
+
 def get_random_uids(self, k: int, exclude: List[int] = None) -> np.ndarray:
     """Returns k available random uids from the metagraph.
     Args:
@@ -36,27 +151,24 @@ def get_random_uids(self, k: int, exclude: List[int] = None) -> np.ndarray:
     Notes:
         If `k` is larger than the number of available `uids`, set `k` to the number of available `uids`.
     """
-    candidate_uids = []
-    avail_uids = []
-
-    for uid in range(self.metagraph.n.item()):
-        uid_is_available = check_uid_availability(
-            self.metagraph, uid, self.config.neuron.vpermit_tao_limit
-        )
-        uid_is_not_excluded = exclude is None or uid not in exclude
+    avail_uids = np.flatnonzero(get_available_uid_mask(self))
+    if exclude:
+        excluded = np.isin(avail_uids, np.fromiter(set(exclude), dtype=np.int64))
+    else:
+        excluded = np.zeros(len(avail_uids), dtype=bool)
+    candidate_uids = avail_uids[~excluded]
 
-        if uid_is_available:
-            avail_uids.append(uid)
-            if uid_is_not_excluded:
-                candidate_uids.append(uid)
     # If k is larger than the number of available uids, set k to the number of available uids.
     k = min(k, len(avail_uids))
     # Check if candidate_uids contain enough for querying, if not grab all avaliable uids
-    available_uids = candidate_uids
     if len(candidate_uids) < k:
-        available_uids += random.sample(
-            [uid for uid in avail_uids if uid not in candidate_uids],
-            k - len(candidate_uids),
+        candidate_uids = np.concatenate(
+            [
+                candidate_uids,
+                _rng.choice(
+                    avail_uids[excluded], k - len(candidate_uids), replace=False
+                ),
+            ]
         )
-    uids = np.array(random.sample(available_uids, k))
+    uids = _rng.choice(candidate_uids, k, replace=False)
     return uids
@@ -1,2 +1 @@
 from .forward import forward
-from .reward import get_rewards
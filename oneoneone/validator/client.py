@@ -0,0 +1,197 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import gzip
+import json
+import time
+import asyncio
+import aiohttp
+import bittensor as bt
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
+
+from oneoneone.base.utils.timing import PhaseTimings
+from oneoneone.config import (
+    VALIDATOR_API_TIMEOUT,
+    VALIDATOR_API_MAX_CONNECTIONS,
+    VALIDATOR_API_KEEPALIVE,
+    VALIDATOR_API_COMPRESSION,
+    VALIDATOR_API_COMPRESS_MIN_BYTES,
+    VALIDATOR_API_COMPRESS_LEVEL,
+)
+
+# Environment variables for Node.js validator API connection
+VALIDATOR_NODE_HOST = os.getenv("VALIDATOR_NODE_HOST", "localhost")
+VALIDATOR_NODE_PORT = int(os.getenv("VALIDATOR_NODE_PORT", 3002))
+
+
+class ValidatorApiClient:
+    """
+    Shared, long-lived async client for the validator Node.js API.
+
+    A single keep-alive connection pool is reused by every forward pass, so calls to the
+    Node.js API never block the event loop and concurrent forwards overlap instead of
+    queueing behind each other. Each call carries its own deadline and can be cancelled
+    by cancelling the awaiting task.
+
+    The underlying aiohttp session is created lazily on first use so that it is bound
+    to the event loop the validator actually runs on.
+
+    Payloads are serialized once. Bodies of at least `compress_min_bytes` are gzip compressed
+    in a worker thread and sent with `Content-Encoding: gzip`, which the Express JSON parser
+    inflates. If the Node.js API rejects the encoding (415), compression is turned off for the
+    client and the call is retried with the plain JSON body.
+
+    When `timings` is given, payload encoding (`api.encode`, with the JSON size in
+    `bytes_encoded` and the body size in `bytes_sent`), whole calls (`api.request`) and their
+    HTTP phases (`api.connect`, `api.ttfb`, `api.transfer`) are recorded per path.
+    """
+
+    def __init__(
+        self,
+        host: str = VALIDATOR_NODE_HOST,
+        port: int = VALIDATOR_NODE_PORT,
+        max_connections: int = VALIDATOR_API_MAX_CONNECTIONS,
+        keepalive_timeout: float = VALIDATOR_API_KEEPALIVE,
+        timings: Optional[PhaseTimings] = None,
+        compression: Optional[str] = VALIDATOR_API_COMPRESSION,
+        compress_min_bytes: int = VALIDATOR_API_COMPRESS_MIN_BYTES,
+        compress_level: int = VALIDATOR_API_COMPRESS_LEVEL,
+    ):
+        self.base_url = f"http://{host}:{port}"
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.timings = timings
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+        self.compress_level = compress_level
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def session(self) -> aiohttp.ClientSession:
+        """
+        Returns the pooled client session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: The shared session for the validator Node.js API
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                base_url=self.base_url,
+                connector=connector,
+                trace_configs=(
+                    [self.timings.trace_config("api")] if self.timings else None
+                ),
+            )
+        return self._session
+
+    def _measure(self, phase: str, **fields: Any):
+        """Measures a phase in `timings`, or does nothing when timing is disabled."""
+        if self.timings is None:
+            return nullcontext(fields)
+        return self.timings.measure(phase, **fields)
+
+    async def post(
+        self,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: float = VALIDATOR_API_TIMEOUT,
+    ) -> Dict[str, Any]:
+        """
+        POST a JSON payload to the validator Node.js API and return the decoded response.
+
+        Args:
+            path: Endpoint path, e.g. "/create-synthetic-task"
+            payload: JSON-serializable request body
+            timeout: Deadline for the whole call (connect, send and read) in seconds
+
+        Returns:
+            dict: The decoded JSON response
+
+        Raises:
+            aiohttp.ClientError: If the request fails or returns a non-2xx status
+            asyncio.TimeoutError: If the deadline expires before the response is read,
+                or `timeout` is not positive
+        """
+        # aiohttp treats a zero total timeout as no timeout at all
+        if timeout <= 0:
+            raise asyncio.TimeoutError(f"No time left to call {path}")
+        deadline = time.monotonic() + timeout
+
+        body = None
+        headers = {}
+        if payload is not None:
+            with self._measure("api.encode", path=path) as fields:
+                body = json.dumps(payload).encode("utf-8")
+                headers["Content-Type"] = "application/json"
+                fields["bytes_encoded"] = len(body)
+                if self.compression == "gzip" and len(body) >= self.compress_min_bytes:
+                    plain = body
+                    body = await asyncio.get_event_loop().run_in_executor(
+                        None, gzip.compress, plain, self.compress_level
+                    )
+                    headers["Content-Encoding"] = "gzip"
+                fields["bytes_sent"] = len(body)
+
+        try:
+            return await self._send(path, body, headers, deadline)
+        except aiohttp.ClientResponseError as e:
+            if e.status != 415 or "Content-Encoding" not in headers:
+                raise
+            bt.logging.warning(
+                f"Validator API rejected {headers['Content-Encoding']} request bodies, "
+                "sending plain JSON from now on"
+            )
+            self.compression = None
+            del headers["Content-Encoding"]
+            return await self._send(path, plain, headers, deadline)
+
+    async def _send(
+        self,
+        path: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        deadline: float,
+    ) -> Dict[str, Any]:
+        """Sends an encoded body and decodes the JSON response, see `post`."""
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            raise asyncio.TimeoutError(f"No time left to call {path}")
+
+        session = await self.session()
+        with self._measure("api.request", path=path) as fields:
+            async with session.post(
+                path,
+                data=body,
+                headers=headers or None,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
+                fields["bytes_received"] = response.content_length
+                return result
+
+    async def close(self):
+        """Closes the pooled session and releases all kept-alive connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
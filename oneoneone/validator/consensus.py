@@ -0,0 +1,112 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from collections import defaultdict
+from typing import Any, Dict, List, Set
+
+from oneoneone.config import CONSENSUS_QUORUM
+from oneoneone.validator.decode import parse_date, review_key
+
+# Review fields the Node.js spot check compares, see validateMinerAgainstBatch
+CONSENSUS_FIELDS = (
+    "reviewId",
+    "fid",
+    "reviewerId",
+    "placeId",
+    "text",
+    "publishedAtDate",
+    "lastEditedAtDate",
+)
+
+
+class ReviewConsensus:
+    """
+    Tracks which review records independent miners agree on within one round.
+
+    Honest miners scraping the same place return the same records, so a record that
+    `quorum` unrelated miners (distinct owners, e.g. coldkeys) returned with identical
+    spot checked fields is taken as verified instead of being fetched through the scraper
+    actor again. A `reviewId` returned in more than one version is disputed and always
+    verified externally, as are records with fewer supporters than the quorum.
+
+    Responses are added as they arrive, so a record only becomes agreed once enough
+    miners returned it: the first miners of a round are spot checked as before and the
+    savings come from the later ones.
+
+    Attributes:
+    - quorum: Distinct owners needed for a record to count as agreed
+    """
+
+    def __init__(self, quorum: int = CONSENSUS_QUORUM):
+        self.quorum = quorum
+        self._owners: Dict[str, Set[str]] = defaultdict(set)
+        self._versions: Dict[str, Set[str]] = defaultdict(set)
+        self._records: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, owner: str, reviews: List[Dict[str, Any]]):
+        """
+        Records the reviews one miner returned.
+
+        Args:
+            owner: Identity of the miner operator, reviews of the same owner count once
+            reviews: The structurally valid, deduplicated reviews of the miner
+        """
+        for review in reviews:
+            record = {field: review.get(field) for field in CONSENSUS_FIELDS}
+            key = review_key(record)
+            self._owners[key].add(owner)
+            self._versions[record["reviewId"]].add(key)
+            self._records.setdefault(key, record)
+
+    def is_agreed(self, review: Dict[str, Any]) -> bool:
+        """Returns whether a review is backed by the quorum and not disputed."""
+        record = {field: review.get(field) for field in CONSENSUS_FIELDS}
+        key = review_key(record)
+        return (
+            len(self._owners.get(key, ())) >= self.quorum
+            and len(self._versions.get(record["reviewId"], ())) == 1
+            # The spot check compares lastEditedAtDate, records without one are verified
+            and isinstance(record["lastEditedAtDate"], str)
+            and parse_date(record["lastEditedAtDate"]) is not None
+        )
+
+    def agreed(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Returns the agreed reviews among `reviews` in the shape of spot check results.
+
+        The Node.js spot check actor reports the last edit date as `publishedAtDate`, so the
+        agreed records are returned the same way and can be sent as `verifiedReviews`.
+
+        Args:
+            reviews: The reviews of a miner selected for spot checks
+
+        Returns:
+            list: A verified record per agreed review
+        """
+        return [
+            {
+                "reviewId": review["reviewId"],
+                "fid": review.get("fid"),
+                "reviewerId": review.get("reviewerId"),
+                "placeId": review.get("placeId"),
+                "text": review.get("text"),
+                "publishedAtDate": review["lastEditedAtDate"],
+            }
+            for review in reviews
+            if self.is_agreed(review)
+        ]
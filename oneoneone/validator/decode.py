@@ -0,0 +1,252 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import json
+import random
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union
+
+from oneoneone.config import SPOT_CHECK_COUNT
+from oneoneone.validator.sampling import SpotCheckSampler
+
+# Required review fields and their JSON types, mirroring `prepareResponses` on the Node.js side
+REQUIRED_REVIEW_FIELDS = (
+    ("reviewerId", str),
+    ("reviewerUrl", str),
+    ("reviewerName", str),
+    ("reviewId", str),
+    ("reviewUrl", str),
+    ("publishedAtDate", str),
+    ("placeId", str),
+    ("cid", str),
+    ("fid", str),
+    ("totalScore", (int, float)),
+)
+
+
+def parse_date(value: str) -> Optional[datetime]:
+    """
+    Parses an ISO 8601 date as sent by miners, None if it cannot be parsed.
+
+    Dates without an offset are taken as UTC, so naive and aware dates of one
+    response stay comparable.
+    """
+    try:
+        date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
+
+
+def is_valid_review(review: Any, fid: str) -> bool:
+    """
+    Checks a single review for the required fields, their types and the queried fid.
+
+    Args:
+        review: A review as returned by a miner
+        fid: The queried Google Maps place identifier
+
+    Returns:
+        bool: True if the review is structurally valid
+    """
+    if not isinstance(review, dict):
+        return False
+    for name, expected_type in REQUIRED_REVIEW_FIELDS:
+        value = review.get(name)
+        # bool is an int subclass in Python but not a number in JSON
+        if not isinstance(value, expected_type) or isinstance(value, bool):
+            return False
+    return review["fid"] == fid
+
+
+def review_key(review: Dict[str, Any]) -> str:
+    """
+    Content hash of a review, identical for identical records returned by different miners.
+
+    The review is normalized to JSON with sorted keys before hashing, so key order does not matter.
+
+    Args:
+        review: A review as returned by a miner
+
+    Returns:
+        str: A 32 character hex digest
+    """
+    normalized = json.dumps(
+        review, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def intern_reviews(
+    reviews: List[Dict[str, Any]], store: Dict[str, Dict[str, Any]]
+) -> List[str]:
+    """
+    Adds reviews to a content-addressed store and returns references to them.
+
+    Args:
+        reviews: The reviews of one miner
+        store: Distinct reviews by `review_key`, shared across the miners of a request
+
+    Returns:
+        list: The `review_key` of each review, in order
+    """
+    keys = []
+    for review in reviews:
+        key = review_key(review)
+        store.setdefault(key, review)
+        keys.append(key)
+    return keys
+
+
+def select_spot_check_reviews(
+    reviews: List[Dict[str, Any]],
+    count: int = SPOT_CHECK_COUNT,
+    rng: Optional[random.Random] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Samples the reviews to spot check, like `getReviewsForSpotCheck` on the Node.js side.
+
+    The most recent review always comes first, the others are drawn uniformly at random from
+    the rest in a single pass, see `SpotCheckSampler`.
+
+    Args:
+        reviews: Structurally valid, deduplicated reviews
+        count: Number of reviews to sample
+        rng: Random number generator of the sample, a fresh one if None
+
+    Returns:
+        list: At most `count` reviews, most recent first
+    """
+    sampler = SpotCheckSampler(count, rng)
+    for review in reviews:
+        sampler.add(review, parse_date(review["publishedAtDate"]))
+    return sampler.sample()
+
+
+def summarize_response(
+    fid: str,
+    response: Union[bytes, str, List[Dict[str, Any]], None],
+    spot_check_count: int = SPOT_CHECK_COUNT,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Decodes, deduplicates and structurally validates one miner response.
+
+    Applies the same rules as `prepareResponses` on the Node.js side: duplicate `reviewId`s
+    are removed (keeping the first position and the last occurrence), and a single invalid
+    review fails the whole response.
+
+    Args:
+        fid: The queried Google Maps place identifier
+        response: The raw JSON body or the already decoded list of reviews
+        spot_check_count: Number of reviews to sample for spot checks
+        seed: Seed of the spot check sample, None for an unpredictable one
+
+    Returns:
+        dict: A compact summary with
+        - passedValidation: Whether the response passed structural validation
+        - validationError: The reason it failed, None if it passed
+        - reviews: The deduplicated reviews
+        - received / count / duplicates / invalid: Review counts
+        - mostRecentDate: The latest `publishedAtDate`, None without valid dates
+        - spotCheckReviews: The reviews sampled by a `SpotCheckSampler`, most recent first
+        - spotCheckCount: The number of reviews the response was sampled for
+    """
+    if isinstance(response, (bytes, str)):
+        try:
+            response = json.loads(response)
+        except ValueError:
+            response = None
+
+    summary = {
+        "passedValidation": False,
+        "validationError": None,
+        "reviews": [],
+        "received": 0,
+        "count": 0,
+        "duplicates": 0,
+        "invalid": 0,
+        "mostRecentDate": None,
+        "spotCheckReviews": [],
+        "spotCheckCount": spot_check_count,
+    }
+
+    if not isinstance(response, list):
+        summary["validationError"] = "Response is not an array"
+        return summary
+    if len(response) == 0:
+        summary["validationError"] = "Response is empty"
+        return summary
+
+    # Only string reviewIds are deduplicated, any other review is kept on its own so it
+    # fails the structural checks instead of breaking the dedupe
+    unique = {}
+    for index, review in enumerate(response):
+        review_id = review.get("reviewId") if isinstance(review, dict) else None
+        unique[review_id if isinstance(review_id, str) else index] = review
+    reviews = [review for review in unique.values()]
+
+    # Validate, parse dates and sample the spot check reviews in a single pass
+    sampler = SpotCheckSampler(spot_check_count, random.Random(seed))
+    invalid = 0
+    for review in reviews:
+        if is_valid_review(review, fid):
+            sampler.add(review, parse_date(review["publishedAtDate"]))
+        else:
+            invalid += 1
+    summary.update(
+        reviews=reviews,
+        received=len(response),
+        count=len(reviews),
+        duplicates=len(response) - len(reviews),
+        invalid=invalid,
+    )
+    if invalid:
+        summary["validationError"] = "Structural validation failed on review objects"
+        return summary
+
+    spot_check_reviews = sampler.sample()
+    if sampler.newest_date is not None:
+        summary["mostRecentDate"] = spot_check_reviews[0]["publishedAtDate"]
+    summary["spotCheckReviews"] = spot_check_reviews
+
+    summary["passedValidation"] = True
+    return summary
+
+
+def summary_payload(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds the scoring payload of one miner from its response summary.
+
+    Only the review count, the most recent date and the sampled spot check reviews are
+    sent, which is everything the Node.js side scores and verifies (see `prepareSummaries`).
+
+    Args:
+        summary: The response summary returned by `summarize_response`
+
+    Returns:
+        dict: The `count`, `mostRecentDate` and `spotCheckReviews` of the response
+    """
+    return {
+        "count": summary["count"] if summary["passedValidation"] else 0,
+        "mostRecentDate": summary["mostRecentDate"],
+        "spotCheckReviews": summary["spotCheckReviews"],
+    }
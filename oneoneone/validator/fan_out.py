@@ -0,0 +1,145 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Set
+
+
+class QueryFanOut:
+    """
+    Launches the miner queries of a round with bounded concurrency.
+
+    Queries start in stages of `launch_batch` every `launch_interval` seconds instead of all
+    at once, and at most `max_in_flight` run at the same time. Every query reserves
+    `reserve_bytes` (the largest response it may receive) before it goes out, and `settle()`
+    trades the reservation for the actual response size once it landed; no new query starts
+    while the reserved and held bytes of the round would exceed `memory_budget`. A
+    full-subnet round therefore never opens every socket at once or buffers every response
+    at its peak.
+
+    Response times are measured inside each query, so time spent waiting for a launch slot
+    is not charged to the miner. Queries cancelled before they got a slot never contacted
+    their miner, see `started()`.
+
+    Attributes:
+    - max_in_flight: Maximum number of queries running at the same time
+    - launch_batch: Number of queries released per launch stage
+    - launch_interval: Seconds between consecutive launch stages
+    - memory_budget: Maximum bytes of reserved and held responses before launches pause
+    - reserve_bytes: Bytes reserved for each query until its response is settled
+    - held_bytes: Bytes of responses currently reserved or held by the round
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        launch_batch: int,
+        launch_interval: float,
+        memory_budget: int,
+        reserve_bytes: int,
+    ):
+        self.max_in_flight = max_in_flight
+        self.launch_batch = max(launch_batch, 1)
+        self.launch_interval = launch_interval
+        self.memory_budget = memory_budget
+        self.reserve_bytes = reserve_bytes
+        self.held_bytes = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._memory_available = asyncio.Event()
+        self._memory_available.set()
+        self._started: Set[asyncio.Future] = set()
+        self._reserved: Dict[asyncio.Future, Callable[..., None]] = {}
+
+    def started(self, future: asyncio.Future) -> bool:
+        """Returns whether a launched query got its slot and started running."""
+        return future in self._started
+
+    def hold(self, nbytes: int) -> Callable[..., None]:
+        """
+        Accounts for response bytes until they are released.
+
+        Args:
+            nbytes: The size of the response in bytes
+
+        Returns:
+            Callable: Releases the bytes again, usable as a future done callback
+        """
+        self.held_bytes += nbytes
+
+        def release(*_):
+            self.held_bytes -= nbytes
+            self._memory_available.set()
+
+        return release
+
+    def settle(self, future: asyncio.Future, nbytes: int) -> Callable[..., None]:
+        """
+        Replaces the reservation of a finished query with the actual size of its response.
+
+        Args:
+            future: The future of the finished query, as returned by `launch()`
+            nbytes: The size of the received response in bytes, 0 if nothing was received
+
+        Returns:
+            Callable: Releases the response bytes again, usable as a future done callback
+        """
+        release = self.hold(nbytes)
+        unreserve = self._reserved.pop(future, None)
+        if unreserve is not None:
+            unreserve()
+        return release
+
+    def _over_budget(self) -> bool:
+        # A single query always fits, even if its reservation alone exceeds the budget
+        return (
+            self.held_bytes > 0
+            and self.held_bytes + self.reserve_bytes > self.memory_budget
+        )
+
+    async def _run(self, index: int, query: Callable[[], Awaitable[Any]]) -> Any:
+        """Waits for the launch stage, a slot and memory, then runs the query."""
+        await asyncio.sleep((index // self.launch_batch) * self.launch_interval)
+        async with self._slots:
+            while self._over_budget():
+                self._memory_available.clear()
+                await self._memory_available.wait()
+            task = asyncio.current_task()
+            self._started.add(task)
+            self._reserved[task] = self.hold(self.reserve_bytes)
+            try:
+                return await query()
+            except BaseException:
+                # Failed and cancelled queries never get settled
+                self._reserved.pop(task)()
+                raise
+
+    def launch(self, queries: List[Callable[[], Awaitable[Any]]]) -> List[asyncio.Future]:
+        """
+        Schedules the queries of a round.
+
+        Args:
+            queries: Zero-argument callables returning the query coroutines, in launch order
+
+        Returns:
+            List[asyncio.Future]: One future per query, in the same order. Cancelling a future
+            that has not launched yet also removes it from the launch schedule.
+        """
+        return [
+            asyncio.ensure_future(self._run(index, query))
+            for index, query in enumerate(queries)
+        ]
@@ -16,47 +16,56 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import os
 import time
-import requests
+import functools
 import bittensor as bt
 import asyncio
 
 from oneoneone.protocol import GoogleMapsReviewsSynapse
-from oneoneone.validator.reward import get_rewards
-from oneoneone.utils.uids import get_random_uids
+from oneoneone.validator.scoring_session import ScoringSession
+from oneoneone.validator.round_context import RoundContext
+from oneoneone.validator.fan_out import QueryFanOut
+from oneoneone.validator.decode import summarize_response
+from oneoneone.utils.uids import get_available_uids
 from oneoneone.config import (
     VALIDATOR_API_TIMEOUT,
     SYNAPSE_TIMEOUT,
-    SYNAPSE_WAIT_TIME,
     MAX_MINER_COUNT,
+    QUERY_ALL_MINERS,
+    MAX_CONCURRENT_QUERIES,
+    QUERY_LAUNCH_BATCH,
+    QUERY_LAUNCH_INTERVAL,
+    ROUND_MEMORY_BUDGET,
+    MAX_RESPONSE_BYTES,
+    ROUND_TIMEOUT,
+    ROUND_SCORING_RESERVE,
 )
 
-# Environment variables for Node.js validator API connection
-VALIDATOR_NODE_HOST = os.getenv("VALIDATOR_NODE_HOST", "localhost")
-VALIDATOR_NODE_PORT = int(os.getenv("VALIDATOR_NODE_PORT", 3002))
 
-
-async def create_synthetic_task():
+async def create_synthetic_task(self):
     """
     Create a synthetic validation task by calling the validator Node.js API.
     Generates a random Google Maps place for testing miners.
 
+    The request goes through the validator's shared async API client, so other
+    forward passes and dendrite traffic keep running while the place is discovered.
+
+    Args:
+        self: The validator instance holding the shared `api_client`
+
     Returns:
         dict: Task data including fid and synapse parameters
 
     Raises:
         Exception: If synthetic task creation fails
     """
-    validator_url = (
-        f"http://{VALIDATOR_NODE_HOST}:{VALIDATOR_NODE_PORT}/create-synthetic-task"
+    bt.logging.info(
+        f"Creating synthetic task via: {self.api_client.base_url}/create-synthetic-task"
     )
-    bt.logging.info(f"Creating synthetic task via: {validator_url}")
-
-    response = requests.post(validator_url, timeout=VALIDATOR_API_TIMEOUT)
-    response.raise_for_status()
 
-    task_data = response.json()
+    task_data = await self.api_client.post(
+        "/create-synthetic-task", timeout=VALIDATOR_API_TIMEOUT
+    )
     bt.logging.info(f"Synthetic task created - FID: {task_data['task']['dataId']}")
 
     return task_data["task"]
@@ -67,161 +76,381 @@ async def forward(self):
     The main validator forward function called every time step.
     It is responsible for querying the network and scoring the responses.
 
+    All per-round state is kept in a `RoundContext`, so several forwards can run
+    concurrently (`--neuron.num_concurrent_forwards`) without sharing miner lists.
+
+    The whole round is bounded by ROUND_TIMEOUT. Queries still running when the query
+    window closes (ROUND_SCORING_RESERVE seconds before the deadline) are cancelled and
+    their miners scored as timeouts; scoring then runs on the responses that arrived.
+
     Process:
-    1. Select random miners to query
-    2. Create synthetic task with a random Google Maps place
-    3. Query all selected miners simultaneously
-    4. Measure response times and collect results
-    5. Score responses based on speed, volume, and recency
-    6. Update miner scores in the network
+    1. Select the next miners of the coverage round-robin and pre-open connections to them
+    2. Take a prefetched synthetic task with a random Google Maps place
+    3. Open an incremental scoring session for the round, which starts fetching the
+       newest reviews of the place as reference while the miners are queried
+    4. Query the selected miners with bounded concurrency, measuring response times
+    5. Deduplicate and pre-validate each response; submit passing ones for scoring as soon
+       as they arrive and settle failing ones locally
+    6. Finalize scores based on speed, volume, and recency
+    7. Update the trust records that set how many reviews each miner is spot checked on
+    8. Update miner scores in the network
+    9. Flag verified reviews whose text nearly matches a review seen before
 
     Args:
         self: The neuron object which contains all the necessary state for the validator.
     """
     bt.logging.debug(f"Starting forward pass - Step: {self.step}")
 
-    # Select random miners to query (up to MAX_MINER_COUNT)
-    miner_uids = get_random_uids(self, k=MAX_MINER_COUNT)
-    bt.logging.debug(f"Selected {len(miner_uids)} miners: {miner_uids}")
+    # Select the next miners of the coverage round-robin (up to MAX_MINER_COUNT, or every
+    # available UID). Concurrent forwards get disjoint miners until this round releases them.
+    # Miners whose axons keep failing are left out until their liveness backoff expires.
+    sample_size = self.metagraph.n.item() if QUERY_ALL_MINERS else MAX_MINER_COUNT
+    with self.timings.measure("round.select"):
+        available_uids = get_available_uids(self)
+        due_uids = self.liveness.due(available_uids)
+        miner_uids = self.uid_scheduler.select(due_uids, k=sample_size)
+    if len(due_uids) < len(available_uids):
+        bt.logging.info(
+            f"Skipping {len(available_uids) - len(due_uids)} miners in liveness backoff"
+        )
+    bt.logging.debug(
+        f"Selected {len(miner_uids)} miners (coverage cycle {self.uid_scheduler.cycle}): {miner_uids}"
+    )
+    round_context = RoundContext.from_metagraph(
+        self.step, self.metagraph, miner_uids, budget=ROUND_TIMEOUT
+    )
+
+    try:
+        await query_and_score(self, round_context)
+    finally:
+        self.uid_scheduler.release(round_context.miner_uids)
+
 
-    # Create synthetic task with a random Google Maps place
-    task = await create_synthetic_task()
-    fid = task["dataId"]  # This is the fid from the Node.js validator
+async def query_and_score(self, round_context: RoundContext):
+    """
+    Queries the miners of a round and updates their scores, see `forward()`.
 
-    # Store the miner UIDs for scoring
-    self.current_miner_uids = miner_uids
+    Args:
+        self: The validator instance
+        round_context: The round with its selected miners and deadline
+    """
+    # Pre-open connections to the first launch stage while the synthetic task is being taken,
+    # so measured response times reflect miner work rather than connection setup. Later
+    # stages warm up their axons just before their queries, see `query_miner()`.
+    first_stage = min(QUERY_LAUNCH_BATCH, MAX_CONCURRENT_QUERIES)
 
-    # Get synapse parameters from validator API response
-    synapse_params = task["synapse_params"]
-    language = synapse_params["language"]  # Fixed to 'en'
-    sort = synapse_params["sort"]  # Fixed to 'newest'
-    timeout = synapse_params["timeout"]  # Get timeout from synapse params
+    async def warmup_axons():
+        with self.timings.measure("round.warmup"):
+            await self.dendrite_pool.warmup(round_context.axons[:first_stage])
 
-    bt.logging.info(f"Querying miners with synthetic task:")
-    bt.logging.info(f"  FID: {fid}")
-    bt.logging.info(
-        f"  Synapse params - language: {language}, sort: {sort}, timeout: {timeout}"
-    )
+    warmup = asyncio.ensure_future(warmup_axons())
+    try:
+        # Take a prefetched synthetic task with a random Google Maps place
+        with self.timings.measure("round.task"):
+            round_context.task = await asyncio.wait_for(
+                self.task_queue.get(),
+                timeout=round_context.remaining(ROUND_SCORING_RESERVE),
+            )
+        fid = round_context.fid  # This is the fid from the Node.js validator
+
+        # Get synapse parameters from validator API response
+        synapse_params = round_context.synapse_params
+        language = synapse_params["language"]  # Fixed to 'en'
+        sort = synapse_params["sort"]  # Fixed to 'newest'
+        timeout = synapse_params["timeout"]  # Get timeout from synapse params
+
+        bt.logging.info(f"Querying miners with synthetic task:")
+        bt.logging.info(f"  FID: {fid}")
+        bt.logging.info(
+            f"  Synapse params - language: {language}, sort: {sort}, timeout: {timeout}"
+        )
+
+        # Debug: Log axon information for transparency
+        bt.logging.info(f"About to query {len(round_context.axons)} axons:")
+        for i, (uid, axon) in enumerate(
+            zip(round_context.miner_uids, round_context.axons)
+        ):
+            bt.logging.debug(
+                f"  Axon {i}: UID={uid}, IP={axon.ip}, Port={axon.port}, Hotkey={axon.hotkey}"
+            )
 
-    # Debug: Log axon information for transparency
-    axons = [self.metagraph.axons[uid] for uid in miner_uids]
-    bt.logging.info(f"About to query {len(axons)} axons:")
-    for i, (uid, axon) in enumerate(zip(miner_uids, axons)):
-        bt.logging.debug(
-            f"  Axon {i}: UID={uid}, IP={axon.ip}, Port={axon.port}, Hotkey={axon.hotkey}"
+        # Open an incremental scoring session so responses are scored as they arrive. It starts
+        # the reference fetch of the place's newest reviews, which overlaps the query window
+        scoring_session = ScoringSession(
+            self.api_client,
+            fid,
+            round_context.miner_uids,
+            synapse_timeout=SYNAPSE_TIMEOUT,
+            review_cache=self.review_cache,
+            owners={
+                uid: axon.coldkey
+                for uid, axon in zip(round_context.miner_uids, round_context.axons)
+            },
         )
+        with self.timings.measure("round.scoring_start"):
+            await scoring_session.start(
+                timeout=round_context.remaining(ROUND_SCORING_RESERVE)
+            )
+        await warmup
+    finally:
+        warmup.cancel()
 
     # Track timing for each miner
-    query_start_time = time.time()
+    query_start_time = time.perf_counter()
 
     bt.logging.info(f"Starting individual dendrite queries with timeout={timeout}s...")
 
     # Create individual tasks for each miner to track response times
-    async def query_miner(axon, uid):
+    async def query_miner(axon, uid, warm):
         """Query a single miner and track its response time"""
-        miner_start_time = time.time()
+        if warm:
+            with self.timings.measure("dendrite.warmup", uid=int(uid)):
+                await self.dendrite_pool.warmup([axon])
+        miner_start_time = time.perf_counter()
         try:
-            # Query individual miner with synapse
-            response = await self.dendrite(
-                axons=[axon],
-                synapse=GoogleMapsReviewsSynapse(
-                    fid=fid,
-                    language=language,
-                    sort=sort,
+            # Query individual miner with synapse over its pooled connections
+            with self.timings.measure("dendrite.query", uid=int(uid)):
+                dendrite = self.dendrite_pool.get(axon)
+                response = await dendrite(
+                    axons=[axon],
+                    synapse=GoogleMapsReviewsSynapse(
+                        fid=fid,
+                        language=language,
+                        sort=sort,
+                        timeout=timeout,
+                    ),
+                    deserialize=False,
                     timeout=timeout,
-                ),
-                deserialize=True,
-                timeout=timeout,
-            )
-            miner_end_time = time.time()
+                )
+            miner_end_time = time.perf_counter()
             miner_response_time = miner_end_time - miner_start_time
 
-            # Extract the actual response (dendrite returns a list)
-            actual_response = response[0] if response and len(response) > 0 else []
-
-            return uid, actual_response, miner_response_time, None
+            # The dendrite reports transport failures on the synapse instead of raising
+            synapse = response[0]
+            if not synapse.is_success:
+                status_code = synapse.dendrite.status_code
+                if synapse.is_timeout:
+                    error = "timeout"
+                elif status_code == 503:
+                    error = "unreachable"
+                elif status_code == 422:
+                    # Unparseable responses and responses over the size limits
+                    error = "invalid_response"
+                else:
+                    error = f"http_{status_code}"
+                # A miner whose response was rejected did answer, so it is only scored as
+                # invalid and never backed off
+                if error == "invalid_response":
+                    self.liveness.record_success(uid)
+                else:
+                    self.liveness.record_failure(uid, error)
+                if synapse.dendrite.status_message:
+                    error = f"{error}: {synapse.dendrite.status_message}"
+                return uid, None, miner_response_time, error, 0
+            self.liveness.record_success(uid)
+
+            # Decoding happens inside the dendrite once the body was read (dendrite.transfer)
+            now = time.monotonic()
+            transfer = self.timings.last(
+                "dendrite.transfer", host=f"{axon.ip}:{axon.port}"
+            )
+            if transfer is not None and now - transfer["at"] <= miner_response_time:
+                self.timings.record(
+                    "dendrite.deserialize", now - transfer["at"], uid=int(uid)
+                )
+
+            # Deduplicate and structurally check the reviews. Miners are spot checked on
+            # as many reviews as their verification history calls for.
+            with self.timings.measure("round.decode", uid=int(uid)):
+                summary = summarize_response(
+                    fid,
+                    synapse.deserialize(),
+                    self.trust.spot_check_count(axon.hotkey),
+                )
+
+            return uid, summary, miner_response_time, None, dendrite.last_response_bytes
 
         except asyncio.TimeoutError:
-            miner_end_time = time.time()
+            miner_end_time = time.perf_counter()
             miner_response_time = miner_end_time - miner_start_time
             bt.logging.warning(
                 f"Miner UID {uid} timed out after {miner_response_time:.2f}s"
             )
-            return uid, [], timeout, "timeout"
+            self.liveness.record_failure(uid, "timeout")
+            return uid, None, timeout, "timeout", 0
 
         except Exception as e:
-            miner_end_time = time.time()
+            miner_end_time = time.perf_counter()
             miner_response_time = miner_end_time - miner_start_time
             bt.logging.error(f"Miner UID {uid} failed with exception: {e}")
-            return uid, [], miner_response_time, str(e)
+            self.liveness.record_failure(uid, type(e).__name__)
+            return uid, None, miner_response_time, str(e), 0
 
-    # Create tasks for all miners and execute in parallel
-    tasks = [query_miner(axon, uid) for axon, uid in zip(axons, miner_uids)]
+    # Review texts of the structurally valid responses, for near-duplicate detection
+    review_texts = {}
 
-    # Wait for all tasks to complete
-    try:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        bt.logging.info(f"All miner queries completed!")
-    except Exception as e:
-        bt.logging.error(f"Error in gathering miner responses: {e}")
-        results = [(uid, [], timeout, str(e)) for uid in miner_uids]
-
-    # Process results and extract responses with timing data
-    responses = []
-    self.miner_response_times = []
-
-    for result in results:
-        if isinstance(result, Exception):
-            # Handle exceptions from gather
-            bt.logging.error(f"Miner query resulted in exception: {result}")
-            responses.append([])
-            self.miner_response_times.append(timeout)
+    def handle_result(uid, summary, response_time, error, release=None):
+        """Record a miner result and submit it for scoring"""
+        round_context.record_response(uid, response_time)
+
+        # Failed queries are settled without any HTTP, like structurally invalid responses
+        if error:
+            bt.logging.warning(f"Miner UID {uid} had error: {error}")
+            scoring_session.settle(uid, error)
+            if release is not None:
+                release()
+            return
+
+        if summary["passedValidation"]:
+            bt.logging.info(
+                f"Miner UID {uid} returned {summary['count']} reviews in {response_time:.2f}s "
+                f"({summary['duplicates']} duplicates removed, most recent {summary['mostRecentDate']})"
+            )
+            if self.near_duplicates is not None:
+                review_texts[uid] = [
+                    (review["reviewId"], review.get("text"))
+                    for review in summary["reviews"]
+                ]
         else:
-            uid, response, response_time, error = result
-            responses.append(response)
-            self.miner_response_times.append(response_time)
+            bt.logging.warning(
+                f"Miner UID {uid} failed pre-validation: {summary['validationError']} "
+                f"({summary['received']} reviews, {summary['invalid']} invalid, time: {response_time:.2f}s)"
+            )
 
-            if error:
-                bt.logging.warning(f"Miner UID {uid} had error: {error}")
+        # The response counts against the round memory budget until it is handed off
+        submission = scoring_session.submit(uid, summary, response_time)
+        if release is None:
+            return
+        if submission is None:
+            release()
+        else:
+            submission.add_done_callback(release)
+
+    # Launch the queries in stages, bounded by in-flight count and response memory. Each
+    # query reserves the largest response it may read until its actual size is known.
+    fan_out = QueryFanOut(
+        max_in_flight=MAX_CONCURRENT_QUERIES,
+        launch_batch=QUERY_LAUNCH_BATCH,
+        launch_interval=QUERY_LAUNCH_INTERVAL,
+        memory_budget=ROUND_MEMORY_BUDGET,
+        reserve_bytes=MAX_RESPONSE_BYTES,
+    )
+    launched = fan_out.launch(
+        [
+            functools.partial(query_miner, axon, uid, index >= first_stage)
+            for index, (axon, uid) in enumerate(
+                zip(round_context.axons, round_context.miner_uids)
+            )
+        ]
+    )
+    queries = dict(zip(launched, round_context.miner_uids))
+
+    # Consume results in completion order, submitting each one for scoring as it lands,
+    # until every miner answered or the query window of the round closes
+    pending = set(queries)
+    while pending:
+        done, pending = await asyncio.wait(
+            pending,
+            timeout=round_context.remaining(ROUND_SCORING_RESERVE),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not done:
+            break
+        for query in done:
+            uid, summary, response_time, error, response_bytes = query.result()
+            release = fan_out.settle(query, response_bytes)
+            handle_result(uid, summary, response_time, error, release)
+
+    # Cancel stragglers so their connections and buffers are released, and score them as
+    # timeouts. Queries still waiting for their launch never contacted the miner, so those
+    # miners are left out of the round instead of being penalized for our own limits, and
+    # are selected first by the next round.
+    unlaunched = set()
+    if pending:
+        bt.logging.warning(
+            f"Round deadline reached, cancelling {len(pending)} outstanding queries"
+        )
+        started = {query for query in pending if fan_out.started(query)}
+        for query in pending:
+            query.cancel()
+        await asyncio.wait(pending)
+        for query in pending:
+            if query in started:
+                self.liveness.record_failure(queries[query], "timeout")
+                handle_result(queries[query], None, float(timeout), "round deadline")
+            else:
+                unlaunched.add(queries[query])
+        if unlaunched:
+            bt.logging.warning(
+                f"Leaving {len(unlaunched)} miners that were never queried out of the round"
+            )
+            self.uid_scheduler.requeue(unlaunched)
 
     # Calculate total query time
-    query_end_time = time.time()
+    query_end_time = time.perf_counter()
     total_query_time = query_end_time - query_start_time
 
     # Log the results in detail
     bt.logging.info(
-        f"Query complete - FID: {fid}, Miners queried: {len(miner_uids)}, Total time: {total_query_time:.2f}s"
+        f"Query complete - FID: {fid}, Miners queried: {len(round_context.miner_uids)}, Total time: {total_query_time:.2f}s"
     )
 
-    # Log detailed response information
-    for i, (uid, response, response_time) in enumerate(
-        zip(miner_uids, responses, self.miner_response_times)
-    ):
-        if response and len(response) > 0:
-            bt.logging.info(
-                f"Miner UID {uid} returned {len(response)} reviews in {response_time:.2f}s"
-            )
-        else:
-            bt.logging.warning(
-                f"Miner UID {uid} returned no reviews or failed (time: {response_time:.2f}s)"
-            )
-
-    # Score the responses using Node.js validator API (includes timing information)
-    bt.logging.info("Scoring responses via Node.js validator endpoint...")
-    rewards = get_rewards(
-        self, fid=fid, responses=responses, response_times=self.miner_response_times
-    )
+    # Finalize scoring: only relative speed, volume and recency normalization remain
+    bt.logging.info("Finalizing scoring session via Node.js validator endpoint...")
+    with self.timings.measure("round.scoring"):
+        round_context.rewards = rewards = await scoring_session.finalize(
+            timeout=round_context.remaining()
+        )
 
     bt.logging.info(
         f"Scoring complete - Mean: {rewards.mean():.4f}, Std: {rewards.std():.4f}"
     )
     bt.logging.debug(f"Individual scores: {[f'{r:.4f}' for r in rewards]}")
     bt.logging.debug(
-        f"Scores by UID: {dict(zip([int(uid) for uid in miner_uids], [f'{r:.4f}' for r in rewards]))}"
+        f"Scores by UID: {dict(zip(round_context.miner_uids, [f'{r:.4f}' for r in rewards]))}"
     )
 
-    # Update the global scores with new rewards
-    self.update_scores(rewards, miner_uids)
+    # Feed the spot check outcomes back into the trust records of the miner hotkeys
+    hotkeys = dict(zip(round_context.miner_uids, round_context.hotkeys))
+    self.trust.record_round(
+        (hotkeys[uid], passed) for uid, passed in scoring_session.verification.items()
+    )
+    try:
+        with self.timings.measure("round.trust_save"):
+            await asyncio.get_event_loop().run_in_executor(None, self.trust.save)
+    except OSError as e:
+        bt.logging.warning(f"Failed to save trust records: {e}")
+
+    # Update the global scores with new rewards, skipping UIDs whose hotkey changed mid-round
+    # and UIDs that were never queried
+    scored = [
+        index
+        for index, uid in enumerate(round_context.miner_uids)
+        if uid not in unlaunched
+    ]
+    self.update_scores(
+        rewards[scored],
+        [round_context.miner_uids[index] for index in scored],
+        [round_context.hotkeys[index] for index in scored],
+    )
 
-    # Wait before next validation round
-    time.sleep(SYNAPSE_WAIT_TIME)
+    # Index the review texts of the miners that passed verification and flag near duplicates
+    # of texts seen before, in this round or earlier ones
+    if self.near_duplicates is not None:
+        verified_texts = {
+            hotkeys[uid]: review_texts[uid]
+            for uid, passed in scoring_session.verification.items()
+            if passed and uid in review_texts
+        }
+        with self.timings.measure("round.near_duplicates"):
+            flagged = await asyncio.get_event_loop().run_in_executor(
+                None, self.near_duplicates.add_round, fid, verified_texts
+            )
+        for hotkey, duplicates in flagged.items():
+            cross_place = sum(duplicate.cross_place for duplicate in duplicates)
+            bt.logging.warning(
+                f"Hotkey {hotkey}: {len(duplicates)} near-duplicate review texts "
+                f"({cross_place} recycled from other places), e.g. review "
+                f"{duplicates[0].review_id} matches {duplicates[0].match_review_id} "
+                f"of {duplicates[0].match_owner} ({duplicates[0].similarity:.2f})"
+            )
@@ -0,0 +1,252 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import zlib
+import threading
+import numpy as np
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from oneoneone.config import (
+    NEAR_DUPLICATE_PERMUTATIONS,
+    NEAR_DUPLICATE_BANDS,
+    NEAR_DUPLICATE_SHINGLE_SIZE,
+    NEAR_DUPLICATE_THRESHOLD,
+    NEAR_DUPLICATE_MIN_TEXT_LENGTH,
+    NEAR_DUPLICATE_MAX_ENTRIES,
+)
+
+# Mersenne prime of the universal hash family, shingle hashes are 32 bit so products fit uint64
+MINHASH_PRIME = (1 << 31) - 1
+
+
+class NearDuplicate(NamedTuple):
+    """A review whose text nearly matches the text of another, already indexed review."""
+
+    review_id: str
+    fid: str
+    match_review_id: str
+    match_fid: str
+    match_owner: str
+    similarity: float
+
+    @property
+    def cross_place(self) -> bool:
+        """Whether the text was recycled from a review of another place."""
+        return self.fid != self.match_fid
+
+
+def shingles(text: str, size: int = NEAR_DUPLICATE_SHINGLE_SIZE) -> np.ndarray:
+    """
+    Hashes the character shingles of a review text.
+
+    The text is lowercased and its whitespace collapsed first, so formatting changes do not
+    hide a copy.
+
+    Args:
+        text: The review text
+        size: Characters per shingle
+
+    Returns:
+        np.ndarray: The distinct 32 bit shingle hashes
+    """
+    normalized = " ".join(text.lower().split()).encode("utf-8")
+    count = max(len(normalized) - size + 1, 1)
+    hashes = {zlib.crc32(normalized[i : i + size]) for i in range(count)}
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+class NearDuplicateIndex:
+    """
+    Incremental MinHash/LSH index of review texts returned by miners.
+
+    Each text is reduced to `permutations` MinHash values over its character shingles, whose
+    agreement estimates the Jaccard similarity of two texts. The signature is split into
+    `bands` bands and indexed by band, so a lookup only compares a text with the texts
+    sharing at least one band (likely above roughly (1 / bands) ** (rows per band)
+    similarity), instead of with every indexed text. Candidates are confirmed on the
+    estimated similarity against `threshold`.
+
+    A review is flagged when its text nearly matches an indexed review with another
+    `reviewId`: a templated or fabricated review when both are for the same place, a
+    recycled text when they are for different places. Texts shorter than `min_text_length`
+    are skipped, since short reviews like "Great place!" legitimately repeat.
+
+    Memory is bounded by `max_entries`: signatures live in a fixed ring buffer and the
+    oldest entries are evicted, with their band buckets, once it is full.
+
+    Attributes:
+    - permutations: MinHash values per signature
+    - bands: LSH bands, must divide `permutations`
+    - shingle_size: Characters per shingle
+    - threshold: Estimated Jaccard similarity from which two texts are near duplicates
+    - min_text_length: Shortest text indexed, in characters
+    - max_entries: Most reviews kept in the index
+    """
+
+    def __init__(
+        self,
+        permutations: int = NEAR_DUPLICATE_PERMUTATIONS,
+        bands: int = NEAR_DUPLICATE_BANDS,
+        shingle_size: int = NEAR_DUPLICATE_SHINGLE_SIZE,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        min_text_length: int = NEAR_DUPLICATE_MIN_TEXT_LENGTH,
+        max_entries: int = NEAR_DUPLICATE_MAX_ENTRIES,
+        seed: int = 0,
+    ):
+        if permutations % bands:
+            raise ValueError(f"{bands} bands do not divide {permutations} permutations")
+        self.permutations = permutations
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.min_text_length = min_text_length
+        self.max_entries = max_entries
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MINHASH_PRIME, permutations, dtype=np.uint64)
+        self._b = rng.integers(0, MINHASH_PRIME, permutations, dtype=np.uint64)
+
+        self._signatures = np.zeros((max_entries, permutations), dtype=np.uint32)
+        self._entries: List[Optional[Tuple[str, str, str]]] = [None] * max_entries
+        self._slots: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[int, List[int]] = defaultdict(list)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def signature(self, text: Optional[str]) -> Optional[np.ndarray]:
+        """
+        Computes the MinHash signature of a review text.
+
+        Args:
+            text: The review text
+
+        Returns:
+            np.ndarray: The signature, None if the text is missing or too short to index
+        """
+        if not isinstance(text, str) or len(text.strip()) < self.min_text_length:
+            return None
+        hashes = shingles(text, self.shingle_size)
+        values = (hashes[:, None] * self._a + self._b) % MINHASH_PRIME
+        return values.min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[int]:
+        """Returns the bucket key of each band of a signature."""
+        return [
+            hash((band, rows.tobytes()))
+            for band, rows in enumerate(signature.reshape(self.bands, -1))
+        ]
+
+    def _query(self, signature: np.ndarray) -> List[Tuple[int, float]]:
+        """Returns the slots of indexed texts similar to a signature, with their similarity."""
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        if not candidates:
+            return []
+
+        slots = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        similarity = (self._signatures[slots] == signature).mean(axis=1)
+        matches = similarity >= self.threshold
+        return list(zip(slots[matches].tolist(), similarity[matches].tolist()))
+
+    def _insert(self, signature: np.ndarray, entry: Tuple[str, str, str]):
+        """Stores a signature in the next slot, evicting the oldest entry if the index is full."""
+        slot = self._next
+        self._next = (slot + 1) % self.max_entries
+
+        evicted = self._entries[slot]
+        if evicted is not None:
+            for key in self._band_keys(self._signatures[slot]):
+                bucket = self._buckets[key]
+                bucket.remove(slot)
+                if not bucket:
+                    del self._buckets[key]
+            del self._slots[(evicted[0], evicted[1])]
+
+        self._signatures[slot] = signature
+        self._entries[slot] = entry
+        self._slots[(entry[0], entry[1])] = slot
+        for key in self._band_keys(signature):
+            self._buckets[key].append(slot)
+
+    def add(
+        self, fid: str, review_id: str, text: Optional[str], owner: str
+    ) -> List[NearDuplicate]:
+        """
+        Checks a review against the index and adds it.
+
+        Reviews already indexed for the place are neither checked nor added again, so the
+        same review returned by several miners is only indexed once.
+
+        Args:
+            fid: The place the review was returned for
+            review_id: The review ID
+            text: The review text
+            owner: The miner that returned the review, e.g. its hotkey
+
+        Returns:
+            list: The indexed reviews with another `reviewId` the text nearly matches
+        """
+        with self._lock:
+            if (fid, review_id) in self._slots:
+                return []
+            signature = self.signature(text)
+            if signature is None:
+                return []
+
+            duplicates = []
+            for slot, similarity in self._query(signature):
+                match_fid, match_review_id, match_owner = self._entries[slot]
+                if match_review_id != review_id:
+                    duplicates.append(
+                        NearDuplicate(
+                            review_id,
+                            fid,
+                            match_review_id,
+                            match_fid,
+                            match_owner,
+                            similarity,
+                        )
+                    )
+            self._insert(signature, (fid, review_id, owner))
+            return duplicates
+
+    def add_round(
+        self, fid: str, responses: Dict[str, Iterable[Tuple[str, Optional[str]]]]
+    ) -> Dict[str, List[NearDuplicate]]:
+        """
+        Checks and adds the reviews of a completed round.
+
+        Args:
+            fid: The place the round queried
+            responses: The (reviewId, text) pairs returned by each miner, by owner
+
+        Returns:
+            dict: The near duplicates found in the reviews of each flagged owner
+        """
+        flagged: Dict[str, List[NearDuplicate]] = {}
+        for owner, reviews in responses.items():
+            for review_id, text in reviews:
+                duplicates = self.add(fid, review_id, text, owner)
+                if duplicates:
+                    flagged.setdefault(owner, []).extend(duplicates)
+        return flagged
@@ -0,0 +1,133 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import json
+import time
+import sqlite3
+import threading
+import bittensor as bt
+from typing import Any, Dict, Iterable, List
+
+from oneoneone.config import VERIFIED_REVIEW_TTL
+
+
+class VerifiedReviewCache:
+    """
+    Persistent store of reviews verified by spot checks, keyed by `reviewId`.
+
+    Honest miners return heavily overlapping reviews for a place, so the same `reviewId`s
+    get selected for spot checks again and again. Reviews verified by the Node.js side are
+    kept here with the fields the spot check compares, and sent back with later submissions
+    for the same fid so they are not verified through the scraper actor again. Each miner
+    review is still compared field by field against its cached verified copy.
+
+    Entries older than `ttl` seconds are ignored and verified again, so edited or removed
+    reviews are picked up eventually.
+
+    Lookups and writes are blocking SQLite calls, meant to run on executor threads; a lock
+    serializes them on the shared connection.
+
+    Attributes:
+    - path: The SQLite database file
+    - ttl: Seconds a verified review is trusted before it is verified again
+    """
+
+    def __init__(self, path: str, ttl: float = VERIFIED_REVIEW_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS verified_reviews ("
+            "review_id TEXT PRIMARY KEY, "
+            "fid TEXT NOT NULL, "
+            "review TEXT NOT NULL, "
+            "verified_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def get(self, fid: str, review_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Looks up the verified reviews of a fid that are still within the TTL.
+
+        Args:
+            fid: The queried Google Maps place identifier
+            review_ids: The review IDs to look up
+
+        Returns:
+            list: The cached verified reviews found, in no particular order
+        """
+        review_ids = list(dict.fromkeys(review_ids))
+        if not review_ids:
+            return []
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT review FROM verified_reviews "
+                "WHERE fid = ? AND verified_at > ? "
+                f"AND review_id IN ({','.join('?' * len(review_ids))})",
+                (fid, time.time() - self.ttl, *review_ids),
+            ).fetchall()
+        return [json.loads(review) for (review,) in rows]
+
+    def put(self, reviews: Iterable[Dict[str, Any]]) -> int:
+        """
+        Stores newly verified reviews, replacing older verifications of the same reviews.
+
+        Args:
+            reviews: Verified reviews as returned by the Node.js scoring session
+
+        Returns:
+            int: The number of reviews stored
+        """
+        now = time.time()
+        rows = [
+            (review["reviewId"], review["fid"], json.dumps(review), now)
+            for review in reviews
+            if review.get("reviewId") and review.get("fid")
+        ]
+        if rows:
+            with self._lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO verified_reviews VALUES (?, ?, ?, ?)", rows
+                )
+                self._db.commit()
+        return len(rows)
+
+    def prune(self) -> int:
+        """
+        Deletes the entries older than the TTL.
+
+        Returns:
+            int: The number of entries deleted
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM verified_reviews WHERE verified_at <= ?",
+                (time.time() - self.ttl,),
+            )
+            self._db.commit()
+        if cursor.rowcount:
+            bt.logging.debug(f"Pruned {cursor.rowcount} expired verified reviews")
+        return cursor.rowcount
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._db.close()
@@ -16,122 +16,172 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import os
-import json
+import warnings
+from datetime import timezone
 import numpy as np
-import requests
-from typing import List, Dict, Any
+from typing import Dict, Any, Optional, Sequence, Tuple
 import bittensor as bt
 
-from oneoneone.config import VALIDATOR_API_TIMEOUT, SYNAPSE_TIMEOUT
+from oneoneone.config import SYNAPSE_TIMEOUT
+from oneoneone.validator.decode import parse_date
 
-# Environment variables for Node.js validator API
-VALIDATOR_NODE_HOST = os.getenv("VALIDATOR_NODE_HOST", "localhost")
-VALIDATOR_NODE_PORT = int(os.getenv("VALIDATOR_NODE_PORT", 3002))
+# Weights of the speed, volume and recency components, as in calculate-final-scores.js
+SPEED_WEIGHT = 0.3
+VOLUME_WEIGHT = 0.5
+RECENCY_WEIGHT = 0.2
 
 
-def get_rewards(
-    self,
-    fid: str,
-    responses: List[List[Dict[str, Any]]],
-    response_times: List[float] = None,
-) -> np.ndarray:
+def parse_dates(values: Sequence[Optional[str]]) -> np.ndarray:
     """
-    Calculate rewards for miner responses by calling the Node.js validator scoring endpoint.
+    Bulk-parses ISO 8601 dates into UTC `datetime64[ms]`, NaT where missing or unparseable.
 
-    Scoring is based on:
-    - Speed Score (30%): How fast the response was delivered
-    - Volume Score (50%): How many reviews were returned
-    - Recency Score (20%): How recent the reviews are
-
-    Miners that fail spot check or validation receive zero score.
+    UTC dates as sent by miners ("2024-03-20T10:00:00.000Z") are parsed by NumPy in a single
+    call; any other offset falls back to parsing value by value.
 
     Args:
-        self: The validator instance
-        fid: The Google Maps place identifier (FID) that was queried
-        responses: A list of responses from miners (list of review dictionaries)
-        response_times: A list of response times in seconds for each miner
+        values: ISO 8601 date strings, None for missing dates
 
     Returns:
-        np.ndarray: An array of rewards (0.0 to 1.0) for each miner response
+        np.ndarray: The parsed dates as `datetime64[ms]`
     """
+    values = [
+        (value[:-1] if value.endswith("Z") else value)
+        if isinstance(value, str)
+        else "NaT"
+        for value in values
+    ]
     try:
-        # Build request to Node.js scoring endpoint
-        validator_url = (
-            f"http://{VALIDATOR_NODE_HOST}:{VALIDATOR_NODE_PORT}/score-responses"
-        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return np.array(values, dtype="datetime64[ms]")
+    except (ValueError, Warning):
+        pass
+
+    dates = []
+    for value in values:
+        date = parse_date(value)
+        if date is not None and date.tzinfo is not None:
+            date = date.astimezone(timezone.utc).replace(tzinfo=None)
+        dates.append(np.datetime64(date, "ms") if date is not None else np.datetime64("NaT"))
+    return np.array(dates, dtype="datetime64[ms]")
+
+
+def compute_scores(
+    passed: np.ndarray,
+    counts: np.ndarray,
+    most_recent_dates: np.ndarray,
+    response_times: np.ndarray,
+    synapse_timeout: float = SYNAPSE_TIMEOUT,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Computes the speed, volume and recency scores of a round with array operations.
+
+    Mirrors `calculateFinalScores` on the Node.js side: only miners that passed validation
+    and answered within `synapse_timeout` are scored, relative to the fastest response time
+    (speed, 30%), the highest review count (volume, 50%) and the range of most recent review
+    dates (recency, 20%). Scores are rounded to 4 decimals like the Node.js results.
 
-        bt.logging.info(f"Calling scoring endpoint: {validator_url}")
-        bt.logging.debug(f"Scoring {len(responses)} responses for fid: {fid}")
-
-        # If response times not provided, use default values
-        if response_times is None:
-            response_times = [SYNAPSE_TIMEOUT] * len(responses)  # Default to max time
-
-        # Prepare payload for scoring API
-        payload = {
-            "fid": fid,
-            "responses": responses,
-            "responseTimes": response_times,  # Pass timing information
-            "synapseTimeout": SYNAPSE_TIMEOUT,  # Pass the timeout configuration
-            "minerUIDs": [
-                int(uid) for uid in self.current_miner_uids
-            ],  # Convert numpy types to Python ints
-        }
-
-        # Log payload size for debugging
-        payload_size = len(json.dumps(payload).encode("utf-8"))
-        bt.logging.debug(f"Payload size: {payload_size / 1024:.2f} KB")
-
-        # Make HTTP request to scoring endpoint
-        response = requests.post(
-            validator_url, json=payload, timeout=VALIDATOR_API_TIMEOUT
+    Args:
+        passed: Whether each miner passed validation and spot checks
+        counts: Number of unique reviews per miner
+        most_recent_dates: Most recent review date per miner (`datetime64`), NaT if unknown
+        response_times: Response time per miner in seconds, NaN or 0 if unknown
+        synapse_timeout: Response times at or above this are rejected
+
+    Returns:
+        Tuple[np.ndarray, Dict[str, np.ndarray]]: The final scores and the speed, volume and
+        recency components, all ordered like the inputs
+    """
+    passed = np.asarray(passed, dtype=bool)
+    counts = np.asarray(counts, dtype=np.float64)
+    dates = np.asarray(most_recent_dates, dtype="datetime64[ms]")
+    response_times = np.asarray(response_times, dtype=np.float64)
+
+    # Missing response times count as timeouts, like `responseTimes[index] || synapseTimeout`
+    response_times = np.where(
+        np.isnan(response_times) | (response_times == 0), synapse_timeout, response_times
+    )
+    valid = passed & (response_times < synapse_timeout)
+
+    components = {
+        "speedScore": np.zeros(len(passed)),
+        "volumeScore": np.zeros(len(passed)),
+        "recencyScore": np.zeros(len(passed)),
+    }
+    if not valid.any():
+        return np.zeros(len(passed)), components
+
+    t_min = response_times[valid].min()
+    v_max = counts[valid].max()
+    components["speedScore"][valid] = np.where(
+        response_times[valid] > 0, t_min / response_times[valid], 0
+    )
+    if v_max > 0:
+        components["volumeScore"][valid] = counts[valid] / v_max
+
+    dated = valid & ~np.isnat(dates)
+    if dated.any():
+        timestamps = dates.astype(np.int64).astype(np.float64)
+        oldest = timestamps[dated].min()
+        date_range = timestamps[dated].max() - oldest
+        components["recencyScore"][dated] = (
+            (timestamps[dated] - oldest) / date_range if date_range > 0 else 1
         )
-        response.raise_for_status()
 
-        result = response.json()
+    scores = (
+        SPEED_WEIGHT * components["speedScore"]
+        + VOLUME_WEIGHT * components["volumeScore"]
+        + RECENCY_WEIGHT * components["recencyScore"]
+    )
+    return np.round(scores, 4), {
+        name: np.round(component, 4) for name, component in components.items()
+    }
 
-        # Check if scoring was successful
-        if result.get("status") != "success":
-            bt.logging.error(f"Scoring endpoint returned error: {result}")
-            return np.zeros(len(responses))
 
-        # Extract scores and statistics
-        scores = result["scores"]
-        statistics = result["statistics"]
+def scores_from_result(result: Dict[str, Any], count: int) -> np.ndarray:
+    """
+    Extract miner scores from a Node.js scoring endpoint result and log the breakdown.
 
-        bt.logging.info(
-            f"Scoring complete - Mean: {statistics['mean']:.4f}, "
-            f"Count: {statistics['count']}, "
-            f"Min: {statistics['min']:.4f}, "
-            f"Max: {statistics['max']:.4f}"
-        )
+    Args:
+        result: The decoded JSON result of a scoring endpoint
+        count: The number of scored miners, used for the zero-score fallback
+
+    Returns:
+        np.ndarray: An array of rewards (0.0 to 1.0) for each miner, zeros if scoring failed
+    """
+    # Check if scoring was successful
+    if result.get("status") != "success":
+        bt.logging.error(f"Scoring endpoint returned error: {result}")
+        return np.zeros(count)
+
+    # Extract scores and statistics
+    scores = result["scores"]
+    statistics = result["statistics"]
+
+    bt.logging.info(
+        f"Scoring complete - Mean: {statistics['mean']:.4f}, "
+        f"Count: {statistics['count']}, "
+        f"Min: {statistics['min']:.4f}, "
+        f"Max: {statistics['max']:.4f}"
+    )
+
+    # Log detailed scoring breakdown if available
+    detailed_results = result.get("detailedResults", [])
+    if detailed_results:
+        for detail in detailed_results:
+            if detail.get("passedValidation"):
+                bt.logging.debug(
+                    f"Miner UID {detail['minerUID']}: "
+                    f"Score={detail['score']:.4f}, "
+                    f"Speed={detail['components']['speedScore']:.4f}, "
+                    f"Volume={detail['components']['volumeScore']:.4f}, "
+                    f"Recency={detail['components']['recencyScore']:.4f}"
+                )
+            else:
+                bt.logging.debug(
+                    f"Miner UID {detail['minerUID']}: "
+                    f"Failed validation - {detail.get('validationError', 'Unknown error')}"
+                )
+
+    return np.array(scores)
 
-        # Log detailed scoring breakdown if available
-        detailed_results = result.get("detailedResults", [])
-        if detailed_results:
-            for detail in detailed_results:
-                if detail.get("passedValidation"):
-                    bt.logging.debug(
-                        f"Miner UID {detail['minerUID']}: "
-                        f"Score={detail['score']:.4f}, "
-                        f"Speed={detail['components']['speedScore']:.4f}, "
-                        f"Volume={detail['components']['volumeScore']:.4f}, "
-                        f"Recency={detail['components']['recencyScore']:.4f}"
-                    )
-                else:
-                    bt.logging.debug(
-                        f"Miner UID {detail['minerUID']}: "
-                        f"Failed validation - {detail.get('validationError', 'Unknown error')}"
-                    )
-
-        return np.array(scores)
-
-    except requests.exceptions.RequestException as e:
-        bt.logging.error(f"Failed to call scoring endpoint: {e}")
-        bt.logging.warning("Falling back to zero scores for all responses")
-        return np.zeros(len(responses))
-    except Exception as e:
-        bt.logging.error(f"Unexpected error during scoring: {e}")
-        bt.logging.warning("Falling back to zero scores for all responses")
-        return np.zeros(len(responses))
@@ -0,0 +1,109 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import bittensor as bt
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class RoundContext:
+    """
+    Self-contained state of a single validation round.
+
+    Everything a round needs from selection to `update_scores` lives here instead of on the
+    neuron, so several forwards can overlap without overwriting each other's miner lists or
+    response times. The hotkeys of the selected UIDs are captured at selection time so scores
+    are never attributed to a miner that took over a UID while the round was running.
+
+    Attributes:
+    - step: The validator step the round was started at
+    - miner_uids: The UIDs of the queried miners, in scoring order
+    - hotkeys: The hotkeys of `miner_uids` at selection time
+    - axons: The axons of `miner_uids` at selection time
+    - deadline: `time.monotonic()` value by which the round must be finished
+    - task: The synthetic task of the round, once taken
+    - response_times: Response time in seconds of each miner that answered, by UID
+    - rewards: The final rewards of the round, ordered like `miner_uids`
+    """
+
+    def __init__(
+        self,
+        step: int,
+        miner_uids: List[int],
+        hotkeys: List[str],
+        axons: List["bt.AxonInfo"],
+        deadline: float,
+    ):
+        self.step = step
+        self.miner_uids = [int(uid) for uid in miner_uids]
+        self.hotkeys = list(hotkeys)
+        self.axons = list(axons)
+        self.deadline = deadline
+        self.task: Optional[Dict[str, Any]] = None
+        self.response_times: Dict[int, float] = {}
+        self.rewards: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_metagraph(
+        cls,
+        step: int,
+        metagraph: "bt.metagraph",
+        miner_uids: List[int],
+        budget: float,
+    ) -> "RoundContext":
+        """
+        Snapshots the hotkeys and axons of the selected miners.
+
+        Args:
+            step: The current validator step
+            metagraph: The metagraph the miners were selected from
+            miner_uids: The selected miner UIDs
+            budget: Seconds from now the round may take end to end
+
+        Returns:
+            RoundContext: A new round context
+        """
+        return cls(
+            step=step,
+            miner_uids=miner_uids,
+            hotkeys=[metagraph.hotkeys[uid] for uid in miner_uids],
+            axons=[metagraph.axons[uid] for uid in miner_uids],
+            deadline=time.monotonic() + budget,
+        )
+
+    @property
+    def fid(self) -> Optional[str]:
+        return self.task["dataId"] if self.task else None
+
+    @property
+    def synapse_params(self) -> Dict[str, Any]:
+        return self.task["synapse_params"] if self.task else {}
+
+    def remaining(self, reserve: float = 0) -> float:
+        """
+        Returns the seconds left until the round deadline, never negative.
+
+        Args:
+            reserve: Seconds to keep aside for later phases of the round
+        """
+        return max(self.deadline - reserve - time.monotonic(), 0)
+
+    def record_response(self, uid: int, response_time: float):
+        self.response_times[int(uid)] = response_time
@@ -0,0 +1,99 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import random
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+class SpotCheckSampler:
+    """
+    Streaming sampler of the reviews to spot check in one miner response.
+
+    Reviews are added one at a time as they are decoded. The sampler keeps the newest review
+    and a reservoir of `count - 1` others (Algorithm R), so it holds at most `count` reviews
+    however long the response is, and every other review is equally likely to be sampled.
+    A review displaced as the newest joins the stream of others at that point, so the
+    reservoir stays a uniform sample of every review but the final newest one.
+
+    Reviews without a parseable date never displace the newest review; if no review has
+    one, the first review is kept as the newest, like `getReviewsForSpotCheck`. Dates
+    without a timezone are taken as UTC.
+
+    Attributes:
+    - count: Number of reviews to sample, the newest one included
+    - seen: Number of reviews added
+    """
+
+    def __init__(self, count: int, rng: Optional[random.Random] = None):
+        self.count = count
+        self.seen = 0
+        self._rng = rng or random.Random()
+        self._newest: Optional[Dict[str, Any]] = None
+        self._newest_date: Optional[datetime] = None
+        self._others = 0
+        self._reservoir: List[Dict[str, Any]] = []
+
+    def add(self, review: Dict[str, Any], date: Optional[datetime]):
+        """
+        Adds one review to the stream.
+
+        Args:
+            review: A structurally valid review
+            date: The parsed `publishedAtDate` of the review, None if it cannot be parsed
+        """
+        self.seen += 1
+        if date is not None and date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        if self._newest is None:
+            self._newest, self._newest_date = review, date
+            return
+        if date is not None and (
+            self._newest_date is None or date > self._newest_date
+        ):
+            review, self._newest, self._newest_date = self._newest, review, date
+        self._sample_other(review)
+
+    def _sample_other(self, review: Dict[str, Any]):
+        """Offers a review other than the newest to the reservoir."""
+        self._others += 1
+        size = self.count - 1
+        if size <= 0:
+            return
+        if len(self._reservoir) < size:
+            self._reservoir.append(review)
+            return
+        index = self._rng.randrange(self._others)
+        if index < size:
+            self._reservoir[index] = review
+
+    @property
+    def newest_date(self) -> Optional[datetime]:
+        """The date of the newest review, None without dated reviews."""
+        return self._newest_date
+
+    def sample(self) -> List[Dict[str, Any]]:
+        """
+        Returns the sampled reviews.
+
+        Returns:
+            list: At most `count` reviews, the newest one first
+        """
+        if self.count <= 0 or self._newest is None:
+            return []
+        return [self._newest] + list(self._reservoir)
@@ -0,0 +1,391 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import asyncio
+import numpy as np
+import bittensor as bt
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from oneoneone.config import (
+    VALIDATOR_API_TIMEOUT,
+    SYNAPSE_TIMEOUT,
+    LOCAL_SCORING,
+    SUMMARY_PAYLOADS,
+    CONTENT_ADDRESSED_PAYLOADS,
+    CONSENSUS_VERIFICATION,
+    CONSENSUS_QUORUM,
+    REFERENCE_FETCH,
+)
+from oneoneone.validator.client import ValidatorApiClient
+from oneoneone.validator.consensus import ReviewConsensus
+from oneoneone.validator.decode import intern_reviews, summary_payload
+from oneoneone.validator.review_cache import VerifiedReviewCache
+from oneoneone.validator.reward import compute_scores, parse_dates, scores_from_result
+
+# Validation error of miners whose reviews did not match the spot checked originals
+SPOT_CHECK_FAILURE = "Failed spot check verification"
+
+
+class ScoringSession:
+    """
+    Incremental scoring of one validation round through the Node.js scoring session API.
+
+    Each miner response is submitted as soon as it arrives, so the Node.js side prepares it and
+    starts spot checks while slower miners are still answering. Failed queries are settled
+    locally and never sent. `finalize()` then only waits for the outstanding spot checks and
+    the relative speed, volume and recency normalization.
+
+    Attributes:
+    - fid: The Google Maps place identifier (FID) that was queried
+    - miner_uids: The UIDs of all queried miners, in scoring order
+    - synapse_timeout: The synapse timeout passed to the scoring backend
+    - local_scoring: Compute the final scores in the validator instead of the Node.js API
+    - summary_payloads: Submit response summaries instead of the deduplicated reviews
+    - review_cache: Store of reviews verified in earlier rounds, None to verify every review
+    - content_addressed: Send each distinct review once and reference it by content hash
+    - reference_fetch: Have the Node.js side verify against a snapshot fetched during the query window
+    - consensus: Agreement on review records across the miners of the round, None if disabled
+    - owners: The operator identity of each miner UID (its coldkey), reviews returned by
+      miners of the same owner count once towards the consensus quorum
+    - settled: Failure reasons of miners settled locally, by UID
+    - verification: Whether the spot checks of submitted miners passed, by UID, once
+      finalized. Miners that failed for other reasons, e.g. a batch spot check error or
+      a slow response, are left out
+    """
+
+    def __init__(
+        self,
+        client: ValidatorApiClient,
+        fid: str,
+        miner_uids: List[int],
+        synapse_timeout: float = SYNAPSE_TIMEOUT,
+        local_scoring: bool = LOCAL_SCORING,
+        summary_payloads: bool = SUMMARY_PAYLOADS,
+        review_cache: Optional[VerifiedReviewCache] = None,
+        content_addressed: bool = CONTENT_ADDRESSED_PAYLOADS,
+        consensus: bool = CONSENSUS_VERIFICATION,
+        consensus_quorum: int = CONSENSUS_QUORUM,
+        owners: Optional[Dict[int, str]] = None,
+        reference_fetch: bool = REFERENCE_FETCH,
+    ):
+        self.client = client
+        self.fid = fid
+        self.miner_uids = [int(uid) for uid in miner_uids]
+        self.synapse_timeout = synapse_timeout
+        self.local_scoring = local_scoring
+        self.summary_payloads = summary_payloads
+        self.review_cache = review_cache
+        self.content_addressed = content_addressed
+        self.reference_fetch = reference_fetch
+        self.consensus = ReviewConsensus(consensus_quorum) if consensus else None
+        self.owners = {int(uid): owner for uid, owner in (owners or {}).items()}
+        self._sent_reviews: Set[str] = set()
+        self.session_id: Optional[str] = None
+        self.settled: Dict[int, str] = {}
+        self.verification: Dict[int, bool] = {}
+        self._submitted: Dict[int, Tuple[int, Optional[str], float]] = {}
+        self._submissions: List[asyncio.Future] = []
+
+    async def start(self, timeout: float = VALIDATOR_API_TIMEOUT):
+        """
+        Opens the scoring session on the Node.js side.
+
+        With `reference_fetch`, the Node.js side starts fetching the newest reviews of the
+        place right away, while the miners are still being queried, and later only spot checks
+        the miner reviews missing from that snapshot by URL.
+
+        Raises:
+            aiohttp.ClientError: If the session cannot be created
+        """
+        result = await self.client.post(
+            "/score-session",
+            {
+                "fid": self.fid,
+                "minerUIDs": self.miner_uids,
+                "synapseTimeout": self.synapse_timeout,
+                "referenceFetch": self.reference_fetch,
+            },
+            timeout=timeout,
+        )
+        self.session_id = result["sessionId"]
+        bt.logging.debug(f"Scoring session {self.session_id} started for fid: {self.fid}")
+
+    def settle(self, uid: int, reason: str):
+        """
+        Settles a miner as failed without sending anything for it.
+
+        The reason is passed along at finalization, so it shows up in the scoring results.
+
+        Args:
+            uid: The miner UID
+            reason: Why the miner failed, e.g. a timeout or a structural validation error
+        """
+        self.settled[int(uid)] = reason
+
+    def submit(
+        self, uid: int, summary: Dict[str, Any], response_time: float
+    ) -> Optional[asyncio.Future]:
+        """
+        Submits a pre-validated miner response in the background.
+
+        Responses that failed the structural checks of `summarize_response` (not a list,
+        empty, invalid reviews or a mismatched fid) are settled locally: the miner is scored
+        as failed at finalization without its response ever going over HTTP. Passing
+        responses are sent as:
+        - their deduplicated reviews, with the number of reviews to spot check that the
+          miner's verification history calls for
+        - with `summary_payloads`, only their counts, dates and sampled spot check reviews
+        - with `content_addressed`, content hash references, each distinct review being
+          sent once per session however many miners returned it
+
+        Sampled reviews found in the `review_cache` are sent along as verified, as are those
+        that `consensus_quorum` miners of distinct `owners` returned identically with
+        `consensus`, so only disputed and minority records are spot checked externally.
+
+        Args:
+            uid: The miner UID
+            summary: The response summary returned by `summarize_response`
+            response_time: The miner response time in seconds
+
+        Returns:
+            asyncio.Future: The background submission, None if settled locally
+        """
+        if not summary["passedValidation"]:
+            bt.logging.debug(
+                f"Miner UID {uid}: settled locally - {summary['validationError']}"
+            )
+            self.settle(uid, summary["validationError"])
+            return None
+
+        self._submitted[int(uid)] = (
+            summary["count"],
+            summary["mostRecentDate"],
+            response_time,
+        )
+        reviews = (
+            summary["spotCheckReviews"] if self.summary_payloads else summary["reviews"]
+        )
+        distinct: Dict[str, Dict[str, Any]] = {}
+        entries = (
+            intern_reviews(reviews, distinct) if self.content_addressed else reviews
+        )
+
+        payload = {"minerUID": int(uid), "responseTime": response_time}
+        if self.summary_payloads:
+            payload["summary"] = {
+                **summary_payload(summary),
+                "spotCheckReviews": entries,
+            }
+        else:
+            payload["response"] = entries
+            payload["spotCheckCount"] = summary["spotCheckCount"]
+        agreed = []
+        if self.consensus is not None:
+            self.consensus.add(self.owners.get(int(uid), str(uid)), summary["reviews"])
+            agreed = self.consensus.agreed(reviews)
+        submission = asyncio.ensure_future(
+            self._submit(int(uid), payload, distinct, reviews, agreed)
+        )
+        self._submissions.append(submission)
+        return submission
+
+    async def _cached_reviews(
+        self, reviews: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Looks up the reviews verified in earlier rounds, logging failures instead of raising them."""
+        if self.review_cache is None:
+            return []
+        try:
+            return await asyncio.get_event_loop().run_in_executor(
+                None,
+                self.review_cache.get,
+                self.fid,
+                [review["reviewId"] for review in reviews],
+            )
+        except Exception as e:
+            bt.logging.warning(f"Failed to read the verified review cache: {e}")
+            return []
+
+    async def _submit(
+        self,
+        uid: int,
+        payload: Dict[str, Any],
+        distinct: Dict[str, Dict[str, Any]],
+        reviews: List[Dict[str, Any]],
+        agreed: List[Dict[str, Any]],
+    ):
+        """
+        Submits a single response, logging failures instead of raising them.
+
+        The sampled `reviews` found in the verified review cache are sent as verified along
+        with the consensus `agreed` ones. Only the distinct reviews the Node.js side has not
+        acknowledged yet are sent along with the references. Submissions still in flight may
+        both carry the same review.
+        """
+        verified_reviews = await self._cached_reviews(reviews)
+        cached = {review["reviewId"] for review in verified_reviews}
+        verified_reviews += [
+            review for review in agreed if review["reviewId"] not in cached
+        ]
+        if verified_reviews:
+            payload["verifiedReviews"] = verified_reviews
+        if distinct:
+            payload["reviews"] = {
+                key: review
+                for key, review in distinct.items()
+                if key not in self._sent_reviews
+            }
+        try:
+            result = await self.client.post(
+                f"/score-session/{self.session_id}/responses", payload
+            )
+            self._sent_reviews.update(distinct)
+            if not result.get("passedValidation"):
+                bt.logging.debug(
+                    f"Miner UID {uid}: failed pre-validation - {result.get('validationError')}"
+                )
+        except Exception as e:
+            bt.logging.error(f"Miner UID {uid}: failed to submit response for scoring: {e}")
+
+    async def finalize(self, timeout: float = VALIDATOR_API_TIMEOUT) -> np.ndarray:
+        """
+        Waits for pending submissions and computes the final scores of the round.
+
+        Submissions still pending when `timeout` expires are cancelled, so their
+        miners are scored as having sent no response. The reviews newly verified by the
+        session are added to the `review_cache`, whose expired entries are pruned. With
+        `local_scoring`, the Node.js side only reports which miners passed verification
+        and the scores are computed by `_score_locally()`.
+
+        Args:
+            timeout: Deadline for the whole finalization in seconds
+
+        Returns:
+            np.ndarray: An array of rewards (0.0 to 1.0) ordered like `miner_uids`,
+            zeros if the session could not be finalized
+        """
+        deadline = time.monotonic() + timeout
+
+        if self._submissions:
+            _, pending = await asyncio.wait(self._submissions, timeout=timeout)
+            if pending:
+                bt.logging.warning(
+                    f"Cancelling {len(pending)} response submissions still pending at the deadline"
+                )
+                for submission in pending:
+                    submission.cancel()
+
+        try:
+            result = await self.client.post(
+                f"/score-session/{self.session_id}/finalize",
+                {
+                    "settled": {str(uid): reason for uid, reason in self.settled.items()},
+                    "verifyOnly": self.local_scoring,
+                },
+                timeout=max(deadline - time.monotonic(), 0),
+            )
+        except Exception as e:
+            bt.logging.error(f"Failed to finalize scoring session {self.session_id}: {e}")
+            bt.logging.warning("Falling back to zero scores for all responses")
+            return np.zeros(len(self.miner_uids))
+
+        if self.review_cache is not None:
+            loop = asyncio.get_event_loop()
+            try:
+                stored = await loop.run_in_executor(
+                    None, self.review_cache.put, result.get("verifiedReviews", [])
+                )
+                bt.logging.debug(f"Cached {stored} newly verified reviews")
+                await loop.run_in_executor(None, self.review_cache.prune)
+            except Exception as e:
+                bt.logging.warning(f"Failed to update the verified review cache: {e}")
+
+        self._record_verification(
+            result.get("verification" if self.local_scoring else "detailedResults", [])
+        )
+        if not self.local_scoring:
+            return scores_from_result(result, len(self.miner_uids))
+        return self._score_locally(result)
+
+    def _record_verification(self, entries: List[Dict[str, Any]]):
+        """Keeps the spot check outcomes of the submitted miners from the finalization result."""
+        for entry in entries:
+            uid = int(entry["minerUID"])
+            if uid not in self._submitted:
+                continue
+            if entry.get("passedValidation"):
+                self.verification[uid] = True
+            elif entry.get("validationError") == SPOT_CHECK_FAILURE:
+                self.verification[uid] = False
+
+    def _score_locally(self, result: Dict[str, Any]) -> np.ndarray:
+        """
+        Computes the final scores from a verify-only finalization result.
+
+        The relative speed, volume and recency normalization runs on the response times,
+        counts and most recent dates kept from the summaries of the submitted miners that
+        passed verification.
+
+        Args:
+            result: The decoded JSON result with the per-miner `verification`
+
+        Returns:
+            np.ndarray: An array of rewards (0.0 to 1.0) ordered like `miner_uids`
+        """
+        if result.get("status") != "success":
+            bt.logging.error(f"Scoring endpoint returned error: {result}")
+            return np.zeros(len(self.miner_uids))
+        if not self.miner_uids:
+            return np.zeros(0)
+
+        verified = {
+            int(entry["minerUID"]): entry for entry in result.get("verification", [])
+        }
+        passed = np.zeros(len(self.miner_uids), dtype=bool)
+        counts = np.zeros(len(self.miner_uids))
+        response_times = np.full(len(self.miner_uids), np.nan)
+        dates: List[Optional[str]] = [None] * len(self.miner_uids)
+        for index, uid in enumerate(self.miner_uids):
+            entry = verified.get(uid, {})
+            if uid in self._submitted and entry.get("passedValidation"):
+                passed[index] = True
+                counts[index], dates[index], response_times[index] = self._submitted[uid]
+            elif entry.get("validationError"):
+                bt.logging.debug(
+                    f"Miner UID {uid}: Failed validation - {entry['validationError']}"
+                )
+
+        scores, components = compute_scores(
+            passed, counts, parse_dates(dates), response_times, self.synapse_timeout
+        )
+        for index in np.flatnonzero(scores):
+            bt.logging.debug(
+                f"Miner UID {self.miner_uids[index]}: "
+                f"Score={scores[index]:.4f}, "
+                f"Speed={components['speedScore'][index]:.4f}, "
+                f"Volume={components['volumeScore'][index]:.4f}, "
+                f"Recency={components['recencyScore'][index]:.4f}"
+            )
+        bt.logging.info(
+            f"Scoring complete - Mean: {scores.mean():.4f}, "
+            f"Count: {len(scores)}, "
+            f"Min: {scores.min():.4f}, "
+            f"Max: {scores.max():.4f}"
+        )
+        return scores
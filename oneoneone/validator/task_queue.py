@@ -0,0 +1,115 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import asyncio
+import bittensor as bt
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from oneoneone.config import (
+    TASK_QUEUE_SIZE,
+    TASK_MAX_AGE,
+    TASK_QUEUE_RETRY_DELAY,
+)
+
+
+class SyntheticTaskQueue:
+    """
+    Bounded queue of synthetic tasks that is kept filled ahead of time by a background producer.
+
+    Place discovery on the Node.js side can take tens of seconds, so the producer creates
+    tasks while rounds are running and `get()` normally returns immediately. Tasks older
+    than `max_age` seconds are discarded on retrieval instead of being handed to a round.
+
+    Attributes:
+    - maxsize: Maximum number of ready tasks held at once
+    - max_age: Seconds after which a queued task is considered stale
+    - retry_delay: Seconds to wait before retrying after a failed task creation
+    """
+
+    def __init__(
+        self,
+        create_task: Callable[[], Awaitable[Dict[str, Any]]],
+        maxsize: int = TASK_QUEUE_SIZE,
+        max_age: float = TASK_MAX_AGE,
+        retry_delay: float = TASK_QUEUE_RETRY_DELAY,
+    ):
+        self.create_task = create_task
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.retry_delay = retry_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._producer: Optional[asyncio.Task] = None
+
+    def qsize(self) -> int:
+        """Returns the number of tasks currently waiting in the queue."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self):
+        """Starts the background producer on the running event loop if it is not already running."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        if self._producer is None or self._producer.done():
+            self._producer = asyncio.ensure_future(self._produce())
+            bt.logging.info(
+                f"Synthetic task producer started (queue size: {self.maxsize}, max age: {self.max_age}s)"
+            )
+
+    async def _produce(self):
+        """Creates tasks continuously, blocking while the queue is full."""
+        while True:
+            try:
+                task = await self.create_task()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                bt.logging.error(f"Synthetic task producer failed to create task: {e}")
+                await asyncio.sleep(self.retry_delay)
+                continue
+
+            await self._queue.put((time.monotonic(), task))
+            bt.logging.debug(
+                f"Synthetic task queued - FID: {task['dataId']}, ready: {self._queue.qsize()}"
+            )
+
+    async def get(self) -> Dict[str, Any]:
+        """
+        Pops the oldest fresh task, waiting for the producer if none is ready.
+
+        Returns:
+            dict: Task data including fid (`dataId`) and synapse parameters
+        """
+        self.start()
+        while True:
+            created_at, task = await self._queue.get()
+            age = time.monotonic() - created_at
+            if age <= self.max_age:
+                return task
+            bt.logging.info(
+                f"Discarding stale synthetic task - FID: {task['dataId']}, age: {age:.0f}s"
+            )
+
+    async def stop(self):
+        """Cancels the background producer."""
+        if self._producer is not None and not self._producer.done():
+            self._producer.cancel()
+            try:
+                await self._producer
+            except asyncio.CancelledError:
+                pass
+        self._producer = None
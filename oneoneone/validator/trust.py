@@ -0,0 +1,203 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 oneoneone
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import json
+import time
+import random
+import threading
+import bittensor as bt
+from typing import Dict, Iterable, Optional, Tuple
+
+from oneoneone.config import (
+    SPOT_CHECK_COUNT,
+    SPOT_CHECK_MIN_COUNT,
+    SPOT_CHECK_MAX_COUNT,
+    TRUST_NEW_ROUNDS,
+    TRUST_STREAK,
+    TRUST_MIN_AGE,
+    TRUST_RECOVERY_ROUNDS,
+    TRUST_AUDIT_RATE,
+)
+
+
+class TrustRecord:
+    """
+    Verification history of a single miner hotkey.
+
+    Attributes:
+    - passed: Rounds in which the miner's spot checks passed
+    - failures: Rounds in which the miner's spot checks failed
+    - streak: Consecutive passed rounds since the last failure
+    - first_seen: `time.time()` of the first verified round
+    - last_failure: `time.time()` of the last failed round, None if never
+    """
+
+    def __init__(
+        self,
+        passed: int = 0,
+        failures: int = 0,
+        streak: int = 0,
+        first_seen: Optional[float] = None,
+        last_failure: Optional[float] = None,
+    ):
+        self.passed = passed
+        self.failures = failures
+        self.streak = streak
+        self.first_seen = time.time() if first_seen is None else first_seen
+        self.last_failure = last_failure
+
+    @property
+    def rounds(self) -> int:
+        """Number of verified rounds."""
+        return self.passed + self.failures
+
+
+class TrustTracker:
+    """
+    Chooses how many reviews to spot check per miner from its verification history.
+
+    Spot checks go through the scraper actor and are the most expensive part of scoring,
+    but most of them land on miners that have passed every check so far. Records are kept
+    per hotkey, so they follow a miner across UID changes and a new hotkey on a UID starts
+    over. A miner gets `max_count` checks while it is new (fewer than `new_rounds` verified
+    rounds) or since a failure until it passed `recovery_rounds` rounds in a row, and
+    `min_count` once it passed `streak` rounds in a row and was first verified at least
+    `min_age` seconds ago. Trusted miners are still audited with the base `count` at
+    `audit_rate`, so a miner cannot tell which rounds are checked lightly. Everyone else
+    gets `count`.
+
+    Attributes:
+    - path: JSON file the records are saved to, None to keep them in memory only
+    - count: Spot checks per round for miners that are neither trusted nor suspect
+    - min_count: Spot checks per round for trusted miners
+    - max_count: Spot checks per round for new and recently failing miners
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        count: int = SPOT_CHECK_COUNT,
+        min_count: int = SPOT_CHECK_MIN_COUNT,
+        max_count: int = SPOT_CHECK_MAX_COUNT,
+        new_rounds: int = TRUST_NEW_ROUNDS,
+        streak: int = TRUST_STREAK,
+        min_age: float = TRUST_MIN_AGE,
+        recovery_rounds: int = TRUST_RECOVERY_ROUNDS,
+        audit_rate: float = TRUST_AUDIT_RATE,
+        rng: Optional[random.Random] = None,
+    ):
+        self.path = path
+        self.count = count
+        self.min_count = min_count
+        self.max_count = max_count
+        self.new_rounds = new_rounds
+        self.streak = streak
+        self.min_age = min_age
+        self.recovery_rounds = recovery_rounds
+        self.audit_rate = audit_rate
+        self._rng = rng or random.Random()
+        self._records: Dict[str, TrustRecord] = {}
+        self._lock = threading.Lock()
+        # Serializes saves of overlapping rounds, which share the temporary file
+        self._save_lock = threading.Lock()
+
+    def get(self, hotkey: str) -> TrustRecord:
+        """Returns the record of a hotkey, a fresh one if it was never verified."""
+        with self._lock:
+            return self._records.get(hotkey) or TrustRecord()
+
+    def spot_check_count(self, hotkey: str) -> int:
+        """
+        Returns the number of reviews to spot check for a miner this round.
+
+        Args:
+            hotkey: The miner hotkey
+
+        Returns:
+            int: Between `min_count` and `max_count` reviews
+        """
+        record = self.get(hotkey)
+        if record.rounds < self.new_rounds:
+            return self.max_count
+        if record.failures and record.streak < self.recovery_rounds:
+            return self.max_count
+        if (
+            record.streak >= self.streak
+            and time.time() - record.first_seen >= self.min_age
+            and self._rng.random() >= self.audit_rate
+        ):
+            return self.min_count
+        return self.count
+
+    def record(self, hotkey: str, passed: bool):
+        """
+        Records the spot check outcome of a miner in a round.
+
+        Args:
+            hotkey: The miner hotkey
+            passed: Whether the miner's spot checks passed
+        """
+        with self._lock:
+            record = self._records.setdefault(hotkey, TrustRecord())
+            if passed:
+                record.passed += 1
+                record.streak += 1
+            else:
+                record.failures += 1
+                record.streak = 0
+                record.last_failure = time.time()
+                bt.logging.debug(
+                    f"Hotkey {hotkey}: failed verification, "
+                    f"{record.failures} failures in {record.rounds} rounds"
+                )
+
+    def record_round(self, outcomes: Iterable[Tuple[str, bool]]):
+        """Records the spot check outcomes of a round as (hotkey, passed) pairs."""
+        for hotkey, passed in outcomes:
+            self.record(hotkey, passed)
+
+    def save(self):
+        """
+        Writes the records to `path` atomically, if a path is set.
+        Safe to call from a worker thread while rounds keep recording.
+        """
+        if self.path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                state = {
+                    hotkey: dict(vars(record))
+                    for hotkey, record in self._records.items()
+                }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+
+    def load(self):
+        """Reads the records saved at `path`, keeping none if the file does not exist."""
+        if self.path is None or not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            state = json.load(f)
+        with self._lock:
+            self._records = {
+                hotkey: TrustRecord(**record) for hotkey, record in state.items()
+            }
+        bt.logging.info(f"Loaded trust records of {len(self._records)} hotkeys")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the oneoneone unit tests.
+Builds the reviews and axons used across the test modules.
+"""
+
+import bittensor as bt
+
+FID = "0x89c259af3a2b3c4d:0x1234567890abcdef"
+
+
+def make_review(review_id, published="2024-03-01T10:00:00.000Z", **overrides):
+    """Build a structurally valid review for FID"""
+    review = {
+        "reviewerId": f"reviewer-{review_id}",
+        "reviewerUrl": f"https://maps.google.com/contrib/{review_id}",
+        "reviewerName": f"Reviewer {review_id}",
+        "reviewId": review_id,
+        "reviewUrl": f"https://maps.google.com/review/{review_id}",
+        "publishedAtDate": published,
+        "lastEditedAtDate": "2024-03-02T10:00:00.000Z",
+        "placeId": "ChIJN1t_tDeuEmsRUsoyG83frY4",
+        "cid": "1234567890",
+        "fid": FID,
+        "totalScore": 5,
+        "text": "Great place",
+    }
+    review.update(overrides)
+    return review
+
+
+def make_axon(hotkey, port=8091):
+    """Build the axon of a hotkey served on localhost"""
+    return bt.AxonInfo(
+        version=1,
+        ip="127.0.0.1",
+        port=port,
+        ip_type=4,
+        hotkey=hotkey,
+        coldkey=f"cold-{hotkey}",
+    )
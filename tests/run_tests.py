@@ -14,6 +14,27 @@ import argparse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from test_protocol import TestGoogleMapsReviewsSynapse
+from test_task_queue import TestSyntheticTaskQueue
+from test_scheduler import TestRoundScheduler
+from test_dendrite_pool import TestDendritePool
+from test_round_context import TestRoundContext, TestUpdateScores, TestRunLoop
+from test_timing import TestPhaseTimings
+from test_uids import TestUidAvailability, TestCoverageScheduler
+from test_liveness import TestLivenessTracker
+from test_fan_out import TestQueryFanOut
+from test_decode import (
+    TestSummarizeResponse,
+    TestSelectSpotCheckReviews,
+    TestReviewKey,
+)
+from test_scoring_session import TestScoringSession
+from test_reward import TestComputeScores, TestParseDates
+from test_client import TestValidatorApiClient
+from test_review_cache import TestVerifiedReviewCache
+from test_trust import TestTrustTracker
+from test_consensus import TestReviewConsensus
+from test_sampling import TestSpotCheckSampler
+from test_near_duplicates import TestNearDuplicateIndex
 from test_integration import TestIntegration
 
 
@@ -27,6 +48,29 @@ def run_unit_tests():
 
     # Add test cases
     suite.addTests(loader.loadTestsFromTestCase(TestGoogleMapsReviewsSynapse))
+    suite.addTests(loader.loadTestsFromTestCase(TestSyntheticTaskQueue))
+    suite.addTests(loader.loadTestsFromTestCase(TestRoundScheduler))
+    suite.addTests(loader.loadTestsFromTestCase(TestDendritePool))
+    suite.addTests(loader.loadTestsFromTestCase(TestRoundContext))
+    suite.addTests(loader.loadTestsFromTestCase(TestUpdateScores))
+    suite.addTests(loader.loadTestsFromTestCase(TestRunLoop))
+    suite.addTests(loader.loadTestsFromTestCase(TestPhaseTimings))
+    suite.addTests(loader.loadTestsFromTestCase(TestUidAvailability))
+    suite.addTests(loader.loadTestsFromTestCase(TestCoverageScheduler))
+    suite.addTests(loader.loadTestsFromTestCase(TestLivenessTracker))
+    suite.addTests(loader.loadTestsFromTestCase(TestQueryFanOut))
+    suite.addTests(loader.loadTestsFromTestCase(TestSummarizeResponse))
+    suite.addTests(loader.loadTestsFromTestCase(TestSelectSpotCheckReviews))
+    suite.addTests(loader.loadTestsFromTestCase(TestReviewKey))
+    suite.addTests(loader.loadTestsFromTestCase(TestScoringSession))
+    suite.addTests(loader.loadTestsFromTestCase(TestComputeScores))
+    suite.addTests(loader.loadTestsFromTestCase(TestParseDates))
+    suite.addTests(loader.loadTestsFromTestCase(TestValidatorApiClient))
+    suite.addTests(loader.loadTestsFromTestCase(TestVerifiedReviewCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestTrustTracker))
+    suite.addTests(loader.loadTestsFromTestCase(TestReviewConsensus))
+    suite.addTests(loader.loadTestsFromTestCase(TestSpotCheckSampler))
+    suite.addTests(loader.loadTestsFromTestCase(TestNearDuplicateIndex))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone validator API client.
+Tests request body compression against a local aiohttp server.
+"""
+
+import sys
+import os
+import json
+import asyncio
+import unittest
+
+from aiohttp import web
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.base.utils.timing import PhaseTimings
+from oneoneone.validator.client import ValidatorApiClient
+
+
+class TestValidatorApiClient(unittest.TestCase):
+    """Test cases for ValidatorApiClient"""
+
+    def run_calls(self, payloads, accept_gzip=True, **client_kwargs):
+        """Post payloads to a local echo server and return the received requests"""
+        received = []
+
+        async def echo(request):
+            # aiohttp inflates gzip request bodies, like the Express JSON parser
+            encoding = request.headers.get("Content-Encoding")
+            received.append((encoding, request.content_length))
+            if encoding == "gzip" and not accept_gzip:
+                return web.json_response({"error": "unsupported"}, status=415)
+            return web.json_response({"echo": await request.json()})
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/echo", echo)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            client = ValidatorApiClient(host="127.0.0.1", port=port, **client_kwargs)
+            try:
+                return client, [
+                    await client.post("/echo", payload, timeout=5)
+                    for payload in payloads
+                ]
+            finally:
+                await client.close()
+                await runner.cleanup()
+
+        client, results = asyncio.run(run())
+        for payload, result in zip(payloads, results):
+            self.assertEqual(result["echo"], payload)
+        return client, received
+
+    def test_large_bodies_compressed(self):
+        """Test that only bodies above the threshold are gzip compressed"""
+        timings = PhaseTimings(window=10)
+        large = {"reviews": [{"text": "Great place"} for _ in range(5000)]}
+        _, received = self.run_calls(
+            [{"small": True}, large], compress_min_bytes=1024, timings=timings
+        )
+
+        self.assertEqual([encoding for encoding, _ in received], [None, "gzip"])
+        encoded = timings.last("api.encode", path="/echo")
+        self.assertEqual(encoded["bytes_encoded"], len(json.dumps(large)))
+        self.assertEqual(encoded["bytes_sent"], received[-1][1])
+        self.assertLess(encoded["bytes_sent"], encoded["bytes_encoded"] / 10)
+
+    def test_rejected_encoding_falls_back_to_plain_json(self):
+        """Test that a 415 turns compression off and retries uncompressed"""
+        large = {"reviews": [{"text": "Great place"} for _ in range(5000)]}
+        client, received = self.run_calls(
+            [large, large], accept_gzip=False, compress_min_bytes=1024
+        )
+
+        self.assertEqual(
+            [encoding for encoding, _ in received], ["gzip", None, None]
+        )
+        self.assertIsNone(client.compression)
+
+    def test_no_time_left(self):
+        """Test that a non-positive timeout fails instead of waiting without a limit"""
+
+        async def run():
+            client = ValidatorApiClient(host="127.0.0.1", port=1)
+            try:
+                await client.post("/echo", {}, timeout=0)
+            finally:
+                await client.close()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone review consensus module.
+Tests the ReviewConsensus quorum, dispute and owner rules.
+"""
+
+import sys
+import os
+import unittest
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.consensus import ReviewConsensus
+from tests.helpers import FID, make_review
+
+
+class TestReviewConsensus(unittest.TestCase):
+    """Test cases for ReviewConsensus"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.consensus = ReviewConsensus(quorum=2)
+
+    def test_quorum_of_owners_agrees(self):
+        """Test that records become agreed once the quorum returned them"""
+        review = make_review("a")
+        self.consensus.add("coldkey-1", [review])
+        self.assertEqual(self.consensus.agreed([review]), [])
+
+        # Fields the spot check does not compare may differ between miners
+        self.consensus.add("coldkey-2", [make_review("a", reviewerName="Other")])
+        self.assertEqual(
+            self.consensus.agreed([review]),
+            [
+                {
+                    "reviewId": "a",
+                    "fid": FID,
+                    "reviewerId": "reviewer-a",
+                    "placeId": "ChIJN1t_tDeuEmsRUsoyG83frY4",
+                    "text": "Great place",
+                    "publishedAtDate": "2024-03-02T10:00:00.000Z",
+                }
+            ],
+        )
+
+    def test_same_owner_counts_once(self):
+        """Test that miners of the same owner do not reach the quorum alone"""
+        review = make_review("a")
+        self.consensus.add("coldkey-1", [review])
+        self.consensus.add("coldkey-1", [review])
+        self.assertFalse(self.consensus.is_agreed(review))
+
+    def test_disputed_records_not_agreed(self):
+        """Test that a reviewId returned in several versions is never agreed"""
+        review = make_review("a")
+        self.consensus.add("coldkey-1", [review])
+        self.consensus.add("coldkey-2", [review])
+        self.consensus.add("coldkey-3", [make_review("a", text="Edited")])
+        self.assertFalse(self.consensus.is_agreed(review))
+
+    def test_records_without_edit_date_not_agreed(self):
+        """Test that records the spot check cannot compare are verified externally"""
+        review = make_review("a", lastEditedAtDate=None)
+        self.consensus.add("coldkey-1", [review])
+        self.consensus.add("coldkey-2", [review])
+        self.assertFalse(self.consensus.is_agreed(review))
+
+
+if __name__ == "__main__":
+    unittest.main()
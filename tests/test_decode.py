@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone response decode module.
+Tests deduplication, structural validation and spot check sampling of miner responses.
+"""
+
+import sys
+import os
+import json
+import unittest
+from datetime import datetime, timezone
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.decode import (
+    intern_reviews,
+    parse_date,
+    review_key,
+    select_spot_check_reviews,
+    summarize_response,
+    summary_payload,
+)
+from tests.helpers import FID, make_review
+
+
+class TestSummarizeResponse(unittest.TestCase):
+    """Test cases for summarize_response"""
+
+    def test_valid_response(self):
+        """Test that a valid response passes with its most recent date"""
+        reviews = [
+            make_review("a", "2024-03-01T10:00:00.000Z"),
+            make_review("b", "2024-05-01T10:00:00.000Z"),
+            make_review("c", "2023-12-01T10:00:00.000Z"),
+        ]
+        summary = summarize_response(FID, reviews)
+
+        self.assertTrue(summary["passedValidation"])
+        self.assertIsNone(summary["validationError"])
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["mostRecentDate"], "2024-05-01T10:00:00.000Z")
+
+    def test_mixed_naive_and_aware_dates(self):
+        """Test that dates without an offset are compared as UTC"""
+        reviews = [
+            make_review("a", "2024-03-01T10:00:00.000Z"),
+            make_review("b", "2024-05-01T10:00:00"),
+            make_review("c", "2024-04-01T10:00:00+02:00"),
+        ]
+        summary = summarize_response(FID, reviews)
+
+        self.assertTrue(summary["passedValidation"])
+        self.assertEqual(summary["mostRecentDate"], "2024-05-01T10:00:00")
+        self.assertEqual(
+            parse_date("2024-05-01T10:00:00"),
+            datetime(2024, 5, 1, 10, tzinfo=timezone.utc),
+        )
+
+    def test_duplicates_keep_first_position_and_last_occurrence(self):
+        """Test that duplicate reviewIds are removed like the Node.js uniqueBy"""
+        reviews = [
+            make_review("a", text="first"),
+            make_review("b"),
+            make_review("a", text="second"),
+        ]
+        summary = summarize_response(FID, reviews)
+
+        self.assertEqual(summary["received"], 3)
+        self.assertEqual(summary["duplicates"], 1)
+        self.assertEqual([r["reviewId"] for r in summary["reviews"]], ["a", "b"])
+        self.assertEqual(summary["reviews"][0]["text"], "second")
+
+    def test_invalid_review_fails_response(self):
+        """Test that one invalid review fails the whole response"""
+        for invalid in (
+            make_review("b", fid="0x0:0x0"),
+            make_review("b", totalScore="5"),
+            make_review("b", totalScore=True),
+            {k: v for k, v in make_review("b").items() if k != "cid"},
+            "not a review",
+        ):
+            summary = summarize_response(FID, [make_review("a"), invalid])
+            self.assertFalse(summary["passedValidation"])
+            self.assertEqual(
+                summary["validationError"],
+                "Structural validation failed on review objects",
+            )
+            self.assertEqual(summary["invalid"], 1)
+
+    def test_unhashable_review_id_fails_response(self):
+        """Test that non-string reviewIds fail validation instead of breaking the dedupe"""
+        for review_id in ([1], {"id": 1}, None):
+            summary = summarize_response(
+                FID, [make_review("a"), make_review("b", reviewId=review_id)]
+            )
+            self.assertFalse(summary["passedValidation"])
+            self.assertEqual(
+                summary["validationError"],
+                "Structural validation failed on review objects",
+            )
+            self.assertEqual(summary["invalid"], 1)
+
+    def test_not_an_array_or_empty(self):
+        """Test the Node.js response validity errors"""
+        self.assertEqual(
+            summarize_response(FID, None)["validationError"], "Response is not an array"
+        )
+        self.assertEqual(
+            summarize_response(FID, {"reviews": []})["validationError"],
+            "Response is not an array",
+        )
+        self.assertEqual(
+            summarize_response(FID, [])["validationError"], "Response is empty"
+        )
+
+    def test_raw_json_body(self):
+        """Test that raw JSON bodies are decoded before validation"""
+        body = json.dumps([make_review("a"), make_review("b")]).encode()
+        self.assertTrue(summarize_response(FID, body)["passedValidation"])
+        self.assertEqual(
+            summarize_response(FID, b"{not json")["validationError"],
+            "Response is not an array",
+        )
+
+
+class TestSelectSpotCheckReviews(unittest.TestCase):
+    """Test cases for spot check sampling and summary payloads"""
+
+    def test_most_recent_first_and_distinct(self):
+        """Test that the most recent review leads a sample of distinct reviews"""
+        reviews = [
+            make_review(str(day), f"2024-03-{day:02d}T10:00:00.000Z")
+            for day in range(1, 21)
+        ]
+
+        for _ in range(20):
+            selected = select_spot_check_reviews(reviews, 3)
+            self.assertEqual(selected[0]["reviewId"], "20")
+            self.assertEqual(len({review["reviewId"] for review in selected}), 3)
+
+    def test_fewer_reviews_than_count(self):
+        """Test that small responses are sampled entirely"""
+        reviews = [make_review("a"), make_review("b", "2024-04-01T10:00:00.000Z")]
+
+        self.assertEqual(
+            [review["reviewId"] for review in select_spot_check_reviews(reviews, 3)],
+            ["b", "a"],
+        )
+        self.assertEqual(select_spot_check_reviews(reviews, 0), [])
+        self.assertEqual(select_spot_check_reviews([], 3), [])
+
+    def test_summary_payload(self):
+        """Test that the payload keeps only the count, date and sampled reviews"""
+        reviews = [make_review(str(index)) for index in range(100)]
+        payload = summary_payload(summarize_response(FID, reviews))
+
+        self.assertEqual(set(payload), {"count", "mostRecentDate", "spotCheckReviews"})
+        self.assertEqual(payload["count"], 100)
+        self.assertEqual(len(payload["spotCheckReviews"]), 3)
+        self.assertLess(len(json.dumps(payload)), len(json.dumps(reviews)) / 10)
+
+    def test_failed_summary_payload(self):
+        """Test that failed responses are sent without reviews"""
+        payload = summary_payload(summarize_response(FID, []))
+
+        self.assertEqual(payload["count"], 0)
+        self.assertEqual(payload["spotCheckReviews"], [])
+
+
+class TestReviewKey(unittest.TestCase):
+    """Test cases for content-addressed reviews"""
+
+    def test_identical_records_share_a_key(self):
+        """Test that the key depends on the content only, not on key order"""
+        review = make_review("a")
+        reordered = dict(reversed(list(review.items())))
+
+        self.assertEqual(review_key(review), review_key(reordered))
+        self.assertNotEqual(
+            review_key(review), review_key(make_review("a", text="edited"))
+        )
+
+    def test_intern_reviews(self):
+        """Test that distinct reviews are stored once and referenced in order"""
+        store = {}
+        first = intern_reviews([make_review("a"), make_review("b")], store)
+        second = intern_reviews([make_review("b"), make_review("a")], store)
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(second, first[::-1])
+        self.assertEqual(store[first[0]]["reviewId"], "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
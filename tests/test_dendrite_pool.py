@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone dendrite pool.
+Tests per-axon reuse, eviction, warmup and response sizes of pooled connections.
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+
+from aiohttp import web
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.base.utils.dendrite_pool import DendritePool
+from tests.helpers import make_axon
+
+
+class PooledDendrite:
+    """Stands in for bt.dendrite, which needs network access to resolve its external ip"""
+
+    def __init__(self):
+        self._session = None
+        self.closed = False
+
+    @property
+    async def session(self):
+        return self._session
+
+    async def aclose_session(self):
+        self.closed = True
+        await self._session.close()
+
+
+
+class TestDendritePool(unittest.TestCase):
+    """Test cases for DendritePool"""
+
+    def make_pool(self, max_axons=8):
+        return DendritePool(
+            PooledDendrite(),
+            max_axons=max_axons,
+            connections_per_axon=2,
+            keepalive_timeout=10,
+            warmup_timeout=1,
+        )
+
+    def test_dendrite_reused_per_axon(self):
+        """Test that an axon keeps its dendrite until its hotkey, ip or port changes"""
+
+        async def run():
+            pool = self.make_pool()
+            first = pool.get(make_axon("hk1"))
+            again = pool.get(make_axon("hk1"))
+            moved = pool.get(make_axon("hk1", port=9000))
+            other = pool.get(make_axon("hk2"))
+            await pool.close()
+            return first, again, moved, other
+
+        first, again, moved, other = asyncio.run(run())
+        self.assertIs(first, again)
+        self.assertIsNot(first, moved)
+        self.assertIsNot(first, other)
+        self.assertIsNot(first._session, other._session)
+
+    def test_least_recently_used_closed_first(self):
+        """Test that the pool keeps at most max_axons and closes the least recently used"""
+
+        async def run():
+            pool = self.make_pool(max_axons=2)
+            first = pool.get(make_axon("hk1"))
+            second = pool.get(make_axon("hk2"))
+            pool.get(make_axon("hk1"))
+            pool.get(make_axon("hk3"))
+            await asyncio.sleep(0.01)
+            state = len(pool), first.closed, second.closed
+            await pool.close()
+            return state
+
+        size, first_closed, second_closed = asyncio.run(run())
+        self.assertEqual(size, 2)
+        self.assertTrue(second_closed)
+        self.assertFalse(first_closed)
+
+    def test_evict_closes_connections(self):
+        """Test that evicted axons get a fresh dendrite on their next query"""
+
+        async def run():
+            pool = self.make_pool()
+            axon = make_axon("hk1")
+            evicted = pool.get(axon)
+            pool.evict([axon, make_axon("unknown")])
+            await asyncio.sleep(0.01)
+            closed = evicted.closed
+            fresh = pool.get(axon)
+            await pool.close()
+            return evicted, closed, fresh
+
+        evicted, closed, fresh = asyncio.run(run())
+        self.assertTrue(closed)
+        self.assertIsNot(evicted, fresh)
+
+    def test_warmup_opens_a_connection_per_axon(self):
+        """Test that warmup reaches every axon and ignores unreachable ones"""
+        requests = []
+
+        async def handle(request):
+            requests.append(request.method)
+            return web.Response()
+
+        async def run():
+            app = web.Application()
+            app.router.add_route("HEAD", "/", handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            pool = self.make_pool()
+            await pool.warmup(
+                [make_axon("hk1", port), make_axon("hk2", port), make_axon("hk3", 1)],
+                max_concurrency=2,
+            )
+            await pool.close()
+            await runner.cleanup()
+
+        asyncio.run(run())
+        self.assertEqual(requests, ["HEAD", "HEAD"])
+
+    def test_last_response_bytes(self):
+        """Test that each pooled dendrite records the body size of its last response"""
+
+        async def handle(request):
+            return web.Response(body=b"x" * int(request.query["size"]))
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/", handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            pool = self.make_pool()
+            dendrites = []
+            for hotkey, size in (("hk1", 64), ("hk2", 16)):
+                dendrite = pool.get(make_axon(hotkey, port))
+                session = await dendrite.session
+                async with session.get(f"http://127.0.0.1:{port}/?size={size}") as response:
+                    await response.read()
+                dendrites.append(dendrite)
+            sizes = [dendrite.last_response_bytes for dendrite in dendrites]
+            await pool.close()
+            await runner.cleanup()
+            return sizes
+
+        self.assertEqual(asyncio.run(run()), [64, 16])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone validator fan-out module.
+Tests the QueryFanOut launch schedule, in-flight limit and memory budget.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import unittest
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.fan_out import QueryFanOut
+
+
+class TestQueryFanOut(unittest.TestCase):
+    """Test cases for QueryFanOut"""
+
+    def test_started_only_for_queries_holding_a_slot(self):
+        """Test that queries cancelled while waiting for a slot never started"""
+
+        async def run():
+            fan_out = QueryFanOut(
+                max_in_flight=1, launch_batch=2, launch_interval=0, memory_budget=1000, reserve_bytes=0
+            )
+            release = asyncio.Event()
+
+            async def query():
+                await release.wait()
+
+            futures = fan_out.launch([query, query])
+            await asyncio.sleep(0.01)
+            started = [fan_out.started(future) for future in futures]
+            for future in futures:
+                future.cancel()
+            await asyncio.wait(futures)
+            return started, [fan_out.started(future) for future in futures]
+
+        before, after = asyncio.run(run())
+        self.assertEqual(before, [True, False])
+        self.assertEqual(after, [True, False])
+
+    def test_started_false_before_launch_stage(self):
+        """Test that queries of a later launch stage have not started yet"""
+
+        async def run():
+            fan_out = QueryFanOut(
+                max_in_flight=4, launch_batch=1, launch_interval=10, memory_budget=1000, reserve_bytes=0
+            )
+
+            async def query():
+                return True
+
+            futures = fan_out.launch([query, query])
+            await asyncio.sleep(0.01)
+            started = [fan_out.started(future) for future in futures]
+            futures[1].cancel()
+            await asyncio.wait(futures)
+            return started, futures[0].result()
+
+        started, result = asyncio.run(run())
+        self.assertEqual(started, [True, False])
+        self.assertTrue(result)
+
+    def test_in_flight_limit(self):
+        """Test that at most max_in_flight queries run at the same time"""
+        active = {"now": 0, "max": 0}
+
+        async def query():
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return True
+
+        async def run():
+            fan_out = QueryFanOut(
+                max_in_flight=3, launch_batch=10, launch_interval=0, memory_budget=1000, reserve_bytes=0
+            )
+            return await asyncio.gather(*fan_out.launch([query] * 10))
+
+        self.assertEqual(asyncio.run(run()), [True] * 10)
+        self.assertEqual(active["max"], 3)
+
+    def test_launch_stages(self):
+        """Test that queries are released in batches every launch interval"""
+        starts = []
+
+        async def query():
+            starts.append(time.monotonic())
+
+        async def run():
+            fan_out = QueryFanOut(
+                max_in_flight=10,
+                launch_batch=2,
+                launch_interval=0.1,
+                memory_budget=1000,
+                reserve_bytes=0,
+            )
+            begin = time.monotonic()
+            await asyncio.gather(*fan_out.launch([query] * 5))
+            return [round((start - begin) / 0.1) for start in starts]
+
+        self.assertEqual(asyncio.run(run()), [0, 0, 1, 1, 2])
+
+    def test_memory_budget_pauses_launches(self):
+        """Test that no query starts while held responses exceed the memory budget"""
+        started = []
+
+        async def run():
+            fan_out = QueryFanOut(
+                max_in_flight=10, launch_batch=10, launch_interval=0, memory_budget=100, reserve_bytes=0
+            )
+            release = fan_out.hold(150)
+
+            async def query():
+                started.append(fan_out.held_bytes)
+
+            futures = fan_out.launch([query, query])
+            await asyncio.sleep(0.01)
+            paused = list(started)
+            release()
+            await asyncio.gather(*futures)
+            return paused
+
+        self.assertEqual(asyncio.run(run()), [])
+        self.assertEqual(started, [0, 0])
+
+    def make_reserving_fan_out(self):
+        return QueryFanOut(
+            max_in_flight=10,
+            launch_batch=10,
+            launch_interval=0,
+            memory_budget=100,
+            reserve_bytes=40,
+        )
+
+    def test_reservations_pause_launches(self):
+        """Test that queries reserve their bytes before they start and until settled"""
+
+        async def run():
+            fan_out = self.make_reserving_fan_out()
+            responses = asyncio.Event()
+
+            async def query():
+                await responses.wait()
+                return 10
+
+            futures = fan_out.launch([query] * 3)
+            await asyncio.sleep(0.01)
+            running = [fan_out.started(future) for future in futures], fan_out.held_bytes
+
+            responses.set()
+            await asyncio.wait(futures[:2])
+            releases = [fan_out.settle(future, future.result()) for future in futures[:2]]
+            await asyncio.sleep(0.01)
+            settled = fan_out.started(futures[2]), fan_out.held_bytes
+
+            await asyncio.wait(futures[2:])
+            for release in releases + [fan_out.settle(futures[2], 10)]:
+                release()
+            return running, settled, fan_out.held_bytes
+
+        running, settled, held = asyncio.run(run())
+        self.assertEqual(running, ([True, True, False], 80))
+        self.assertEqual(settled, (True, 60))
+        self.assertEqual(held, 0)
+
+    def test_failed_queries_release_their_reservation(self):
+        """Test that failing and cancelled queries give their reservation back"""
+
+        async def run():
+            fan_out = self.make_reserving_fan_out()
+            forever = asyncio.Event()
+
+            async def fail():
+                raise RuntimeError("failed")
+
+            async def hang():
+                await forever.wait()
+
+            futures = fan_out.launch([fail, hang])
+            await asyncio.sleep(0.01)
+            held = fan_out.held_bytes
+            futures[1].cancel()
+            await asyncio.wait(futures)
+            return held, fan_out.held_bytes, type(futures[0].exception())
+
+        self.assertEqual(asyncio.run(run()), (40, 0, RuntimeError))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone miner liveness module.
+Tests the LivenessTracker backoff schedule and its reset on metagraph resyncs.
+"""
+
+import sys
+import os
+import time
+import threading
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.base.utils.dendrite_pool import DendritePool
+from oneoneone.base.utils.liveness import LivenessTracker
+from oneoneone.base.validator import BaseValidatorNeuron
+from tests.helpers import make_axon
+
+
+class TestLivenessTracker(unittest.TestCase):
+    """Test cases for LivenessTracker"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = LivenessTracker(
+            failure_threshold=2, base_backoff=100, max_backoff=250
+        )
+
+    def test_unknown_uid_is_due(self):
+        """Test that never queried uids are due"""
+        self.assertTrue(self.tracker.is_due(7))
+        self.assertEqual(self.tracker.get(7).consecutive_failures, 0)
+
+    def test_backoff_starts_at_threshold(self):
+        """Test that uids are only backed off after reaching the failure threshold"""
+        self.tracker.record_failure(1, "timeout")
+        self.assertTrue(self.tracker.is_due(1))
+
+        self.tracker.record_failure(1, "unreachable")
+        self.assertFalse(self.tracker.is_due(1))
+        self.assertEqual(self.tracker.get(1).last_error, "unreachable")
+        self.assertEqual(self.tracker.due([1, 2]), [2])
+
+    def test_backoff_doubles_up_to_maximum(self):
+        """Test that the backoff grows exponentially and is capped"""
+        backoffs = []
+        for _ in range(4):
+            self.tracker.record_failure(1, "timeout")
+            backoffs.append(self.tracker.get(1).next_probe - time.monotonic())
+
+        self.assertAlmostEqual(backoffs[1], 100, delta=1)
+        self.assertAlmostEqual(backoffs[2], 200, delta=1)
+        self.assertAlmostEqual(backoffs[3], 250, delta=1)
+
+    def test_success_clears_backoff(self):
+        """Test that a successful query makes the uid due again"""
+        for _ in range(3):
+            self.tracker.record_failure(1, "timeout")
+        self.tracker.record_success(1)
+
+        record = self.tracker.get(1)
+        self.assertTrue(self.tracker.is_due(1))
+        self.assertEqual(record.consecutive_failures, 0)
+        self.assertIsNotNone(record.last_success)
+
+    def test_reset_forgets_history(self):
+        """Test that resetting a uid gives it a clean record"""
+        for _ in range(3):
+            self.tracker.record_failure(1, "timeout")
+        self.tracker.reset([1])
+
+        self.assertTrue(self.tracker.is_due(1))
+        self.assertEqual(self.tracker.get(1).consecutive_failures, 0)
+
+    def test_resync_resets_changed_axons(self):
+        """Test that a metagraph resync gives new and moved axons a clean record"""
+        axons = [make_axon("hk0"), make_axon("hk1"), make_axon("hk2")]
+        synced = [
+            make_axon("hk0"),
+            make_axon("new-owner"),
+            make_axon("hk2", port=9000),
+            make_axon("hk3"),
+        ]
+
+        def sync(subtensor):
+            validator.metagraph.axons = synced
+            validator.metagraph.hotkeys = [axon.hotkey for axon in synced]
+            validator.metagraph.n = len(synced)
+
+        validator = SimpleNamespace(
+            metagraph=SimpleNamespace(
+                axons=axons, hotkeys=[axon.hotkey for axon in axons], n=3, sync=sync
+            ),
+            subtensor=None,
+            dendrite_pool=DendritePool(None, 8, 1, 10, 1),
+            liveness=self.tracker,
+            lock=threading.Lock(),
+            hotkeys=[axon.hotkey for axon in axons],
+            scores=np.ones(3),
+        )
+        for uid in range(4):
+            for _ in range(2):
+                self.tracker.record_failure(uid, "timeout")
+
+        BaseValidatorNeuron.resync_metagraph(validator)
+
+        self.assertEqual(self.tracker.due(range(4)), [1, 2, 3])
+        self.assertEqual(validator.scores.tolist(), [1.0, 0.0, 1.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
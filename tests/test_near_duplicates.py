@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone near-duplicate detection module.
+Tests the MinHash/LSH NearDuplicateIndex.
+"""
+
+import sys
+import os
+import random
+import unittest
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.near_duplicates import NearDuplicateIndex
+
+TEXT = (
+    "We came here for a late dinner after the concert and the staff kept the kitchen "
+    "open for us. The lasagna was rich and the tiramisu was the best I have had in years."
+)
+WORDS = (
+    "food service staff place table dinner lunch wine coffee dessert friendly slow "
+    "quick price view music parking clean noisy cozy"
+).split()
+
+
+def random_text(rng):
+    """Build an unrelated review text"""
+    return " ".join(rng.choice(WORDS) for _ in range(40))
+
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    """Test cases for NearDuplicateIndex"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.index = NearDuplicateIndex(min_text_length=20, max_entries=100)
+
+    def test_templated_text_flagged(self):
+        """Test that lightly edited copies under another reviewId are flagged"""
+        self.assertEqual(self.index.add("fid-1", "a", TEXT, "miner-1"), [])
+
+        edited = TEXT.replace("late dinner", "late  Dinner").replace("years", "years!")
+        [duplicate] = self.index.add("fid-1", "b", edited, "miner-2")
+        self.assertEqual(duplicate.match_review_id, "a")
+        self.assertEqual(duplicate.match_owner, "miner-1")
+        self.assertGreaterEqual(duplicate.similarity, 0.8)
+        self.assertFalse(duplicate.cross_place)
+
+    def test_recycled_text_across_places(self):
+        """Test that a text reused for another place is flagged as recycled"""
+        flagged = self.index.add_round("fid-1", {"miner-1": [("a", TEXT)]})
+        self.assertEqual(flagged, {})
+
+        flagged = self.index.add_round("fid-2", {"miner-1": [("b", TEXT)]})
+        self.assertTrue(flagged["miner-1"][0].cross_place)
+
+    def test_same_review_and_short_texts_not_flagged(self):
+        """Test that the same review from several miners and short texts pass"""
+        flagged = self.index.add_round(
+            "fid-1",
+            {
+                "miner-1": [("a", TEXT), ("b", "Great place!")],
+                "miner-2": [("a", TEXT), ("c", "Great place!"), ("d", None)],
+            },
+        )
+        self.assertEqual(flagged, {})
+        self.assertEqual(len(self.index), 1)
+
+    def test_unrelated_texts_not_flagged(self):
+        """Test that distinct texts are not reported as near duplicates"""
+        rng = random.Random(0)
+        for index in range(50):
+            self.assertEqual(
+                self.index.add("fid-1", str(index), random_text(rng), "miner-1"), []
+            )
+
+    def test_memory_bound_evicts_oldest(self):
+        """Test that the index keeps at most max_entries texts, evicting the oldest"""
+        index = NearDuplicateIndex(min_text_length=20, max_entries=10)
+        index.add("fid-1", "original", TEXT, "miner-1")
+
+        rng = random.Random(1)
+        for review_id in range(10):
+            index.add("fid-1", str(review_id), random_text(rng), "miner-1")
+
+        self.assertEqual(len(index), 10)
+        self.assertEqual(index.add("fid-1", "copy", TEXT, "miner-2"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,10 +8,13 @@ import sys
 import os
 import unittest
 
+from pydantic import ValidationError
+
 # Add the parent directory to the path so we can import oneoneone
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from oneoneone.protocol import GoogleMapsReviewsSynapse
+from oneoneone.config import MAX_RESPONSE_REVIEWS, MAX_REVIEW_FIELD_LENGTH
 
 
 class TestGoogleMapsReviewsSynapse(unittest.TestCase):
@@ -125,6 +128,26 @@ class TestGoogleMapsReviewsSynapse(unittest.TestCase):
         self.assertEqual(synapse.sort, "highest")
         self.assertIsNone(synapse.reviews)
 
+    def test_synapse_review_count_limit(self):
+        """Test that responses over the review count limit are rejected"""
+        reviews = self.test_reviews * MAX_RESPONSE_REVIEWS
+        synapse = GoogleMapsReviewsSynapse(fid=self.test_fid, reviews=reviews)
+        self.assertEqual(len(synapse.reviews), MAX_RESPONSE_REVIEWS)
+
+        with self.assertRaisesRegex(ValidationError, "Response limit exceeded"):
+            GoogleMapsReviewsSynapse(fid=self.test_fid, reviews=reviews + reviews[:1])
+
+    def test_synapse_field_length_limit(self):
+        """Test that responses with oversized strings, nested or not, are rejected"""
+        text = "x" * (MAX_REVIEW_FIELD_LENGTH + 1)
+
+        with self.assertRaisesRegex(ValidationError, "Response limit exceeded"):
+            GoogleMapsReviewsSynapse(fid=self.test_fid, reviews=[{"text": text}])
+        with self.assertRaisesRegex(ValidationError, "Response limit exceeded"):
+            GoogleMapsReviewsSynapse(
+                fid=self.test_fid, reviews=[{"reviewImageUrls": ["ok", text]}]
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
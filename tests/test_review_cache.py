@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone verified review cache.
+Tests lookups, TTL expiry and persistence of verified reviews.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import unittest
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.review_cache import VerifiedReviewCache
+
+FID = "0x89c259af3a2b3c4d:0x1234567890abcdef"
+
+
+def make_verified(review_id, fid=FID):
+    """Build a verified review as returned by the scoring session"""
+    return {
+        "reviewId": review_id,
+        "fid": fid,
+        "reviewerId": f"reviewer-{review_id}",
+        "placeId": "ChIJN1t_tDeuEmsRUsoyG83frY4",
+        "text": "Great place",
+        "publishedAtDate": "2024-03-01T10:00:00.000Z",
+    }
+
+
+class TestVerifiedReviewCache(unittest.TestCase):
+    """Test cases for VerifiedReviewCache"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "verified_reviews.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_stored_reviews_of_fid(self):
+        """Test that only stored reviews of the queried fid are returned"""
+        cache = VerifiedReviewCache(self.path)
+        stored = cache.put(
+            [make_verified("a"), make_verified("b", fid="other"), {"reviewId": "c"}]
+        )
+
+        self.assertEqual(stored, 2)
+        self.assertEqual(cache.get(FID, ["a", "b", "c", "a"]), [make_verified("a")])
+        self.assertEqual(cache.get(FID, []), [])
+        cache.close()
+
+    def test_expired_reviews_ignored_and_pruned(self):
+        """Test that reviews older than the TTL are verified again"""
+        cache = VerifiedReviewCache(self.path, ttl=60)
+        cache.put([make_verified("a")])
+        cache._db.execute(
+            "UPDATE verified_reviews SET verified_at = ?", (time.time() - 120,)
+        )
+        cache.put([make_verified("b")])
+
+        self.assertEqual(cache.get(FID, ["a", "b"]), [make_verified("b")])
+        self.assertEqual(cache.prune(), 1)
+        cache.close()
+
+    def test_persisted_across_instances(self):
+        """Test that verified reviews survive a validator restart"""
+        cache = VerifiedReviewCache(self.path)
+        cache.put([make_verified("a")])
+        cache.close()
+
+        cache = VerifiedReviewCache(self.path)
+        self.assertEqual(cache.get(FID, ["a"]), [make_verified("a")])
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
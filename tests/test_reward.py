@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone reward module.
+Tests the NumPy scoring engine against the Node.js calculateFinalScores formula.
+"""
+
+import sys
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.reward import compute_scores, parse_dates
+
+
+def reference_scores(passed, counts, dates, response_times, synapse_timeout):
+    """Line-by-line port of calculateFinalScores in calculate-final-scores.js"""
+    response_times = [rt or synapse_timeout for rt in response_times]
+    valid = [
+        i
+        for i in range(len(passed))
+        if passed[i] and response_times[i] < synapse_timeout
+    ]
+    if not valid:
+        return [0] * len(passed)
+
+    t_min = min(response_times[i] for i in valid)
+    v_max = max(counts[i] for i in valid)
+    valid_dates = [dates[i] for i in valid if dates[i] is not None]
+    newest = max(valid_dates) if valid_dates else None
+    oldest = min(valid_dates) if valid_dates else None
+    date_range = (newest - oldest).total_seconds() * 1000 if valid_dates else 0
+
+    scores = []
+    for i in range(len(passed)):
+        if not passed[i] or response_times[i] >= synapse_timeout:
+            scores.append(0)
+            continue
+        speed = t_min / response_times[i] if response_times[i] > 0 else 0
+        volume = counts[i] / v_max if v_max > 0 else 0
+        recency = 0
+        if dates[i] is not None and date_range > 0:
+            recency = (dates[i] - oldest).total_seconds() * 1000 / date_range
+        elif dates[i] is not None and date_range == 0:
+            recency = 1
+        scores.append(round(0.3 * speed + 0.5 * volume + 0.2 * recency, 4))
+    return scores
+
+
+class TestComputeScores(unittest.TestCase):
+    """Test cases for the vectorized scoring engine"""
+
+    def test_node_example(self):
+        """Test the example of calculate-final-scores.test.js"""
+        scores, components = compute_scores(
+            passed=[True, True],
+            counts=[100, 50],
+            most_recent_dates=parse_dates(
+                ["2024-03-20T10:00:00.000Z", "2024-03-19T10:00:00.000Z"]
+            ),
+            response_times=[10, 20],
+            synapse_timeout=120,
+        )
+
+        np.testing.assert_array_equal(scores, [1, 0.4])
+        np.testing.assert_array_equal(components["speedScore"], [1, 0.5])
+        np.testing.assert_array_equal(components["volumeScore"], [1, 0.5])
+        np.testing.assert_array_equal(components["recencyScore"], [1, 0])
+
+    def test_parity_with_reference(self):
+        """Test that random rounds score the same as the reference formula"""
+        rng = np.random.default_rng(7)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        for _ in range(200):
+            n = int(rng.integers(1, 60))
+            passed = (rng.random(n) > 0.3).tolist()
+            counts = rng.integers(1, 200, n).tolist()
+            dates = [
+                start + timedelta(minutes=int(rng.integers(0, 60 * 24 * 90)))
+                if rng.random() > 0.1
+                else None
+                for _ in range(n)
+            ]
+            response_times = [
+                float(rng.choice([0, rng.uniform(0.1, 130)])) for _ in range(n)
+            ]
+            # Identical dates exercise the zero date range branch
+            if rng.random() > 0.8:
+                dates = [start if date is not None else None for date in dates]
+
+            expected = reference_scores(passed, counts, dates, response_times, 120)
+            scores, _ = compute_scores(
+                passed,
+                counts,
+                parse_dates(
+                    [
+                        date.strftime("%Y-%m-%dT%H:%M:%S.000Z") if date else None
+                        for date in dates
+                    ]
+                ),
+                response_times,
+                120,
+            )
+            np.testing.assert_allclose(scores, expected, atol=1e-4)
+
+    def test_no_valid_results(self):
+        """Test that rounds without valid results score zero"""
+        scores, _ = compute_scores(
+            [False, True], [10, 10], parse_dates([None, None]), [1, 130], 120
+        )
+        np.testing.assert_array_equal(scores, [0, 0])
+
+
+class TestParseDates(unittest.TestCase):
+    """Test cases for bulk date parsing"""
+
+    def test_utc_and_offsets(self):
+        """Test that UTC, offset and date-only values parse to UTC milliseconds"""
+        dates = parse_dates(
+            ["2024-03-20T10:00:00.123Z", "2024-03-20T12:00:00+02:00", "2024-03-20"]
+        )
+        np.testing.assert_array_equal(
+            dates,
+            np.array(
+                ["2024-03-20T10:00:00.123", "2024-03-20T10:00:00", "2024-03-20"],
+                dtype="datetime64[ms]",
+            ),
+        )
+
+    def test_missing_and_invalid(self):
+        """Test that missing and unparseable values become NaT"""
+        dates = parse_dates([None, "not a date", 5, "2024-03-20T10:00:00Z"])
+        np.testing.assert_array_equal(np.isnat(dates), [True, True, True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
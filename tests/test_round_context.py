@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone per-round state.
+Tests RoundContext snapshots, score updates of replaced hotkeys and the run loop hooks.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.base.utils.timing import PhaseTimings
+from oneoneone.base.validator import BaseValidatorNeuron
+from oneoneone.validator.round_context import RoundContext
+
+
+def make_metagraph(hotkeys):
+    return SimpleNamespace(
+        hotkeys=list(hotkeys),
+        axons=[SimpleNamespace(hotkey=hotkey) for hotkey in hotkeys],
+    )
+
+
+class TestRoundContext(unittest.TestCase):
+    """Test cases for RoundContext"""
+
+    def test_snapshot_of_selected_miners(self):
+        """Test that hotkeys and axons are captured at selection time"""
+        metagraph = make_metagraph(["hk0", "hk1", "hk2"])
+        context = RoundContext.from_metagraph(7, metagraph, [2, 0], budget=60)
+        metagraph.hotkeys[2] = "replaced"
+
+        self.assertEqual(context.step, 7)
+        self.assertEqual(context.miner_uids, [2, 0])
+        self.assertEqual(context.hotkeys, ["hk2", "hk0"])
+        self.assertEqual([axon.hotkey for axon in context.axons], ["hk2", "hk0"])
+
+    def test_remaining_never_negative(self):
+        """Test the seconds left until the deadline, minus a reserve"""
+        context = RoundContext(0, [], [], [], deadline=time.monotonic() + 10)
+
+        self.assertAlmostEqual(context.remaining(), 10, delta=0.5)
+        self.assertAlmostEqual(context.remaining(reserve=4), 6, delta=0.5)
+        self.assertEqual(context.remaining(reserve=20), 0)
+
+    def test_task_and_response_times(self):
+        """Test the task accessors and the recorded response times"""
+        context = RoundContext(0, [3, 1, 2], ["a", "b", "c"], [], deadline=0)
+        self.assertIsNone(context.fid)
+        self.assertEqual(context.synapse_params, {})
+
+        context.task = {"dataId": "fid", "synapse_params": {"timeout": 120}}
+        context.record_response(2, 1.5)
+        context.record_response(3, 0.5)
+
+        self.assertEqual(context.fid, "fid")
+        self.assertEqual(context.synapse_params, {"timeout": 120})
+        self.assertEqual(context.response_times, {2: 1.5, 3: 0.5})
+
+
+class TestUpdateScores(unittest.TestCase):
+    """Test cases for BaseValidatorNeuron.update_scores"""
+
+    def setUp(self):
+        self.validator = SimpleNamespace(
+            lock=threading.Lock(),
+            hotkeys=["hk0", "hk1", "hk2", "hk3"],
+            scores=np.zeros(4, dtype=np.float32),
+            config=SimpleNamespace(neuron=SimpleNamespace(moving_average_alpha=0.5)),
+            timings=PhaseTimings(window=10),
+        )
+
+    def update_scores(self, rewards, uids, hotkeys=None):
+        BaseValidatorNeuron.update_scores(
+            self.validator, np.array(rewards), uids, hotkeys
+        )
+        return self.validator.scores.tolist()
+
+    def test_moving_average(self):
+        """Test that rewarded UIDs move towards their reward and the rest decay"""
+        self.validator.scores[3] = 1.0
+        scores = self.update_scores([1.0, 0.5], [0, 2], ["hk0", "hk2"])
+
+        self.assertEqual(scores, [0.5, 0.0, 0.25, 0.5])
+
+    def test_replaced_hotkeys_skipped(self):
+        """Test that UIDs whose hotkey changed during the round are not rewarded"""
+        self.validator.hotkeys[1] = "new-owner"
+        scores = self.update_scores([1.0, 1.0], [0, 1], ["hk0", "hk1"])
+
+        self.assertEqual(scores, [0.5, 0.0, 0.0, 0.0])
+
+    def test_deregistered_uids_skipped(self):
+        """Test that UIDs beyond the current metagraph are not rewarded"""
+        self.validator.hotkeys = self.validator.hotkeys[:2]
+        scores = self.update_scores([1.0, 1.0], [0, 3], ["hk0", "hk3"])
+
+        self.assertEqual(scores, [0.5, 0.0, 0.0, 0.0])
+
+
+class TestRunLoop(unittest.TestCase):
+    """Test cases for the startup and shutdown hooks of BaseValidatorNeuron.run"""
+
+    def make_validator(self, scheduler_run):
+        events = []
+
+        async def startup():
+            events.append("startup")
+
+        async def shutdown():
+            events.append("shutdown")
+
+        validator = SimpleNamespace(
+            sync=lambda: None,
+            block=1,
+            loop=asyncio.new_event_loop(),
+            should_exit=False,
+            startup=startup,
+            shutdown=shutdown,
+            axon=SimpleNamespace(stop=lambda: events.append("axon.stop")),
+        )
+        validator.scheduler = SimpleNamespace(run=lambda: scheduler_run(validator, events))
+        self.addCleanup(validator.loop.close)
+        return validator, events
+
+    def test_hooks_around_the_scheduler(self):
+        """Test that startup runs before the first round and shutdown once the loop exits"""
+
+        async def scheduler_run(validator, events):
+            events.append("rounds")
+            validator.should_exit = True
+
+        validator, events = self.make_validator(scheduler_run)
+        BaseValidatorNeuron.run(validator)
+
+        self.assertEqual(events, ["startup", "rounds", "shutdown"])
+
+    def test_shutdown_on_keyboard_interrupt(self):
+        """Test that shutdown also runs when the validator is killed"""
+
+        async def scheduler_run(validator, events):
+            raise KeyboardInterrupt
+
+        validator, events = self.make_validator(scheduler_run)
+        with self.assertRaises(SystemExit):
+            BaseValidatorNeuron.run(validator)
+
+        self.assertEqual(events, ["startup", "axon.stop", "shutdown"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone spot check sampling module.
+Tests the streaming SpotCheckSampler.
+"""
+
+import sys
+import os
+import random
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.sampling import SpotCheckSampler
+
+START = datetime(2024, 3, 1)
+
+
+def sample(dates, count, seed=None):
+    """Stream reviews with the given day offsets (None for no date) and sample them"""
+    sampler = SpotCheckSampler(count, random.Random(seed))
+    for index, day in enumerate(dates):
+        date = None if day is None else START + timedelta(days=day)
+        sampler.add({"reviewId": str(index)}, date)
+    return [review["reviewId"] for review in sampler.sample()]
+
+
+class TestSpotCheckSampler(unittest.TestCase):
+    """Test cases for SpotCheckSampler"""
+
+    def test_newest_first_and_distinct(self):
+        """Test that the newest review leads a sample of distinct reviews"""
+        for seed in range(20):
+            selected = sample([3, 9, 1, 5, 7, 2], 3, seed)
+            self.assertEqual(selected[0], "1")
+            self.assertEqual(len(set(selected)), 3)
+
+    def test_displaced_newest_can_be_sampled(self):
+        """Test that a review displaced as the newest is still a candidate"""
+        self.assertEqual(sample([1, 2], 2), ["1", "0"])
+
+    def test_undated_reviews(self):
+        """Test that undated reviews never displace the newest, the first is kept without dates"""
+        self.assertEqual(sample([None, None, None], 1), ["0"])
+        self.assertEqual(sample([None, 1, None], 1), ["1"])
+
+    def test_naive_and_aware_dates(self):
+        """Test that dates without a timezone are compared as UTC"""
+        sampler = SpotCheckSampler(1)
+        sampler.add({"reviewId": "0"}, START)
+        sampler.add({"reviewId": "1"}, START.replace(hour=2, tzinfo=timezone.utc))
+        sampler.add({"reviewId": "2"}, START.replace(hour=1))
+        sampler.add({"reviewId": "3"}, START.replace(hour=3))
+        self.assertEqual(sampler.sample(), [{"reviewId": "3"}])
+
+    def test_small_and_empty_streams(self):
+        """Test that short streams are sampled entirely and zero counts sample nothing"""
+        self.assertEqual(sorted(sample([1, 2], 5)), ["0", "1"])
+        self.assertEqual(sample([1, 2], 0), [])
+        self.assertEqual(sample([], 3), [])
+
+    def test_seeded_samples_reproducible(self):
+        """Test that the same seed gives the same sample"""
+        dates = list(range(100))
+        self.assertEqual(sample(dates, 4, seed=7), sample(dates, 4, seed=7))
+
+    def test_reservoir_is_uniform(self):
+        """Test that every review but the newest is sampled equally often"""
+        rng = random.Random(0)
+        counts = Counter()
+        rounds = 20000
+        for _ in range(rounds):
+            sampler = SpotCheckSampler(3, rng)
+            # The newest review arrives mid-stream, displacing earlier ones
+            for index, day in enumerate([0, 1, 2, 9, 3, 4, 5, 6, 7, 8]):
+                sampler.add({"reviewId": index}, START + timedelta(days=day))
+            counts.update(review["reviewId"] for review in sampler.sample()[1:])
+
+        self.assertNotIn(3, counts)
+        expected = rounds * 2 / 9
+        for index in [0, 1, 2, 4, 5, 6, 7, 8, 9]:
+            self.assertAlmostEqual(counts[index] / expected, 1, delta=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
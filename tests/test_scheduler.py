@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone round scheduler.
+Tests the cadence, overruns and syncs of RoundScheduler.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import unittest
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.base.utils.scheduler import RoundScheduler
+
+
+class TestRoundScheduler(unittest.TestCase):
+    """Test cases for RoundScheduler"""
+
+    def run_scheduler(self, round_duration, duration, interval=0.1, sync_interval=10):
+        """Run a scheduler for `duration` seconds and return its round and sync events"""
+        events = []
+        active = {"rounds": 0, "max_rounds": 0}
+
+        async def round_fn():
+            events.append(("round", time.monotonic()))
+            active["rounds"] += 1
+            active["max_rounds"] = max(active["max_rounds"], active["rounds"])
+            try:
+                await asyncio.sleep(round_duration)
+            finally:
+                active["rounds"] -= 1
+
+        def sync_fn():
+            events.append(("sync", time.monotonic(), active["rounds"]))
+
+        async def run():
+            end = time.monotonic() + duration
+            scheduler = RoundScheduler(
+                round_fn,
+                sync_fn,
+                interval=interval,
+                sync_interval=sync_interval,
+                should_exit=lambda: time.monotonic() >= end,
+                poll_interval=0.01,
+            )
+            await scheduler.run()
+
+        asyncio.run(run())
+        self.max_rounds = active["max_rounds"]
+        return events
+
+    def test_cadence_anchored_to_round_start(self):
+        """Test that short rounds start once per interval"""
+        events = self.run_scheduler(round_duration=0.02, duration=0.55)
+        starts = [at for kind, at, *_ in events if kind == "round"]
+
+        self.assertEqual(len(starts), 6)
+        for previous, current in zip(starts, starts[1:]):
+            self.assertAlmostEqual(current - previous, 0.1, delta=0.05)
+
+    def test_overrunning_round_skips_slots(self):
+        """Test that a round still running at its next slot is never stacked"""
+        events = self.run_scheduler(round_duration=0.25, duration=0.55)
+        starts = [at for kind, at, *_ in events if kind == "round"]
+
+        self.assertEqual(self.max_rounds, 1)
+        self.assertEqual(len(starts), 2)
+        self.assertAlmostEqual(starts[1] - starts[0], 0.3, delta=0.05)
+
+    def test_sync_runs_between_rounds(self):
+        """Test that syncs run periodically and never while a round is in flight"""
+        events = self.run_scheduler(
+            round_duration=0.05, duration=0.55, sync_interval=0.12
+        )
+        syncs = [event for event in events if event[0] == "sync"]
+
+        self.assertGreaterEqual(len(syncs), 2)
+        self.assertTrue(all(rounds == 0 for _, _, rounds in syncs))
+
+    def test_round_failures_do_not_stop_the_scheduler(self):
+        """Test that a failing round is logged and the next one still starts"""
+        calls = []
+
+        async def round_fn():
+            calls.append(time.monotonic())
+            raise RuntimeError("round failed")
+
+        async def run():
+            end = time.monotonic() + 0.25
+            await RoundScheduler(
+                round_fn,
+                lambda: None,
+                interval=0.1,
+                sync_interval=10,
+                should_exit=lambda: time.monotonic() >= end,
+                poll_interval=0.01,
+            ).run()
+
+        asyncio.run(run())
+        self.assertEqual(len(calls), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone scoring session module.
+Tests that only pre-validated responses are submitted to the Node.js API.
+"""
+
+import sys
+import os
+import asyncio
+import time
+import tempfile
+import unittest
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.decode import summarize_response
+from oneoneone.validator.review_cache import VerifiedReviewCache
+from oneoneone.validator.scoring_session import ScoringSession
+from tests.helpers import FID, make_review
+
+
+class RecordingClient:
+    """Validator API client that records requests instead of sending them"""
+
+    def __init__(self, failed=(), submit_delay=0):
+        self.requests = []
+        self.timeouts = {}
+        self.failed = set(failed)
+        self.submit_delay = submit_delay
+
+    async def post(self, path, payload=None, timeout=None):
+        self.requests.append((path, payload))
+        self.timeouts[path] = timeout
+        if path.endswith("/responses") and self.submit_delay:
+            await asyncio.sleep(self.submit_delay)
+        if path == "/score-session":
+            return {"sessionId": "session"}
+        if path.endswith("/finalize") and payload["verifyOnly"]:
+            return {
+                "status": "success",
+                "verification": [
+                    {
+                        "minerUID": uid,
+                        "passedValidation": uid not in self.failed,
+                        "validationError": (
+                            "Failed spot check verification"
+                            if uid in self.failed
+                            else None
+                        ),
+                    }
+                    for uid in self.requests[0][1]["minerUIDs"]
+                ],
+                "verifiedReviews": [
+                    {"reviewId": "verified", "fid": FID, "text": "Great place"}
+                ],
+            }
+        if path.endswith("/finalize"):
+            count = len(self.requests[0][1]["minerUIDs"])
+            return {
+                "status": "success",
+                "scores": [0.0] * count,
+                "statistics": {"mean": 0.0, "count": count, "min": 0.0, "max": 0.0},
+            }
+        return {"passedValidation": True}
+
+
+class TestScoringSession(unittest.TestCase):
+    """Test cases for ScoringSession"""
+
+    def run_round(
+        self,
+        results,
+        local_scoring=False,
+        failed=(),
+        response_times=None,
+        summary_payloads=False,
+        review_cache=None,
+        content_addressed=False,
+        consensus=False,
+        owners=None,
+    ):
+        """Run a session over (uid, response or error) results and return the requests"""
+        client = RecordingClient(failed)
+        response_times = response_times or {}
+
+        async def run():
+            session = ScoringSession(
+                client,
+                FID,
+                [uid for uid, _ in results],
+                local_scoring=local_scoring,
+                summary_payloads=summary_payloads,
+                review_cache=review_cache,
+                content_addressed=content_addressed,
+                consensus=consensus,
+                consensus_quorum=2,
+                owners=owners,
+            )
+            self.session = session
+            await session.start()
+            for uid, result in results:
+                if isinstance(result, str):
+                    session.settle(uid, result)
+                else:
+                    summary = summarize_response(FID, result)
+                    session.submit(uid, summary, response_times.get(uid, 1.0))
+            return await session.finalize(timeout=5)
+
+        self.rewards = asyncio.run(run())
+        self.assertEqual(len(self.rewards), len(results))
+        return client.requests
+
+    def test_only_valid_responses_are_submitted(self):
+        """Test that only deduplicated, structurally valid responses go over HTTP"""
+        requests = self.run_round(
+            [
+                (1, [make_review("a"), make_review("a"), make_review("b")]),
+                (2, [make_review("a", fid="0x0:0x0")]),
+                (3, []),
+                (4, "timeout"),
+            ]
+        )
+
+        submissions = [payload for path, payload in requests if path.endswith("/responses")]
+        self.assertEqual([payload["minerUID"] for payload in submissions], [1])
+        self.assertEqual(
+            [review["reviewId"] for review in submissions[0]["response"]], ["a", "b"]
+        )
+
+    def test_spot_check_count_sent_with_responses(self):
+        """Test that the per-miner spot check count goes along with full responses"""
+        requests = self.run_round([(1, [make_review("a")])])
+
+        submissions = [payload for path, payload in requests if path.endswith("/responses")]
+        self.assertEqual(submissions[0]["spotCheckCount"], 3)
+
+    def test_verification_outcomes(self):
+        """Test that only spot check outcomes of submitted miners are kept"""
+        self.run_round(
+            [(1, [make_review("a")]), (2, [make_review("b")]), (3, "timeout")],
+            local_scoring=True,
+            failed={2, 3},
+        )
+
+        self.assertEqual(self.session.verification, {1: True, 2: False})
+
+    def test_reference_fetch_requested_on_start(self):
+        """Test that the session asks for a reference snapshot when it starts"""
+        requests = self.run_round([(1, [make_review("a")])])
+
+        path, payload = requests[0]
+        self.assertEqual(path, "/score-session")
+        self.assertTrue(payload["referenceFetch"])
+
+    def test_summary_payloads(self):
+        """Test that only the summary and sampled spot check reviews are submitted"""
+        reviews = [make_review(str(index)) for index in range(50)]
+        requests = self.run_round([(1, reviews), (2, [])], summary_payloads=True)
+
+        submissions = [payload for path, payload in requests if path.endswith("/responses")]
+        self.assertEqual(len(submissions), 1)
+        self.assertNotIn("response", submissions[0])
+        self.assertEqual(submissions[0]["summary"]["count"], 50)
+        self.assertEqual(len(submissions[0]["summary"]["spotCheckReviews"]), 3)
+
+    def test_verified_review_cache(self):
+        """Test that cached reviews are sent along, new verifications cached and expired ones pruned"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = VerifiedReviewCache(os.path.join(directory, "verified_reviews.db"))
+            cache.put([{"reviewId": "a", "fid": FID, "text": "cached"}])
+            cache.put([{"reviewId": "expired", "fid": FID}])
+            cache._db.execute(
+                "UPDATE verified_reviews SET verified_at = ? WHERE review_id = 'expired'",
+                (time.time() - cache.ttl - 1,),
+            )
+
+            requests = self.run_round(
+                [(1, [make_review("a"), make_review("b")]), (2, [make_review("b")])],
+                local_scoring=True,
+                review_cache=cache,
+            )
+
+            submissions = [payload for path, payload in requests if path.endswith("/responses")]
+            self.assertEqual(
+                submissions[0]["verifiedReviews"],
+                [{"reviewId": "a", "fid": FID, "text": "cached"}],
+            )
+            self.assertNotIn("verifiedReviews", submissions[1])
+            self.assertEqual(len(cache.get(FID, ["verified"])), 1)
+            self.assertEqual(cache.prune(), 0)
+            cache.close()
+
+    def test_consensus_reviews_sent_as_verified(self):
+        """Test that reviews the quorum of owners agrees on skip external spot checks"""
+        agreed = make_review("a", lastEditedAtDate="2024-03-02T10:00:00.000Z")
+        requests = self.run_round(
+            [(1, [agreed]), (2, [agreed]), (3, [agreed]), (4, [agreed])],
+            consensus=True,
+            owners={1: "coldkey-1", 2: "coldkey-1", 3: "coldkey-2", 4: "coldkey-3"},
+        )
+
+        submissions = [payload for path, payload in requests if path.endswith("/responses")]
+        self.assertEqual(
+            [len(payload.get("verifiedReviews", [])) for payload in submissions],
+            [0, 0, 1, 1],
+        )
+        self.assertEqual(
+            submissions[2]["verifiedReviews"][0]["publishedAtDate"],
+            "2024-03-02T10:00:00.000Z",
+        )
+
+    def test_content_addressed_reviews_sent_once(self):
+        """Test that reviews shared by miners are sent once and referenced by hash"""
+        shared = [make_review("a"), make_review("b")]
+        requests = self.run_round(
+            [(1, shared), (2, shared + [make_review("c")])], content_addressed=True
+        )
+
+        first, second = [
+            payload for path, payload in requests if path.endswith("/responses")
+        ]
+        self.assertEqual(len(first["reviews"]), 2)
+        self.assertEqual(first["response"], second["response"][:2])
+        self.assertEqual(list(second["reviews"]), [second["response"][2]])
+        self.assertEqual(second["reviews"][second["response"][2]]["reviewId"], "c")
+
+    def test_settled_reasons_sent_on_finalize(self):
+        """Test that locally settled miners keep their failure reasons"""
+        requests = self.run_round([(1, [make_review("a")]), (2, None), (3, "timeout")])
+
+        path, payload = requests[-1]
+        self.assertTrue(path.endswith("/finalize"))
+        self.assertEqual(
+            payload["settled"], {"2": "Response is not an array", "3": "timeout"}
+        )
+
+    def test_local_scoring(self):
+        """Test that verify-only finalization is scored in the validator"""
+        requests = self.run_round(
+            [
+                (1, [make_review("a"), make_review("b")]),
+                (2, [make_review("a", publishedAtDate="2024-02-01T10:00:00.000Z")]),
+                (3, [make_review("a")]),
+                (4, "timeout"),
+            ],
+            local_scoring=True,
+            failed={3},
+            response_times={1: 1.0, 2: 2.0, 3: 3.0},
+        )
+
+        self.assertTrue(requests[-1][1]["verifyOnly"])
+        # Miner 2: speed 1/2, volume 1/2, oldest of the dated miners
+        self.assertEqual(self.rewards.tolist(), [1.0, 0.4, 0.0, 0.0])
+
+    def test_pending_submissions_cancelled_at_deadline(self):
+        """Test that finalization cancels stalled submissions and keeps to its deadline"""
+        client = RecordingClient(submit_delay=10)
+
+        async def run():
+            session = ScoringSession(client, FID, [1])
+            await session.start()
+            submission = session.submit(
+                1, summarize_response(FID, [make_review("a")]), 1.0
+            )
+            await session.finalize(timeout=0.2)
+            return submission
+
+        submission = asyncio.run(run())
+        self.assertTrue(submission.cancelled())
+        self.assertLess(client.timeouts["/score-session/session/finalize"], 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
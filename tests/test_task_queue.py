@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone synthetic task queue.
+Tests prefetching, staleness and retries of SyntheticTaskQueue.
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.task_queue import SyntheticTaskQueue
+
+
+class TaskFactory:
+    """Creates numbered synthetic tasks, failing the calls listed in `failures`"""
+
+    def __init__(self, failures=()):
+        self.calls = 0
+        self.failures = set(failures)
+
+    async def __call__(self):
+        self.calls += 1
+        if self.calls in self.failures:
+            raise RuntimeError("place discovery failed")
+        return {"dataId": f"fid-{self.calls}", "synapse_params": {}}
+
+
+class TestSyntheticTaskQueue(unittest.TestCase):
+    """Test cases for SyntheticTaskQueue"""
+
+    def test_prefetches_up_to_maxsize(self):
+        """Test that the producer fills the queue ahead of time and blocks when full"""
+        factory = TaskFactory()
+
+        async def run():
+            queue = SyntheticTaskQueue(factory, maxsize=2, max_age=60, retry_delay=0)
+            queue.start()
+            await asyncio.sleep(0.01)
+            ready = queue.qsize()
+            task = await queue.get()
+            await queue.stop()
+            return ready, task
+
+        ready, task = asyncio.run(run())
+        self.assertEqual(ready, 2)
+        self.assertEqual(task["dataId"], "fid-1")
+        # Two queued tasks plus one waiting to be put
+        self.assertLessEqual(factory.calls, 4)
+
+    def test_stale_tasks_discarded(self):
+        """Test that tasks older than max_age are never handed to a round"""
+        factory = TaskFactory()
+
+        async def run():
+            queue = SyntheticTaskQueue(factory, maxsize=1, max_age=0.05, retry_delay=0)
+            queue.start()
+            await asyncio.sleep(0.1)
+            task = await queue.get()
+            await queue.stop()
+            return task
+
+        self.assertNotEqual(asyncio.run(run())["dataId"], "fid-1")
+
+    def test_failed_creation_retried(self):
+        """Test that the producer keeps running after a failed task creation"""
+        factory = TaskFactory(failures={1})
+
+        async def run():
+            queue = SyntheticTaskQueue(factory, maxsize=1, max_age=60, retry_delay=0)
+            task = await asyncio.wait_for(queue.get(), timeout=1)
+            await queue.stop()
+            return task
+
+        self.assertEqual(asyncio.run(run())["dataId"], "fid-2")
+
+
+if __name__ == "__main__":
+    unittest.main()
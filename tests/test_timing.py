@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone phase timings.
+Tests the rolling window, summaries and HTTP tracing of PhaseTimings.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import unittest
+
+import aiohttp
+from aiohttp import web
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.base.utils.timing import PhaseTimings, timed
+
+
+class TestPhaseTimings(unittest.TestCase):
+    """Test cases for PhaseTimings"""
+
+    def setUp(self):
+        self.timings = PhaseTimings(window=3)
+
+    def test_rolling_window(self):
+        """Test that each phase keeps only its last `window` samples"""
+        for duration in (1, 2, 3, 4):
+            self.timings.record("round.select", duration)
+        self.timings.record("round.task", 5)
+
+        self.assertEqual(self.timings.phases(), ["round.select", "round.task"])
+        self.assertEqual(
+            [sample["duration"] for sample in self.timings.samples("round.select")],
+            [2, 3, 4],
+        )
+
+    def test_measure_records_on_error(self):
+        """Test that measured blocks are recorded with late fields even if they raise"""
+        with self.timings.measure("api.encode", path="/score") as fields:
+            fields["bytes_sent"] = 10
+        with self.assertRaises(ValueError):
+            with self.timings.measure("api.encode", path="/other"):
+                raise ValueError("failed")
+
+        samples = self.timings.samples("api.encode")
+        self.assertEqual(len(samples), 2)
+        self.assertEqual(samples[0]["bytes_sent"], 10)
+        self.assertEqual(self.timings.last("api.encode", path="/score"), samples[0])
+        self.assertIsNone(self.timings.last("api.encode", path="/missing"))
+
+    def test_summary(self):
+        """Test the per phase statistics and byte totals, optionally since a point in time"""
+        self.timings.record("dendrite.ttfb", 1.0, bytes_sent=100)
+        since = time.monotonic()
+        self.timings.record("dendrite.ttfb", 2.0, bytes_sent=50)
+        self.timings.record("dendrite.ttfb", 3.0)
+
+        stats = self.timings.summary("dendrite.ttfb")["dendrite.ttfb"]
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["mean"], 2.0)
+        self.assertEqual(stats["max"], 3.0)
+        self.assertEqual(stats["bytes_sent"], 150)
+        self.assertEqual(self.timings.summary(since=since)["dendrite.ttfb"]["count"], 2)
+        self.assertIn("dendrite.ttfb: n=3", self.timings.format_summary())
+
+    def test_timed_methods(self):
+        """Test that decorated plain and async methods are recorded"""
+
+        class Neuron:
+            def __init__(self, timings):
+                self.timings = timings
+
+            @timed("sync")
+            def sync(self):
+                return "synced"
+
+            @timed("round")
+            async def round(self):
+                return "done"
+
+        neuron = Neuron(self.timings)
+        self.assertEqual(neuron.sync(), "synced")
+        self.assertEqual(asyncio.run(neuron.round()), "done")
+        self.assertEqual(self.timings.phases(), ["round", "sync"])
+
+    def test_trace_config_records_http_phases(self):
+        """Test that traced requests record connect, ttfb and transfer phases"""
+
+        async def handle(request):
+            await request.read()
+            return web.Response(body=b"x" * 64)
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/", handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            async with aiohttp.ClientSession(
+                trace_configs=[self.timings.trace_config("api")]
+            ) as session:
+                for _ in range(2):
+                    async with session.post(
+                        f"http://127.0.0.1:{port}/", data=b"y" * 32
+                    ) as response:
+                        await response.read()
+            await runner.cleanup()
+            return port
+
+        port = asyncio.run(run())
+        summary = self.timings.summary()
+        self.assertEqual(summary["api.connect"]["count"], 1)
+        self.assertEqual(summary["api.ttfb"]["count"], 2)
+        self.assertEqual(summary["api.ttfb"]["bytes_sent"], 64)
+        self.assertEqual(summary["api.transfer"]["bytes_received"], 128)
+        self.assertEqual(self.timings.last("api.ttfb")["host"], f"127.0.0.1:{port}")
+
+
+if __name__ == "__main__":
+    unittest.main()
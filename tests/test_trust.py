@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone miner trust module.
+Tests the TrustTracker spot check counts and persistence.
+"""
+
+import sys
+import os
+import random
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.validator.trust import TrustTracker
+
+
+class TestTrustTracker(unittest.TestCase):
+    """Test cases for TrustTracker"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = TrustTracker(
+            count=3,
+            min_count=1,
+            max_count=6,
+            new_rounds=2,
+            streak=4,
+            min_age=0,
+            recovery_rounds=3,
+            audit_rate=0,
+        )
+
+    def record(self, hotkey, outcomes):
+        """Record a sequence of pass/fail outcomes for a hotkey"""
+        self.tracker.record_round((hotkey, passed) for passed in outcomes)
+
+    def test_new_hotkeys_get_most_checks(self):
+        """Test that hotkeys with too few verified rounds are checked the most"""
+        self.assertEqual(self.tracker.spot_check_count("new"), 6)
+        self.record("new", [True])
+        self.assertEqual(self.tracker.spot_check_count("new"), 6)
+        self.record("new", [True])
+        self.assertEqual(self.tracker.spot_check_count("new"), 3)
+
+    def test_passing_streak_earns_fewest_checks(self):
+        """Test that a long passing streak lowers the spot check count"""
+        self.record("honest", [True] * 4)
+        self.assertEqual(self.tracker.spot_check_count("honest"), 1)
+
+    def test_failure_raises_checks_until_recovered(self):
+        """Test that a failure brings back the most checks for the recovery rounds"""
+        self.record("miner", [True] * 6 + [False])
+        self.assertEqual(self.tracker.spot_check_count("miner"), 6)
+
+        self.record("miner", [True] * 3)
+        self.assertEqual(self.tracker.spot_check_count("miner"), 3)
+        self.record("miner", [True])
+        self.assertEqual(self.tracker.spot_check_count("miner"), 1)
+        self.assertEqual(self.tracker.get("miner").failures, 1)
+
+    def test_minimum_age_and_audits(self):
+        """Test that young hotkeys are not trusted and trusted ones are audited"""
+        young = TrustTracker(new_rounds=0, streak=1, min_age=3600)
+        young.record("miner", True)
+        self.assertEqual(young.spot_check_count("miner"), young.count)
+
+        audited = TrustTracker(
+            new_rounds=0, streak=1, min_age=0, audit_rate=0.5, rng=random.Random(0)
+        )
+        audited.record("miner", True)
+        counts = {audited.spot_check_count("miner") for _ in range(50)}
+        self.assertEqual(counts, {audited.min_count, audited.count})
+
+    def test_records_persisted(self):
+        """Test that trust records survive a restart"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trust.json")
+            tracker = TrustTracker(path)
+            tracker.load()
+            tracker.record_round([("a", True), ("a", False), ("b", True)])
+            tracker.save()
+
+            restored = TrustTracker(path)
+            restored.load()
+            self.assertEqual(restored.get("a").failures, 1)
+            self.assertEqual(restored.get("a").streak, 0)
+            self.assertEqual(restored.get("b").passed, 1)
+            self.assertEqual(
+                restored.get("a").first_seen, tracker.get("a").first_seen
+            )
+
+    def test_concurrent_saves(self):
+        """Test that saves from worker threads of overlapping rounds never clash"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trust.json")
+            tracker = TrustTracker(path)
+            tracker.record_round([("a", True), ("b", False)])
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for future in [executor.submit(tracker.save) for _ in range(32)]:
+                    future.result()
+
+            restored = TrustTracker(path)
+            restored.load()
+            self.assertEqual(restored.get("a").passed, 1)
+            self.assertEqual(restored.get("b").failures, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
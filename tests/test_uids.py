@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the oneoneone miner selection module.
+Tests UID availability, random sampling and the CoverageScheduler round-robin selection.
+"""
+
+import sys
+import os
+import math
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the parent directory to the path so we can import oneoneone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from oneoneone.utils.uids import (
+    CoverageScheduler,
+    check_uid_availability,
+    get_available_uid_mask,
+    get_available_uids,
+    get_random_uids,
+)
+
+
+class TestUidAvailability(unittest.TestCase):
+    """Test cases for vectorized UID availability and sampling"""
+
+    def setUp(self):
+        """Set up a fake metagraph with a mix of serving, permitted and staked uids"""
+        rng = np.random.default_rng(0)
+        n = 64
+        self.metagraph = SimpleNamespace(
+            n=np.array(n),
+            block=np.array(100),
+            axons=[SimpleNamespace(is_serving=bool(serving)) for serving in rng.random(n) > 0.2],
+            validator_permit=rng.random(n) > 0.7,
+            S=rng.random(n) * 8192,
+        )
+        self.neuron = SimpleNamespace(
+            metagraph=self.metagraph,
+            config=SimpleNamespace(neuron=SimpleNamespace(vpermit_tao_limit=4096)),
+        )
+
+    def test_mask_matches_per_uid_check(self):
+        """Test that the mask agrees with check_uid_availability for every uid"""
+        expected = [
+            uid
+            for uid in range(64)
+            if check_uid_availability(self.metagraph, uid, 4096)
+        ]
+        self.assertEqual(get_available_uids(self.neuron), expected)
+
+    def test_mask_cached_until_block_changes(self):
+        """Test that the mask is reused within a block and recomputed after it"""
+        mask = get_available_uid_mask(self.neuron)
+        self.metagraph.axons[0] = SimpleNamespace(is_serving=not mask[0])
+        self.assertIs(get_available_uid_mask(self.neuron), mask)
+
+        self.metagraph.block = np.array(101)
+        self.assertNotEqual(get_available_uid_mask(self.neuron)[0], mask[0])
+
+    def test_random_uids_respect_exclude(self):
+        """Test that sampled uids are available, unique and not excluded"""
+        available = get_available_uids(self.neuron)
+        exclude = available[:5]
+
+        uids = get_random_uids(self.neuron, k=10, exclude=exclude)
+        self.assertEqual(len(set(uids.tolist())), 10)
+        self.assertTrue(set(uids.tolist()) <= set(available) - set(exclude))
+
+    def test_random_uids_fall_back_to_excluded(self):
+        """Test that excluded uids fill up the sample when too few candidates remain"""
+        available = get_available_uids(self.neuron)
+
+        uids = get_random_uids(self.neuron, k=len(available) + 10, exclude=available[1:])
+        self.assertEqual(sorted(uids.tolist()), available)
+
+
+class TestCoverageScheduler(unittest.TestCase):
+    """Test cases for CoverageScheduler"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.available_uids = list(range(23))
+        self.scheduler = CoverageScheduler(seed=42)
+
+    def test_every_uid_selected_within_cycle(self):
+        """Test that every available uid is selected within ceil(n / k) rounds"""
+        k = 5
+        rounds = math.ceil(len(self.available_uids) / k)
+        selected = set()
+
+        for _ in range(rounds):
+            uids = self.scheduler.select(self.available_uids, k)
+            selected.update(uids.tolist())
+            self.scheduler.release(uids)
+
+        self.assertEqual(selected, set(self.available_uids))
+
+    def test_selection_has_no_duplicates(self):
+        """Test that a single selection never repeats a uid across cycle boundaries"""
+        for _ in range(20):
+            uids = self.scheduler.select(self.available_uids, 7)
+            self.assertEqual(len(uids), len(set(uids.tolist())))
+            self.scheduler.release(uids)
+
+    def test_concurrent_selections_are_disjoint(self):
+        """Test that unreleased selections never overlap"""
+        first = self.scheduler.select(self.available_uids, 10)
+        second = self.scheduler.select(self.available_uids, 10)
+        third = self.scheduler.select(self.available_uids, 10)
+
+        self.assertFalse(set(first.tolist()) & set(second.tolist()))
+        self.assertFalse(set(third.tolist()) & (set(first.tolist()) | set(second.tolist())))
+        self.assertEqual(len(third), 3)
+
+    def test_release_makes_uids_selectable(self):
+        """Test that released uids can be selected again"""
+        uids = self.scheduler.select(self.available_uids, len(self.available_uids))
+        self.assertEqual(len(self.scheduler.select(self.available_uids, 5)), 0)
+
+        self.scheduler.release(uids)
+        self.assertEqual(len(self.scheduler.select(self.available_uids, 5)), 5)
+
+    def test_requeued_uids_selected_first(self):
+        """Test that uids a round never queried keep their turn in the cycle"""
+        first = self.scheduler.select(self.available_uids, 20).tolist()
+        self.scheduler.requeue(first[15:])
+        self.scheduler.release(first)
+
+        second = self.scheduler.select(self.available_uids, 8).tolist()
+        self.assertEqual(second[:5], first[15:])
+        self.assertEqual(len(set(first) | set(second)), 23)
+
+    def test_requeue_after_a_new_cycle_started(self):
+        """Test that requeued uids are not selected twice in a cycle started while they were held"""
+        first = self.scheduler.select(self.available_uids, 20).tolist()
+        self.scheduler.release(self.scheduler.select(self.available_uids, 3))
+        self.scheduler.release(self.scheduler.select(self.available_uids, 3))
+        self.assertEqual(self.scheduler.cycle, 2)
+
+        self.scheduler.requeue(first[15:])
+        self.scheduler.release(first)
+        second = self.scheduler.select(self.available_uids, 20).tolist()
+
+        self.assertEqual(second[:5], first[15:])
+        self.assertEqual(sorted(second), sorted(first))
+        self.assertEqual(self.scheduler.cycle, 2)
+
+    def test_unavailable_uids_are_skipped(self):
+        """Test that uids that became unavailable are not selected"""
+        self.scheduler.select(self.available_uids, 1)
+        available = self.available_uids[:10]
+
+        uids = self.scheduler.select(available, 20)
+        self.assertTrue(set(uids.tolist()) <= set(available))
+
+    def test_k_larger_than_available(self):
+        """Test that k is capped at the number of available uids"""
+        uids = self.scheduler.select(self.available_uids, 100)
+        self.assertEqual(sorted(uids.tolist()), self.available_uids)
+
+
+if __name__ == "__main__":
+    unittest.main()